@@ -15,9 +15,13 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from fastapi import HTTPException
+import math
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import JSONResponse
 
 from hugegraph_llm.api.models.rag_response import RAGResponse
+from hugegraph_llm.flows.pipeline_pool import SchedulerBusyError
 
 
 class ExternalException(HTTPException):
@@ -36,3 +40,12 @@ def generate_response(response: RAGResponse) -> dict:
     if not 200 <= response.status_code < 300:
         raise ConnectionFailedException(response.status_code, response.message)
     return {"message": "Connection successful. Configured finished."}
+
+
+def scheduler_busy_handler(_request: Request, exc: SchedulerBusyError) -> JSONResponse:
+    # back-pressure: the flow's pipelines stayed busy for the whole acquire timeout
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, math.ceil(exc.timeout)))},
+    )
@@ -23,6 +23,7 @@ from hugegraph_llm.api.models.graph_extract_requests import GraphExtractRequest
 from hugegraph_llm.api.models.graph_extract_responses import GraphExtractResponse
 from hugegraph_llm.config import prompt
 from hugegraph_llm.flows import FlowName
+from hugegraph_llm.flows.pipeline_pool import SchedulerBusyError
 from hugegraph_llm.flows.scheduler import SchedulerSingleton
 from hugegraph_llm.utils.log import log
 
@@ -53,7 +54,7 @@ class GraphExtractService:
                     "text_count": len(req.texts),
                 }
             return GraphExtractResponse(result=result, warnings=warnings, meta=meta)
-        except HTTPException:
+        except (HTTPException, SchedulerBusyError):
             raise
         except Exception as e:
             log.error("Error in graph_extract_api: %s", e)
@@ -59,6 +59,8 @@ class RAGRequest(BaseModel):
                                    extracted from the query, by default only the most similar one is returned.",
     )
     client_config: Optional[GraphConfigRequest] = Query(None, description="hugegraph server config.")
+    request_id: Optional[str] = Query(None, description="Id of the request trace, generated when empty.")
+    trace: bool = Query(False, description="Return the per-node timing trace of the request.")
 
     # Keep prompt params in the end
     answer_prompt: Optional[str] = Query(prompt.answer_prompt, description="Prompt to guide the answer generation.")
@@ -92,6 +94,8 @@ class GraphRAGRequest(BaseModel):
 
     client_config: Optional[GraphConfigRequest] = Query(None, description="hugegraph server config.")
     get_vertex_only: bool = Query(False, description="return only keywords & vertex (early stop).")
+    request_id: Optional[str] = Query(None, description="Id of the request trace, generated when empty.")
+    trace: bool = Query(False, description="Return the per-node timing trace of the request.")
 
     gremlin_tmpl_num: int = Query(
         1,
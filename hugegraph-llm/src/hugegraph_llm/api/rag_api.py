@@ -16,7 +16,7 @@
 # under the License.
 
 import json
-from contextlib import contextmanager
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, HTTPException, status
 
@@ -30,16 +30,19 @@ from hugegraph_llm.api.models.rag_requests import (
     RerankerConfigRequest,
 )
 from hugegraph_llm.api.models.rag_response import RAGResponse
-from hugegraph_llm.config import huge_settings, llm_settings, prompt
+from hugegraph_llm.config import llm_settings, prompt
+from hugegraph_llm.flows.pipeline_pool import SchedulerBusyError
 from hugegraph_llm.utils.graph_index_utils import get_vertex_details
+from hugegraph_llm.utils.hugegraph_utils import get_hg_client, graph_connection
 from hugegraph_llm.utils.log import log
+from hugegraph_llm.utils.tracing import request_trace
 
 _GRAPH_CONFIG_FIELD_MAP = {
-    "url": "graph_url",
-    "graph": "graph_name",
-    "user": "graph_user",
-    "pwd": "graph_pwd",
-    "gs": "graph_space",
+    "url": "url",
+    "graph": "graph",
+    "user": "user",
+    "pwd": "pwd",
+    "gs": "graphspace",
 }
 _LLM_TYPE_FIELDS = ("chat_llm_type", "extract_llm_type", "text2gql_llm_type")
 _LLM_CONFIG_FIELDS = _LLM_TYPE_FIELDS + (
@@ -117,32 +120,29 @@ def rag_http_api(
     apply_reranker_conf,
     gremlin_generate_selective_func,
 ):
-    @contextmanager
-    def request_graph_config(req):
-        # FIXME: per-request graph overrides still mutate process-global huge_settings.
-        # A global lock would serialize long RAG/Text2Gremlin requests, so the real
-        # fix is passing graph config through request-scoped flow/operator context.
-        original_values = _snapshot_settings(huge_settings, _GRAPH_CONFIG_FIELD_MAP.values())
-        try:
-            client_config = getattr(req, "client_config", None)
-            if client_config is not None:
-                for request_field, settings_field in _GRAPH_CONFIG_FIELD_MAP.items():
-                    if request_field in client_config.model_fields_set:
-                        setattr(huge_settings, settings_field, getattr(client_config, request_field))
-            yield
-        finally:
-            _restore_settings(huge_settings, original_values)
+    def request_graph_config(req) -> Optional[Dict[str, Any]]:
+        # The graph of a request is passed down as WkFlowInput.graph_client_config instead of
+        # overriding the process-global huge_settings, so requests on other graphs run concurrently.
+        client_config = getattr(req, "client_config", None)
+        if client_config is None:
+            return None
+        connection = graph_connection()
+        for request_field, connection_field in _GRAPH_CONFIG_FIELD_MAP.items():
+            if request_field in client_config.model_fields_set:
+                connection[connection_field] = getattr(client_config, request_field)
+        return connection
 
     @router.post("/rag", status_code=status.HTTP_200_OK)
     def rag_answer_api(req: RAGRequest):
-        with request_graph_config(req):
-            # Basic parameter validation: empty query => 400
-            if not req.query or not str(req.query).strip():
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Query must not be empty.",
-                )
+        graph_client_config = request_graph_config(req)
+        # Basic parameter validation: empty query => 400
+        if not req.query or not str(req.query).strip():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Query must not be empty.",
+            )
 
+        with request_trace("rag", req.request_id, force=req.trace) as trace:
             result = rag_answer_func(
                 text=req.query,
                 raw_answer=req.raw_answer,
@@ -162,31 +162,36 @@ def rag_http_api(
                 answer_prompt=req.answer_prompt or prompt.answer_prompt,
                 keywords_extract_prompt=req.keywords_extract_prompt or prompt.keywords_extract_prompt,
                 gremlin_prompt=req.gremlin_prompt or prompt.gremlin_generate_prompt,
+                graph_client_config=graph_client_config,
             )
-            # TODO: we need more info in the response for users to understand the query logic
-            return {
-                "query": req.query,
-                **{
-                    key: value
-                    for key, value in zip(
-                        ["raw_answer", "vector_only", "graph_only", "graph_vector_answer"],
-                        result,
-                    )
-                    if getattr(req, key)
-                },
-            }
+        # TODO: we need more info in the response for users to understand the query logic
+        response = {
+            "query": req.query,
+            **{
+                key: value
+                for key, value in zip(
+                    ["raw_answer", "vector_only", "graph_only", "graph_vector_answer"],
+                    result,
+                )
+                if getattr(req, key)
+            },
+        }
+        if req.trace:
+            response["trace"] = trace.to_json()
+        return response
 
     @router.post("/rag/graph", status_code=status.HTTP_200_OK)
     def graph_rag_recall_api(req: GraphRAGRequest):
         try:
-            with request_graph_config(req):
-                # Basic parameter validation: empty query => 400
-                if not req.query or not str(req.query).strip():
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Query must not be empty.",
-                    )
+            graph_client_config = request_graph_config(req)
+            # Basic parameter validation: empty query => 400
+            if not req.query or not str(req.query).strip():
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Query must not be empty.",
+                )
 
+            with request_trace("rag_graph", req.request_id, force=req.trace) as trace:
                 result = graph_rag_recall_func(
                     query=req.query,
                     max_graph_items=req.max_graph_items,
@@ -199,29 +204,39 @@ def rag_http_api(
                     custom_related_information=req.custom_priority_info,
                     gremlin_prompt=req.gremlin_prompt or prompt.gremlin_generate_prompt,
                     get_vertex_only=req.get_vertex_only,
+                    graph_client_config=graph_client_config,
                 )
 
-                if req.get_vertex_only:
-                    vertex_details = get_vertex_details(result["match_vids"], result)
-                    if vertex_details:
-                        result["match_vids"] = vertex_details
+            if req.get_vertex_only:
+                vertex_details = get_vertex_details(
+                    result["match_vids"], {**result, "graph_client": get_hg_client(graph_client_config)}
+                )
+                if vertex_details:
+                    result["match_vids"] = vertex_details
 
-                if isinstance(result, dict):
-                    params = [
-                        "query",
-                        "keywords",
-                        "match_vids",
-                        "graph_result_flag",
-                        "gremlin",
-                        "graph_result",
-                        "vertex_degree_list",
-                    ]
-                    user_result = {key: result[key] for key in params if key in result}
-                    return {"graph_recall": user_result}
-                return {"graph_recall": json.dumps(result)}
+            if isinstance(result, dict):
+                params = [
+                    "query",
+                    "keywords",
+                    "match_vids",
+                    "graph_result_flag",
+                    "gremlin",
+                    "graph_result",
+                    "vertex_degree_list",
+                ]
+                user_result = {key: result[key] for key in params if key in result}
+                response = {"graph_recall": user_result}
+            else:
+                response = {"graph_recall": json.dumps(result)}
+            if req.trace:
+                response["trace"] = trace.to_json()
+            return response
 
         except HTTPException as e:
             raise e
+        except SchedulerBusyError:
+            # answered with 503 by the app-level handler
+            raise
         except TypeError as e:
             log.error("TypeError in graph_rag_recall_api: %s", e)
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -297,28 +312,32 @@ def rag_http_api(
     @router.post("/text2gremlin", status_code=status.HTTP_200_OK)
     def text2gremlin_api(req: GremlinGenerateRequest):
         try:
-            with request_graph_config(req):
-                # Basic parameter validation: empty query => 400
-                if not req.query or not str(req.query).strip():
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Query must not be empty.",
-                    )
+            graph_client_config = request_graph_config(req)
+            # Basic parameter validation: empty query => 400
+            if not req.query or not str(req.query).strip():
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Query must not be empty.",
+                )
 
-                output_types_str_list = None
-                if req.output_types:
-                    output_types_str_list = [ot.value for ot in req.output_types]
+            output_types_str_list = None
+            if req.output_types:
+                output_types_str_list = [ot.value for ot in req.output_types]
 
-                response_dict = gremlin_generate_selective_func(
-                    inp=req.query,
-                    example_num=req.example_num,
-                    schema_input=huge_settings.graph_name,
-                    gremlin_prompt_input=req.gremlin_prompt,
-                    requested_outputs=output_types_str_list,
-                )
-                return response_dict
+            response_dict = gremlin_generate_selective_func(
+                inp=req.query,
+                example_num=req.example_num,
+                schema_input=graph_connection(graph_client_config)["graph"],
+                gremlin_prompt_input=req.gremlin_prompt,
+                requested_outputs=output_types_str_list,
+                graph_client_config=graph_client_config,
+            )
+            return response_dict
         except HTTPException as e:
             raise e
+        except SchedulerBusyError:
+            # answered with 503 by the app-level handler
+            raise
         except Exception as e:
             log.error("Error in text2gremlin_api: %s", e)
             raise HTTPException(
@@ -35,6 +35,14 @@ class HugeGraphConfig(BaseConfig):
     max_graph_path: int = 10
     max_graph_items: int = 30
     edge_limit_pre_label: int = 8
+    # max concurrent neighbor queries when expanding multiple matched vids
+    max_graph_query_workers: int = 8
+    # seconds to keep a graph schema in the process-wide cache (0 to disable)
+    graph_schema_cache_ttl: int = 300
+
+    # graph data commit config
+    # vertices/edges per batch request when committing extracted data (<= 1 writes them one by one)
+    graph_commit_batch_size: int = 0
 
     # vector config
     vector_dis_threshold: float = 0.9
@@ -42,3 +50,32 @@ class HugeGraphConfig(BaseConfig):
 
     # rerank config
     topk_return_results: int = 20
+
+    # graph+vector rag latency config
+    # seconds the graph+vector RAG flow waits for the graph branch before answering from the vector
+    # results alone (0 to always wait)
+    rag_graph_latency_budget: float = 0.0
+    # stream a second, refined answer once a graph branch that missed the budget lands
+    rag_graph_refine_answer: bool = False
+
+    # rag answer cache config
+    # seconds to reuse the answer of a similar query in the RAG flows (0 to disable)
+    rag_answer_cache_ttl: int = 0
+    # min cosine similarity between query embeddings to reuse a cached answer
+    rag_answer_cache_threshold: float = 0.95
+    rag_answer_cache_size: int = 1000
+
+    # flow pipeline pool config
+    # max pipelines kept per flow, i.e. how many requests of one flow run concurrently
+    flow_pool_size: int = 10
+    # idle pipelines built for every RAG flow at startup
+    flow_pool_prewarm: int = 0
+    # seconds a request waits for a busy flow before it is rejected
+    flow_pool_acquire_timeout: float = 30.0
+    # threads running the blocking pipeline init/run of streaming flows
+    flow_worker_threads: int = 16
+
+    # request tracing config
+    # where per-request traces go: none / memory / file (OTLP/JSON lines) / otel (OpenTelemetry API)
+    trace_exporter: str = "none"
+    trace_file_path: str = "logs/traces.jsonl"
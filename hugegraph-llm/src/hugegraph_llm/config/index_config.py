@@ -34,3 +34,19 @@ class IndexConfig(BaseConfig):
     milvus_password: str = os.environ.get("MILVUS_PASSWORD", "")
 
     cur_vector_index: str = os.environ.get("CUR_VECTOR_INDEX", "Faiss")
+
+    # Faiss index layout: Flat (exact), IVFFlat, IVFPQ or HNSW
+    faiss_index_type: str = os.environ.get("FAISS_INDEX_TYPE", "Flat")
+    faiss_ivf_nlist: int = int(os.environ.get("FAISS_IVF_NLIST", "1024"))
+    faiss_pq_m: int = int(os.environ.get("FAISS_PQ_M", "16"))
+    faiss_hnsw_m: int = int(os.environ.get("FAISS_HNSW_M", "32"))
+    faiss_nprobe: int = int(os.environ.get("FAISS_NPROBE", "16"))
+    faiss_ef_search: int = int(os.environ.get("FAISS_EF_SEARCH", "64"))
+    # open saved faiss indexes memory-mapped (read-only until the first add/remove)
+    faiss_mmap: bool = os.environ.get("FAISS_MMAP", "false").lower() == "true"
+
+    # chunk vector index build: chunks embedded per window, windows between index checkpoints
+    vector_index_build_window: int = int(os.environ.get("VECTOR_INDEX_BUILD_WINDOW", "1000"))
+    vector_index_checkpoint_interval: int = int(os.environ.get("VECTOR_INDEX_CHECKPOINT_INTERVAL", "10"))
+    # vid vector index build: vertices fetched per page when paging through the graph
+    vid_index_page_size: int = int(os.environ.get("VID_INDEX_PAGE_SIZE", "10000"))
@@ -84,3 +84,27 @@ class LLMConfig(BaseConfig):
     litellm_embedding_api_key: Optional[str] = None
     litellm_embedding_api_base: Optional[str] = None
     litellm_embedding_model: Optional[str] = "openai/text-embedding-3-small"
+    # 5. Embedding cache settings
+    embedding_cache_enabled: bool = False
+    embedding_cache_memory_size: int = 10000
+    embedding_cache_max_entries: int = 500000
+    # 6. LLM response cache settings
+    llm_cache_enabled: bool = False
+    # seconds to keep a cached response (0 keeps it forever)
+    llm_cache_ttl: int = 86400
+    llm_cache_max_entries: int = 100000
+    # 7. Graph extraction settings
+    # chunks extracted by the LLM at the same time (<= 1 extracts them one by one)
+    extract_max_concurrency: int = 1
+    # 8. Provider rate limit settings, shared per provider + model by all clients of the process
+    # requests / tokens per minute (0 for no limit)
+    llm_rpm_limit: int = 0
+    llm_tpm_limit: int = 0
+    # upper bound of the adaptive (AIMD) number of calls in flight
+    llm_max_concurrency: int = 16
+    # seconds to wait for a free concurrency slot before failing the call (0 waits forever)
+    llm_acquire_timeout: int = 300
+    embedding_rpm_limit: int = 0
+    embedding_tpm_limit: int = 0
+    embedding_max_concurrency: int = 16
+    embedding_acquire_timeout: int = 300
@@ -24,6 +24,7 @@ from fastapi import APIRouter, Depends, FastAPI
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from hugegraph_llm.api.admin_api import admin_http_api
+from hugegraph_llm.api.exceptions.rag_exceptions import scheduler_busy_handler
 from hugegraph_llm.api.graph_extract_api import graph_extract_http_api
 from hugegraph_llm.api.rag_api import rag_http_api
 from hugegraph_llm.config import admin_settings, huge_settings, prompt
@@ -44,6 +45,7 @@ from hugegraph_llm.demo.rag_demo.text2gremlin_block import (
     gremlin_generate_selective,
 )
 from hugegraph_llm.demo.rag_demo.vector_graph_block import create_vector_graph_block
+from hugegraph_llm.flows.pipeline_pool import SchedulerBusyError
 from hugegraph_llm.resources.demo.css import CSS
 from hugegraph_llm.utils.log import log
 
@@ -182,6 +184,7 @@ def create_app():
     graph_extract_http_api(api_auth)
 
     app.include_router(api_auth)
+    app.add_exception_handler(SchedulerBusyError, scheduler_busy_handler)
     # Mount Gradio inside FastAPI
     # TODO: support multi-user login when need
     app = gr.mount_gradio_app(
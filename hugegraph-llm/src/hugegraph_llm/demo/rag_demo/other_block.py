@@ -23,7 +23,9 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from fastapi import FastAPI
 
+from hugegraph_llm.config import huge_settings
 from hugegraph_llm.demo.rag_demo.vector_graph_block import timely_update_vid_embedding
+from hugegraph_llm.flows.scheduler import ANSWER_CACHED_FLOWS, SchedulerSingleton
 from hugegraph_llm.utils.hugegraph_utils import backup_data, init_hg_test_data, run_gremlin_query
 from hugegraph_llm.utils.log import log
 
@@ -59,6 +61,13 @@ async def lifespan(app: FastAPI):  # pylint: disable=W0621
 
     log.info("Starting vid embedding update task...")
     embedding_task = asyncio.create_task(timely_update_vid_embedding())
+
+    if huge_settings.flow_pool_prewarm > 0:
+        log.info("Prewarming RAG flow pipelines...")
+        flow_scheduler = SchedulerSingleton.get_instance()
+        for flow_name in ANSWER_CACHED_FLOWS:
+            # the query is replaced by `prepare` when a request reuses the pipeline
+            await asyncio.to_thread(flow_scheduler.prewarm, flow_name, huge_settings.flow_pool_prewarm, query="")
     yield
 
     log.info("Stopping vid embedding update task...")
@@ -18,7 +18,7 @@
 # pylint: disable=E1101
 
 import os
-from typing import AsyncGenerator, Literal, Optional, Tuple
+from typing import Any, AsyncGenerator, Dict, Literal, Optional, Tuple
 
 import gradio as gr
 import pandas as pd
@@ -26,6 +26,7 @@ from gradio.utils import NamedString
 
 from hugegraph_llm.config import llm_settings, prompt, resource_path
 from hugegraph_llm.flows import FlowName
+from hugegraph_llm.flows.pipeline_pool import SchedulerBusyError
 from hugegraph_llm.flows.scheduler import SchedulerSingleton
 from hugegraph_llm.utils.decorators import with_task_id
 from hugegraph_llm.utils.log import log
@@ -49,10 +50,12 @@ def rag_answer(
     topk_return_results=20,
     vector_dis_threshold=0.9,
     topk_per_keyword=1,
+    graph_client_config: Optional[Dict[str, Any]] = None,
 ) -> Tuple:
     """
     Generate an answer using the RAG (Retrieval-Augmented Generation) pipeline.
-    Fetch the Scheduler to deal with the request
+    Fetch the Scheduler to deal with the request, `graph_client_config` points it to another graph than
+    the configured one
     """
     graph_search, gremlin_prompt, vector_search = update_ui_configs(
         answer_prompt,
@@ -103,6 +106,7 @@ def rag_answer(
             topk_return_results=topk_return_results,
             vector_dis_threshold=vector_dis_threshold,
             topk_per_keyword=topk_per_keyword,
+            graph_client_config=graph_client_config,
         )
         if res.get("switch_to_bleu"):
             gr.Warning("Online reranker fails, automatically switches to local bleu rerank.")
@@ -112,6 +116,9 @@ def rag_answer(
             res.get("graph_only_answer", ""),
             res.get("graph_vector_answer", ""),
         )
+    except SchedulerBusyError:
+        # shared with the HTTP API which answers with 503, the Gradio callers convert it themselves
+        raise
     except ValueError as e:
         log.critical(e)
         raise gr.Error(str(e))
@@ -224,6 +231,9 @@ async def rag_answer_streaming(
                 res.get("graph_only_answer", ""),
                 res.get("graph_vector_answer", ""),
             )
+    except SchedulerBusyError as e:
+        log.warning(e)
+        raise gr.Error("Server busy, please retry") from e
     except ValueError as e:
         log.critical(e)
         raise gr.Error(str(e))
@@ -408,24 +418,28 @@ def create_rag_block():
         total_rows = len(df)
         for index, row in df.iterrows():
             question = row.iloc[0]
-            (
-                basic_llm_answer,
-                vector_only_answer,
-                graph_only_answer,
-                graph_vector_answer,
-            ) = rag_answer(
-                question,
-                is_raw_answer,
-                is_vector_only_answer,
-                is_graph_only_answer,
-                is_graph_vector_answer,
-                graph_ratio_ui,
-                rerank_method_ui,
-                near_neighbor_first_ui,
-                custom_related_information_ui,
-                answer_prompt,
-                keywords_extract_prompt,
-            )
+            try:
+                (
+                    basic_llm_answer,
+                    vector_only_answer,
+                    graph_only_answer,
+                    graph_vector_answer,
+                ) = rag_answer(
+                    question,
+                    is_raw_answer,
+                    is_vector_only_answer,
+                    is_graph_only_answer,
+                    is_graph_vector_answer,
+                    graph_ratio_ui,
+                    rerank_method_ui,
+                    near_neighbor_first_ui,
+                    custom_related_information_ui,
+                    answer_prompt,
+                    keywords_extract_prompt,
+                )
+            except SchedulerBusyError as e:
+                log.warning(e)
+                raise gr.Error("Server busy, please retry") from e
             df.at[index, "Basic LLM Answer"] = basic_llm_answer
             df.at[index, "Vector-only Answer"] = vector_only_answer
             df.at[index, "Graph-only Answer"] = graph_only_answer
@@ -315,6 +315,7 @@ def graph_rag_recall(
     vector_dis_threshold: float,
     topk_per_keyword: int,
     get_vertex_only: bool = False,
+    graph_client_config: Optional[Dict[str, Any]] = None,
 ) -> dict:
     store_schema(prompt.text2gql_graph_schema, query, gremlin_prompt)
     context = SchedulerSingleton.get_instance().schedule_flow(
@@ -331,6 +332,7 @@ def graph_rag_recall(
         topk_per_keyword=topk_per_keyword,
         is_graph_rag_recall=True,
         is_vector_only=get_vertex_only,
+        graph_client_config=graph_client_config,
     )
     return context
 
@@ -341,6 +343,7 @@ def gremlin_generate_selective(
     schema_input: str,
     gremlin_prompt_input: str,
     requested_outputs: Optional[List[str]] = None,
+    graph_client_config: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     response_dict = SchedulerSingleton.get_instance().schedule_flow(
         FlowName.TEXT2GREMLIN,
@@ -349,6 +352,7 @@ def gremlin_generate_selective(
         schema_input,
         gremlin_prompt_input,
         requested_outputs,
+        graph_client_config=graph_client_config,
     )
 
     return response_dict
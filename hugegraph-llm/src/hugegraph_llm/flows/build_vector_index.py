@@ -28,16 +28,18 @@ class BuildVectorIndexFlow(BaseFlow):
     def __init__(self):
         pass
 
-    def prepare(self, prepared_input: WkFlowInput, texts, **kwargs):
+    def prepare(self, prepared_input: WkFlowInput, texts, sources=None, **kwargs):
         prepared_input.texts = texts
+        prepared_input.sources = sources
         prepared_input.language = "zh"
         prepared_input.split_type = "paragraph"
+        prepared_input.lazy_chunks = True
 
-    def build_flow(self, texts, **kwargs):
+    def build_flow(self, texts, sources=None, **kwargs):
         pipeline = GPipeline()
         # prepare for workflow input
         prepared_input = WkFlowInput()
-        self.prepare(prepared_input, texts)
+        self.prepare(prepared_input, texts, sources)
 
         pipeline.createGParam(prepared_input, "wkflow_input")
         pipeline.createGParam(WkFlowState(), "wkflow_state")
@@ -51,4 +53,5 @@ class BuildVectorIndexFlow(BaseFlow):
 
     def post_deal(self, pipeline=None, **kwargs):
         res = pipeline.getGParamWithNoEmpty("wkflow_state").to_json()
+        res.pop("chunk_hashes", None)
         return json.dumps(res, ensure_ascii=False, indent=2)
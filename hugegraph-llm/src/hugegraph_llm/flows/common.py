@@ -14,9 +14,10 @@
 #  limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import Any, AsyncGenerator, Dict
+from typing import Any, AsyncGenerator, Dict, Optional
 
 from hugegraph_llm.state.ai_state import WkFlowInput
+from hugegraph_llm.utils.hugegraph_utils import graph_connection
 from hugegraph_llm.utils.log import log
 
 
@@ -43,6 +44,15 @@ class BaseFlow(ABC):
         Post-processing interface.
         """
 
+    @staticmethod
+    def prepare_graph(prepared_input: WkFlowInput, graph_client_config: Optional[Dict[str, Any]] = None):
+        """
+        Point the flow input at the request's graph (None for the configured one).
+        Called on every request so a pooled pipeline never keeps the graph of a previous one.
+        """
+        prepared_input.graph_client_config = graph_client_config
+        prepared_input.schema = graph_connection(graph_client_config)["graph"]
+
     async def post_deal_stream(self, pipeline=None) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Streaming post-processing interface.
@@ -61,6 +61,7 @@ class GraphExtractFlow(BaseFlow):
             # URL stays server-controlled; only identity/graphspace are request-scoped.
             prepared_input.graph_client_config = {
                 "url": huge_settings.graph_url,
+                "graph": client_config.graph,
                 "user": client_config.user,
                 "pwd": client_config.pwd,
                 "graphspace": client_config.gs,
@@ -0,0 +1,202 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pycgraph import GPipeline, GPipelineManager
+
+from hugegraph_llm.utils.log import log
+
+
+class SchedulerBusyError(RuntimeError):
+    """Raised when no pipeline of a flow becomes available within the acquire timeout."""
+
+    def __init__(self, flow_name: str, timeout: float):
+        super().__init__(f"All {flow_name} pipelines are busy, no pipeline became available in {timeout}s")
+        self.flow_name = flow_name
+        self.timeout = timeout
+
+
+class PipelinePool:
+    """
+    Bounds the pipelines of one flow kept by a ``GPipelineManager``.
+
+    At most ``max_size`` pipelines are ever built. A caller either gets an idle pipeline, a slot to build a
+    new one in, or waits (up to the acquire timeout) for a running pipeline to be handed back, so a burst
+    of requests queues up instead of building an unbounded number of pipelines.
+    """
+
+    def __init__(self, flow_name: str, manager: GPipelineManager, max_size: int):
+        if max_size < 1:
+            raise ValueError(f"max_size of the {flow_name} pipeline pool must be at least 1")
+        self.flow_name = flow_name
+        self.manager = manager
+        self.max_size = max_size
+        self._cond = threading.Condition()
+        # event loops waiting in acquire_async, woken with the thread waiters on every hand back
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        # pipelines built (or being built) and pipelines handed out
+        self.size = 0
+        self.in_use = 0
+        self.waiting = 0
+        self.acquired = 0
+        self.waited = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _take(self, start: float, waited: bool) -> Optional[Tuple[Optional[GPipeline], bool]]:
+        # called with the lock held
+        pipeline = self.manager.fetch() if self.in_use < self.size else None
+        if pipeline is None and self.size >= self.max_size:
+            return None
+        if pipeline is None:
+            self.size += 1
+        self.in_use += 1
+        self._record(time.monotonic() - start, waited)
+        return pipeline, pipeline is None
+
+    def _reject(self, timeout: float) -> SchedulerBusyError:
+        self.rejected += 1
+        log.warning("Rejected a %s request: %s pipelines busy", self.flow_name, self.in_use)
+        return SchedulerBusyError(self.flow_name, timeout)
+
+    def acquire(self, timeout: float) -> Tuple[Optional[GPipeline], bool]:
+        """
+        Return ``(pipeline, False)`` for an idle pipeline, or ``(None, True)`` when the caller owns a free
+        slot and has to build the pipeline itself (then hand it to ``release`` or ``discard``).
+        """
+        start = time.monotonic()
+        deadline = start + max(timeout, 0)
+        with self._cond:
+            waited = False
+            while True:
+                taken = self._take(start, waited)
+                if taken is not None:
+                    return taken
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise self._reject(timeout)
+                waited = True
+                self.waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self.waiting -= 1
+
+    async def acquire_async(self, timeout: float) -> Tuple[Optional[GPipeline], bool]:
+        """``acquire`` waiting on an asyncio event, so a queued request holds no thread."""
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+        deadline = start + max(timeout, 0)
+        waited = False
+        while True:
+            event = asyncio.Event()
+            with self._cond:
+                taken = self._take(start, waited)
+                if taken is not None:
+                    return taken
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise self._reject(timeout)
+                waited = True
+                waiter = (loop, event)
+                self._async_waiters.append(waiter)
+                self.waiting += 1
+            try:
+                await asyncio.wait_for(event.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                # pipelines are only taken under the lock above, a cancelled waiter holds nothing
+                with self._cond:
+                    self.waiting -= 1
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    def _wake_up(self) -> None:
+        # called with the lock held
+        self._cond.notify()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, event in waiters:
+            if loop.is_closed():
+                continue
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # the loop was closed meanwhile, its waiter is gone
+                continue
+
+    def _record(self, wait: float, waited: bool) -> None:
+        self.acquired += 1
+        if waited:
+            self.waited += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def release(self, pipeline: GPipeline, new: bool = False) -> None:
+        """Hand a pipeline back, ``new`` ones are registered to the manager first."""
+        with self._cond:
+            if new:
+                self.manager.add(pipeline)
+            else:
+                self.manager.release(pipeline)
+            self.in_use -= 1
+            self._wake_up()
+
+    def discard(self) -> None:
+        """Give up a slot whose pipeline could not be built or initialized."""
+        with self._cond:
+            self.size -= 1
+            self.in_use -= 1
+            self._wake_up()
+
+    def prewarm(self, count: int, build: Callable[[], GPipeline]) -> int:
+        """Build up to ``count`` idle pipelines ahead of the first requests, return how many were built."""
+        built = 0
+        while built < count:
+            with self._cond:
+                if self.size >= self.max_size:
+                    break
+                self.size += 1
+                self.in_use += 1
+            try:
+                pipeline = build()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.discard()
+                log.warning("Failed to prewarm a %s pipeline: %s", self.flow_name, e)
+                break
+            self.release(pipeline, new=True)
+            built += 1
+        return built
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "max_size": self.max_size,
+                "size": self.size,
+                "in_use": self.in_use,
+                "idle": self.size - self.in_use,
+                "waiting": self.waiting,
+                "acquired": self.acquired,
+                "waited": self.waited,
+                "rejected": self.rejected,
+                "avg_wait": self.total_wait / self.waited if self.waited else 0.0,
+                "max_wait": self.max_wait,
+            }
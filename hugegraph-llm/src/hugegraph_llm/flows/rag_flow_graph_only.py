@@ -14,7 +14,7 @@
 #  limitations under the License.
 
 
-from typing import Literal, Optional, cast
+from typing import Any, Dict, Literal, Optional, cast
 
 from pycgraph import GCondition, GPipeline, GRegion
 
@@ -71,6 +71,7 @@ class RAGGraphOnlyFlow(BaseFlow):
         topk_per_keyword: Optional[int] = None,
         is_graph_rag_recall: bool = False,
         is_vector_only: bool = False,
+        graph_client_config: Optional[Dict[str, Any]] = None,
         **kwargs,
     ):
         prepared_input.query = query
@@ -91,7 +92,7 @@ class RAGGraphOnlyFlow(BaseFlow):
         prepared_input.answer_prompt = answer_prompt or prompt.answer_prompt
         prepared_input.custom_related_information = custom_related_information
         prepared_input.vector_dis_threshold = vector_dis_threshold or huge_settings.vector_dis_threshold
-        prepared_input.schema = huge_settings.graph_name
+        self.prepare_graph(prepared_input, graph_client_config)
 
         prepared_input.is_graph_rag_recall = is_graph_rag_recall
         prepared_input.is_vector_only = is_vector_only
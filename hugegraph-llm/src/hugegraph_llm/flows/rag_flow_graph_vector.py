@@ -14,19 +14,17 @@
 #  limitations under the License.
 
 
-from typing import Literal, Optional
+import asyncio
+from typing import Any, AsyncGenerator, Dict, Literal, Optional
 
 from pycgraph import GPipeline
 
 from hugegraph_llm.config import huge_settings, prompt
 from hugegraph_llm.flows.common import BaseFlow
+from hugegraph_llm.nodes.common_node.graph_branch_node import GraphBranchNode
 from hugegraph_llm.nodes.common_node.merge_rerank_node import MergeRerankNode
-from hugegraph_llm.nodes.hugegraph_node.graph_query_node import GraphQueryNode
-from hugegraph_llm.nodes.hugegraph_node.schema import SchemaNode
-from hugegraph_llm.nodes.index_node.semantic_id_query_node import SemanticIdQueryNode
 from hugegraph_llm.nodes.index_node.vector_query_node import VectorQueryNode
 from hugegraph_llm.nodes.llm_node.answer_synthesize_node import AnswerSynthesizeNode
-from hugegraph_llm.nodes.llm_node.keyword_extract_node import KeywordExtractNode
 from hugegraph_llm.state.ai_state import WkFlowInput, WkFlowState
 from hugegraph_llm.utils.log import log
 
@@ -59,6 +57,9 @@ class RAGGraphVectorFlow(BaseFlow):
         topk_return_results: Optional[int] = None,
         vector_dis_threshold: Optional[float] = None,
         topk_per_keyword: Optional[int] = None,
+        graph_client_config: Optional[Dict[str, Any]] = None,
+        graph_latency_budget: Optional[float] = None,
+        refine_graph_answer: Optional[bool] = None,
         **kwargs,
     ):
         prepared_input.query = query
@@ -80,7 +81,13 @@ class RAGGraphVectorFlow(BaseFlow):
         prepared_input.keywords_extract_prompt = keywords_extract_prompt or prompt.keywords_extract_prompt
         prepared_input.answer_prompt = answer_prompt or prompt.answer_prompt
         prepared_input.custom_related_information = custom_related_information
-        prepared_input.schema = huge_settings.graph_name
+        prepared_input.graph_latency_budget = (
+            huge_settings.rag_graph_latency_budget if graph_latency_budget is None else graph_latency_budget
+        )
+        prepared_input.refine_graph_answer = (
+            huge_settings.rag_graph_refine_answer if refine_graph_answer is None else refine_graph_answer
+        )
+        self.prepare_graph(prepared_input, graph_client_config)
 
         prepared_input.data_json = {
             "query": query,
@@ -98,20 +105,15 @@ class RAGGraphVectorFlow(BaseFlow):
 
         # Create nodes (registration style consistent with RAGFlow)
         vector_query_node = VectorQueryNode()
-        keyword_extract_node = KeywordExtractNode()
-        semantic_id_query_node = SemanticIdQueryNode()
-        schema_node = SchemaNode()
-        graph_query_node = GraphQueryNode()
+        # schema -> keyword -> semantic -> graph query, bounded by the graph latency budget
+        graph_branch_node = GraphBranchNode()
         merge_rerank_node = MergeRerankNode()
         answer_synthesize_node = AnswerSynthesizeNode()
 
         # Register nodes and their dependencies
         pipeline.registerGElement(vector_query_node, set(), "vector")
-        pipeline.registerGElement(keyword_extract_node, set(), "keyword")
-        pipeline.registerGElement(semantic_id_query_node, {keyword_extract_node}, "semantic")
-        pipeline.registerGElement(schema_node, set(), "schema")
-        pipeline.registerGElement(graph_query_node, {schema_node, semantic_id_query_node}, "graph")
-        pipeline.registerGElement(merge_rerank_node, {graph_query_node, vector_query_node}, "merge")
+        pipeline.registerGElement(graph_branch_node, set(), "graph")
+        pipeline.registerGElement(merge_rerank_node, {graph_branch_node, vector_query_node}, "merge")
         pipeline.registerGElement(answer_synthesize_node, {merge_rerank_node}, "graph_vector")
         log.info("RAGGraphVectorFlow pipeline built successfully")
         return pipeline
@@ -121,9 +123,49 @@ class RAGGraphVectorFlow(BaseFlow):
             return {"error": "No pipeline provided"}
         res = pipeline.getGParamWithNoEmpty("wkflow_state").to_json()
         log.info("RAGGraphVectorFlow post processing success")
-        return {
+        result = {
             "raw_answer": res.get("raw_answer", ""),
             "vector_only_answer": res.get("vector_only_answer", ""),
             "graph_only_answer": res.get("graph_only_answer", ""),
             "graph_vector_answer": res.get("graph_vector_answer", ""),
         }
+        if res.get("pending_graph_result") is not None:
+            # answered without the graph results, keep it out of the answer cache
+            result["partial"] = True
+        return result
+
+    async def post_deal_stream(self, pipeline=None) -> AsyncGenerator[Dict[str, Any], None]:
+        async for chunk in super().post_deal_stream(pipeline):
+            yield chunk
+        if pipeline is None:
+            return
+        prepared_input: WkFlowInput = pipeline.getGParamWithNoEmpty("wkflow_input")
+        state: WkFlowState = pipeline.getGParamWithNoEmpty("wkflow_state")
+        pending = state.pending_graph_result
+        if pending is None or not prepared_input.refine_graph_answer:
+            return
+        try:
+            graph_context = await asyncio.wrap_future(pending)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            log.warning("Late graph branch failed, no refined answer: %s", e)
+            return
+        if not graph_context.get("graph_result"):
+            return
+
+        # answer again from the vector results plus the graph results that missed the latency budget
+        merge_rerank_node = MergeRerankNode()
+        answer_synthesize_node = AnswerSynthesizeNode()
+        for node in (merge_rerank_node, answer_synthesize_node):
+            node.wk_input = prepared_input
+            node.context = state
+            status = node.node_init()
+            if status.isErr():
+                log.warning("Failed to prepare the refined answer: %s", status.getInfo())
+                return
+        context = {**state.to_json(), **graph_context}
+        context.pop("stream_generator", None)
+        context.pop("pending_graph_result", None)
+        context = await asyncio.to_thread(merge_rerank_node.operator.run, context)
+        log.info("RAGGraphVectorFlow streams a refined answer with the late graph results")
+        async for chunk in answer_synthesize_node.operator.run_streaming(context):
+            yield {**chunk, "refined": True}
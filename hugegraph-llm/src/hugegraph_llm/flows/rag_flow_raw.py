@@ -14,7 +14,7 @@
 #  limitations under the License.
 
 
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pycgraph import GPipeline
 
@@ -44,6 +44,7 @@ class RAGRawFlow(BaseFlow):
         custom_related_information: str = "",
         answer_prompt: Optional[str] = None,
         max_graph_items: Optional[int] = None,
+        graph_client_config: Optional[Dict[str, Any]] = None,
         **kwargs,
     ):
         prepared_input.query = query
@@ -53,7 +54,7 @@ class RAGRawFlow(BaseFlow):
         prepared_input.graph_vector_answer = graph_vector_answer
         prepared_input.custom_related_information = custom_related_information
         prepared_input.answer_prompt = answer_prompt or prompt.answer_prompt
-        prepared_input.schema = huge_settings.graph_name
+        self.prepare_graph(prepared_input, graph_client_config)
 
         prepared_input.data_json = {
             "query": query,
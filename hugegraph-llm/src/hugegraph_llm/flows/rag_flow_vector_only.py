@@ -14,7 +14,7 @@
 #  limitations under the License.
 
 
-from typing import Literal, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pycgraph import GPipeline
 
@@ -50,6 +50,7 @@ class RAGVectorOnlyFlow(BaseFlow):
         max_graph_items: Optional[int] = None,
         topk_return_results: Optional[int] = None,
         vector_dis_threshold: Optional[float] = None,
+        graph_client_config: Optional[Dict[str, Any]] = None,
         **kwargs,
     ):
         prepared_input.query = query
@@ -65,7 +66,7 @@ class RAGVectorOnlyFlow(BaseFlow):
         prepared_input.near_neighbor_first = near_neighbor_first
         prepared_input.custom_related_information = custom_related_information
         prepared_input.answer_prompt = answer_prompt or prompt.answer_prompt
-        prepared_input.schema = huge_settings.graph_name
+        self.prepare_graph(prepared_input, graph_client_config)
 
         prepared_input.data_json = {
             "query": query,
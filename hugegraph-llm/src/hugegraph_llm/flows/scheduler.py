@@ -13,11 +13,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+import functools
 import threading
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
 
 from pycgraph import GPipeline, GPipelineManager
 
+from hugegraph_llm.config import huge_settings
 from hugegraph_llm.flows import FlowName
 from hugegraph_llm.flows.build_example_index import BuildExampleIndexFlow
 from hugegraph_llm.flows.build_schema import BuildSchemaFlow
@@ -26,6 +30,7 @@ from hugegraph_llm.flows.common import BaseFlow
 from hugegraph_llm.flows.get_graph_index_info import GetGraphIndexInfoFlow
 from hugegraph_llm.flows.graph_extract import GraphExtractFlow
 from hugegraph_llm.flows.import_graph_data import ImportGraphDataFlow
+from hugegraph_llm.flows.pipeline_pool import PipelinePool
 from hugegraph_llm.flows.prompt_generate import PromptGenerateFlow
 from hugegraph_llm.flows.rag_flow_graph_only import RAGGraphOnlyFlow
 from hugegraph_llm.flows.rag_flow_graph_vector import RAGGraphVectorFlow
@@ -34,155 +39,196 @@ from hugegraph_llm.flows.rag_flow_vector_only import RAGVectorOnlyFlow
 from hugegraph_llm.flows.text2gremlin import Text2GremlinFlow
 from hugegraph_llm.flows.update_vid_embeddings import UpdateVidEmbeddingsFlow
 from hugegraph_llm.state.ai_state import WkFlowInput
+from hugegraph_llm.utils.answer_cache import answer_cache
 from hugegraph_llm.utils.log import log
+from hugegraph_llm.utils.tracing import current_trace, finish_trace, new_trace, request_trace
+
+# flows whose answers are served from the answer cache
+ANSWER_CACHED_FLOWS = {
+    FlowName.RAG_RAW,
+    FlowName.RAG_VECTOR_ONLY,
+    FlowName.RAG_GRAPH_ONLY,
+    FlowName.RAG_GRAPH_VECTOR,
+}
+# flows that change the graph data or a vector index, so cached answers become stale
+INDEX_UPDATING_FLOWS = {
+    FlowName.BUILD_VECTOR_INDEX,
+    FlowName.IMPORT_GRAPH_DATA,
+    FlowName.UPDATE_VID_EMBEDDINGS,
+    FlowName.BUILD_EXAMPLES_INDEX,
+}
+# CGraph init/run block the calling thread, streaming flows run them here to keep the event loop free
+FLOW_EXECUTOR = ThreadPoolExecutor(max_workers=huge_settings.flow_worker_threads, thread_name_prefix="flow-worker")
 
 
 class Scheduler:
     pipeline_pool: Dict[str, Any]
     max_pipeline: int
 
-    def __init__(self, max_pipeline: int = 10):
-        self.pipeline_pool = {}
-        # pipeline_pool act as a manager of GPipelineManager which used for pipeline management
-        self.pipeline_pool[FlowName.BUILD_VECTOR_INDEX] = {
-            "manager": GPipelineManager(),
-            "flow": BuildVectorIndexFlow(),
-        }
-        self.pipeline_pool[FlowName.GRAPH_EXTRACT] = {
-            "manager": GPipelineManager(),
-            "flow": GraphExtractFlow(),
-        }
-        self.pipeline_pool[FlowName.IMPORT_GRAPH_DATA] = {
-            "manager": GPipelineManager(),
-            "flow": ImportGraphDataFlow(),
-        }
-        self.pipeline_pool[FlowName.UPDATE_VID_EMBEDDINGS] = {
-            "manager": GPipelineManager(),
-            "flow": UpdateVidEmbeddingsFlow(),
-        }
-        self.pipeline_pool[FlowName.GET_GRAPH_INDEX_INFO] = {
-            "manager": GPipelineManager(),
-            "flow": GetGraphIndexInfoFlow(),
-        }
-        self.pipeline_pool[FlowName.BUILD_SCHEMA] = {
-            "manager": GPipelineManager(),
-            "flow": BuildSchemaFlow(),
-        }
-        self.pipeline_pool[FlowName.PROMPT_GENERATE] = {
-            "manager": GPipelineManager(),
-            "flow": PromptGenerateFlow(),
-        }
-        self.pipeline_pool[FlowName.TEXT2GREMLIN] = {
-            "manager": GPipelineManager(),
-            "flow": Text2GremlinFlow(),
-        }
-        # New split rag pipelines
-        self.pipeline_pool[FlowName.RAG_RAW] = {
-            "manager": GPipelineManager(),
-            "flow": RAGRawFlow(),
-        }
-        self.pipeline_pool[FlowName.RAG_VECTOR_ONLY] = {
-            "manager": GPipelineManager(),
-            "flow": RAGVectorOnlyFlow(),
-        }
-        self.pipeline_pool[FlowName.RAG_GRAPH_ONLY] = {
-            "manager": GPipelineManager(),
-            "flow": RAGGraphOnlyFlow(),
-        }
-        self.pipeline_pool[FlowName.RAG_GRAPH_VECTOR] = {
-            "manager": GPipelineManager(),
-            "flow": RAGGraphVectorFlow(),
+    def __init__(self, max_pipeline: Optional[int] = None):
+        self.max_pipeline = max_pipeline or huge_settings.flow_pool_size
+        flows = {
+            FlowName.BUILD_VECTOR_INDEX: BuildVectorIndexFlow(),
+            FlowName.GRAPH_EXTRACT: GraphExtractFlow(),
+            FlowName.IMPORT_GRAPH_DATA: ImportGraphDataFlow(),
+            FlowName.UPDATE_VID_EMBEDDINGS: UpdateVidEmbeddingsFlow(),
+            FlowName.GET_GRAPH_INDEX_INFO: GetGraphIndexInfoFlow(),
+            FlowName.BUILD_SCHEMA: BuildSchemaFlow(),
+            FlowName.PROMPT_GENERATE: PromptGenerateFlow(),
+            FlowName.TEXT2GREMLIN: Text2GremlinFlow(),
+            # New split rag pipelines
+            FlowName.RAG_RAW: RAGRawFlow(),
+            FlowName.RAG_VECTOR_ONLY: RAGVectorOnlyFlow(),
+            FlowName.RAG_GRAPH_ONLY: RAGGraphOnlyFlow(),
+            FlowName.RAG_GRAPH_VECTOR: RAGGraphVectorFlow(),
+            FlowName.BUILD_EXAMPLES_INDEX: BuildExampleIndexFlow(),
         }
-        self.pipeline_pool[FlowName.BUILD_EXAMPLES_INDEX] = {
-            "manager": GPipelineManager(),
-            "flow": BuildExampleIndexFlow(),
-        }
-        self.max_pipeline = max_pipeline
+        # pipeline_pool act as a manager of GPipelineManager which used for pipeline management,
+        # each flow keeps at most max_pipeline pipelines
+        self.pipeline_pool = {}
+        for flow_name, flow in flows.items():
+            manager = GPipelineManager()
+            self.pipeline_pool[flow_name] = {
+                "manager": manager,
+                "flow": flow,
+                "pool": PipelinePool(flow_name, manager, self.max_pipeline),
+            }
 
     # TODO: Implement Agentic Workflow
     def agentic_flow(self):
         pass
 
+    def prewarm(self, flow_name: str, count: int, *args, **kwargs) -> int:
+        """Build ``count`` idle pipelines of a flow so the first requests skip graph construction."""
+        if flow_name not in self.pipeline_pool:
+            raise ValueError(f"Unsupported workflow {flow_name}")
+        flow: BaseFlow = self.pipeline_pool[flow_name]["flow"]
+        pool: PipelinePool = self.pipeline_pool[flow_name]["pool"]
+        built = pool.prewarm(count, lambda: self._build_pipeline(flow, False, *args, **kwargs))
+        log.info("Prewarmed %s %s pipelines", built, flow_name)
+        return built
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Occupancy and wait time of every flow's pipeline pool."""
+        return {flow_name: entry["pool"].stats() for flow_name, entry in self.pipeline_pool.items()}
+
+    @staticmethod
+    def _build_pipeline(flow: BaseFlow, stream: bool, *args, **kwargs) -> GPipeline:
+        # call coresponding flow_func to create new workflow
+        pipeline = flow.build_flow(*args, **kwargs)
+        if stream:
+            pipeline.getGParamWithNoEmpty("wkflow_input").stream = True
+        status = pipeline.init()
+        if status.isErr():
+            error_msg = f"Error in flow init: {status.getInfo()}"
+            log.error(error_msg)
+            raise RuntimeError(error_msg)
+        return pipeline
+
     def schedule_flow(self, flow_name: str, *args, **kwargs):
         if flow_name not in self.pipeline_pool:
             raise ValueError(f"Unsupported workflow {flow_name}")
-        manager: GPipelineManager = self.pipeline_pool[flow_name]["manager"]
+        # a span of the caller's request trace, or a trace of its own when tracing is on
+        with request_trace(flow_name):
+            if flow_name in ANSWER_CACHED_FLOWS:
+                return answer_cache.get_or_compute(
+                    flow_name, args, kwargs, lambda: self._run_flow(flow_name, *args, **kwargs)
+                )
+            try:
+                return self._run_flow(flow_name, *args, **kwargs)
+            finally:
+                # a failed build may still have written part of the data
+                if flow_name in INDEX_UPDATING_FLOWS:
+                    answer_cache.invalidate()
+
+    def _run_flow(self, flow_name: str, *args, **kwargs):
         flow: BaseFlow = self.pipeline_pool[flow_name]["flow"]
-        pipeline: GPipeline = manager.fetch()
-        if pipeline is None:
-            # call coresponding flow_func to create new workflow
-            pipeline = flow.build_flow(*args, **kwargs)
-            status = pipeline.init()
-            if status.isErr():
-                error_msg = f"Error in flow init: {status.getInfo()}"
-                log.error(error_msg)
-                raise RuntimeError(error_msg)
-            status = pipeline.run()
-            if status.isErr():
-                manager.add(pipeline)
-                error_msg = f"Error in flow execution: {status.getInfo()}"
-                log.error(error_msg)
-                raise RuntimeError(error_msg)
-            res = flow.post_deal(pipeline)
-            manager.add(pipeline)
-            return res
+        pool: PipelinePool = self.pipeline_pool[flow_name]["pool"]
+        pipeline, new = pool.acquire(huge_settings.flow_pool_acquire_timeout)
+        if new:
+            try:
+                pipeline = self._build_pipeline(flow, False, *args, **kwargs)
+            except BaseException:
+                pool.discard()
+                raise
         try:
-            # fetch pipeline & prepare input for flow
-            prepared_input = pipeline.getGParamWithNoEmpty("wkflow_input")
-            flow.prepare(prepared_input, *args, **kwargs)
+            prepared_input: WkFlowInput = pipeline.getGParamWithNoEmpty("wkflow_input")
+            if not new:
+                # fetch pipeline & prepare input for flow
+                flow.prepare(prepared_input, *args, **kwargs)
+            prepared_input.trace = current_trace()
             status = pipeline.run()
             if status.isErr():
-                error_msg = f"Error in flow execution {status.getInfo()}"
+                error_msg = f"Error in flow execution: {status.getInfo()}"
                 log.error(error_msg)
                 raise RuntimeError(error_msg)
-            res = flow.post_deal(pipeline)
+            return flow.post_deal(pipeline)
         finally:
-            manager.release(pipeline)
-        return res
+            pool.release(pipeline, new)
 
     async def schedule_stream_flow(self, flow_name: str, *args, **kwargs):
         if flow_name not in self.pipeline_pool:
             raise ValueError(f"Unsupported workflow {flow_name}")
-        manager: GPipelineManager = self.pipeline_pool[flow_name]["manager"]
+        # the generator may resume in another context, so the trace is passed down explicitly
+        parent = current_trace()
+        trace = new_trace(flow_name) if parent is None else parent
+        flow_span = trace.start_span(flow_name) if parent is not None else None
+        try:
+            async for res in self._stream_flow(flow_name, trace, *args, **kwargs):
+                yield res
+        finally:
+            if flow_span is not None:
+                flow_span.end()
+            if parent is None:
+                finish_trace(trace)
+
+    async def _stream_flow(self, flow_name: str, trace, *args, **kwargs):
         flow: BaseFlow = self.pipeline_pool[flow_name]["flow"]
-        pipeline: GPipeline = manager.fetch()
-        if pipeline is None:
-            # call coresponding flow_func to create new workflow
-            pipeline = flow.build_flow(*args, **kwargs)
-            pipeline.getGParamWithNoEmpty("wkflow_input").stream = True
-            status = pipeline.init()
-            if status.isErr():
-                error_msg = f"Error in flow init: {status.getInfo()}"
-                log.error(error_msg)
-                raise RuntimeError(error_msg)
-            status = pipeline.run()
+        pool: PipelinePool = self.pipeline_pool[flow_name]["pool"]
+        pipeline, new = await pool.acquire_async(huge_settings.flow_pool_acquire_timeout)
+        loop = asyncio.get_running_loop()
+        if new:
+            build = loop.run_in_executor(
+                FLOW_EXECUTOR, functools.partial(self._build_pipeline, flow, True, *args, **kwargs)
+            )
+            try:
+                pipeline = await asyncio.shield(build)
+            except asyncio.CancelledError:
+                build.add_done_callback(functools.partial(self._settle_build, pool))
+                raise
+            except BaseException:
+                pool.discard()
+                raise
+        run = None
+        try:
+            prepared_input: WkFlowInput = pipeline.getGParamWithNoEmpty("wkflow_input")
+            if not new:
+                # fetch pipeline & prepare input for flow
+                prepared_input.stream = True
+                flow.prepare(prepared_input, *args, **kwargs)
+            prepared_input.trace = trace
+            # a freshly built pipeline already holds the input, it is run and streamed exactly once
+            run = loop.run_in_executor(FLOW_EXECUTOR, pipeline.run)
+            status = await asyncio.shield(run)
             if status.isErr():
-                manager.add(pipeline)
                 error_msg = f"Error in flow execution: {status.getInfo()}"
                 log.error(error_msg)
                 raise RuntimeError(error_msg)
             async for res in flow.post_deal_stream(pipeline):
                 yield res
-            manager.add(pipeline)
-            # Stop here: the build/run/stream path is complete. Without this
-            # return, execution falls through into the reuse `try` block below
-            # and runs the same pipeline a second time (duplicate LLM calls /
-            # double streaming). A bare `return` is required in an async
-            # generator; `return <value>` is not allowed. Mirrors the explicit
-            # `return res` in the synchronous `schedule_flow`.
-            return
-        try:
-            # fetch pipeline & prepare input for flow
-            prepared_input: WkFlowInput = pipeline.getGParamWithNoEmpty("wkflow_input")
-            prepared_input.stream = True
-            flow.prepare(prepared_input, *args, **kwargs)
-            status = pipeline.run()
-            if status.isErr():
-                raise RuntimeError(f"Error in flow execution {status.getInfo()}")
-            async for res in flow.post_deal_stream(pipeline):
-                yield res
         finally:
-            manager.release(pipeline)
+            if run is not None and not run.done():
+                # the request was cancelled while the pipeline is still running, hand it back once it stops
+                run.add_done_callback(lambda _: pool.release(pipeline, new))
+            else:
+                pool.release(pipeline, new)
+
+    @staticmethod
+    def _settle_build(pool: PipelinePool, build) -> None:
+        if build.cancelled() or build.exception() is not None:
+            pool.discard()
+        else:
+            pool.release(build.result(), new=True)
 
 
 class SchedulerSingleton:
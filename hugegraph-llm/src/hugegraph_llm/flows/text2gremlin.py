@@ -40,6 +40,7 @@ class Text2GremlinFlow(BaseFlow):
         schema_input: str,
         gremlin_prompt_input: Optional[str],
         requested_outputs: Optional[List[str]],
+        graph_client_config: Optional[Dict[str, Any]] = None,
         **kwargs,
     ):
         # sanitize example_num to [0,10], fallback to 2 if invalid
@@ -67,6 +68,7 @@ class Text2GremlinFlow(BaseFlow):
         prepared_input.schema = schema_input
         prepared_input.gremlin_prompt = gremlin_prompt_input
         prepared_input.requested_outputs = req
+        prepared_input.graph_client_config = graph_client_config
 
     def build_flow(
         self,
@@ -87,6 +89,7 @@ class Text2GremlinFlow(BaseFlow):
             schema_input=schema_input,
             gremlin_prompt_input=gremlin_prompt_input,
             requested_outputs=requested_outputs,
+            **kwargs,
         )
 
         pipeline.createGParam(prepared_input, "wkflow_input")
@@ -0,0 +1,127 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from hugegraph_llm.config import resource_path
+from hugegraph_llm.utils.log import log
+
+MANIFEST_FILE_NAME = "chunk_manifest.json"
+# chunks of texts without a source name (e.g. pasted text) are only ever added, never found stale
+ANONYMOUS_SOURCE = ""
+
+
+def chunk_hash(chunk: str) -> str:
+    return hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+
+
+class ChunkManifest:
+    """
+    Content hashes of the chunks stored in a chunk vector index, grouped by the source document they came from.
+
+    ``plan`` diffs a new batch of chunks against it: chunks whose hash is already indexed are skipped, and
+    chunks a re-submitted source no longer produces are reported stale so they can be removed from the index.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.embed_dim: Optional[int] = None
+        self.sources: Dict[str, List[str]] = {}
+        # whether the manifest still matches the file on disk
+        self.persisted = False
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.embed_dim = data.get("embed_dim")
+                self.sources = {str(k): list(v) for k, v in data.get("sources", {}).items()}
+                self.persisted = True
+            except (OSError, ValueError, AttributeError, TypeError) as e:
+                log.warning("Ignoring unreadable chunk manifest %s: %s", path, e)
+
+    @staticmethod
+    def from_name(*name: str) -> "ChunkManifest":
+        return ChunkManifest(os.path.join(resource_path, *name, MANIFEST_FILE_NAME))
+
+    def indexed(self) -> Set[str]:
+        return {h for hashes in self.sources.values() for h in hashes}
+
+    def reset(self, embed_dim: Optional[int] = None, chunks: Iterable[str] = ()):
+        """Forget every source, optionally seeding the manifest with chunks that are already indexed."""
+        self.embed_dim = embed_dim
+        self.persisted = False
+        hashes = list(dict.fromkeys(chunk_hash(chunk) for chunk in chunks))
+        self.sources = {ANONYMOUS_SOURCE: hashes} if hashes else {}
+
+    def plan(
+        self, chunks: Sequence[str], chunk_sources: Optional[Sequence[Optional[str]]] = None
+    ) -> Tuple[List[str], Set[str], Dict[str, List[str]]]:
+        """
+        Diff the chunks against the manifest.
+
+        Returns the chunks to embed (deduplicated, in input order), the hashes of stale chunks and the
+        sources the manifest holds once both are applied.
+        """
+        hashes = [chunk_hash(chunk) for chunk in chunks]
+        to_add, stale, sources = self.plan_hashes(hashes, chunk_sources)
+        pending = set(to_add)
+        to_add_chunks = []
+        for chunk, h in zip(chunks, hashes):
+            if h in pending:
+                pending.remove(h)
+                to_add_chunks.append(chunk)
+        return to_add_chunks, stale, sources
+
+    def plan_hashes(
+        self, chunk_hashes: Sequence[str], chunk_sources: Optional[Sequence[Optional[str]]] = None
+    ) -> Tuple[List[str], Set[str], Dict[str, List[str]]]:
+        """Same as ``plan`` from the chunk hashes only, returns the hashes of the chunks to embed."""
+        if chunk_sources is not None and len(chunk_sources) != len(chunk_hashes):
+            raise ValueError("chunk_sources must have one source per chunk.")
+        submitted: Dict[str, List[str]] = {}
+        for i, h in enumerate(chunk_hashes):
+            source = (chunk_sources[i] if chunk_sources is not None else None) or ANONYMOUS_SOURCE
+            submitted.setdefault(source, []).append(h)
+
+        sources = dict(self.sources)
+        for source, hashes in submitted.items():
+            if source == ANONYMOUS_SOURCE:
+                hashes = sources.get(ANONYMOUS_SOURCE, []) + hashes
+            sources[source] = list(dict.fromkeys(hashes))
+
+        indexed = self.indexed()
+        to_add = [h for h in dict.fromkeys(chunk_hashes) if h not in indexed]
+        stale = indexed - {h for hashes in sources.values() for h in hashes}
+        return to_add, stale, sources
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_file = self.path + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"embed_dim": self.embed_dim, "sources": self.sources}, f)
+        os.replace(tmp_file, self.path)
+        self.persisted = True
+
+    @staticmethod
+    def clean(*name: str):
+        path = os.path.join(resource_path, *name, MANIFEST_FILE_NAME)
+        if os.path.exists(path):
+            os.remove(path)
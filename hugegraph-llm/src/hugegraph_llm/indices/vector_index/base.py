@@ -17,7 +17,7 @@
 
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Set, Union
+from typing import Any, Dict, Hashable, List, Optional, Set, Union
 
 
 class VectorStoreBase(ABC):
@@ -69,6 +69,22 @@ class VectorStoreBase(ABC):
             List[Any]: List of properties of the matched vectors.
         """
 
+    def search_batch(self, query_vectors: List[List[float]], top_k: int, dis_threshold: float = 0.9) -> List[List[Any]]:
+        """
+        Search the top_k most similar vectors for several query vectors at once.
+
+        Stores with a native multi-query search override this, the default searches one by one.
+
+        Args:
+            query_vectors (List[List[float]]): The vectors to query against the index.
+            top_k (int): Number of top results to return per query vector.
+            dis_threshold (float): Distance threshold below which results are considered relevant.
+
+        Returns:
+            List[List[Any]]: The properties of the matched vectors of each query, in query order.
+        """
+        return [self.search(query_vector, top_k, dis_threshold) for query_vector in query_vectors]
+
     @abstractmethod
     def save_index_by_name(self, *name: str):
         """
@@ -90,6 +106,15 @@ class VectorStoreBase(ABC):
         #TODO: finish comment
         """
 
+    @staticmethod
+    def index_version(*name: str) -> Optional[Hashable]:
+        """
+        Return a value that changes whenever the stored index changes, used to reuse loaded indexes.
+
+        The default None means the version is unknown and the index is loaded on every use.
+        """
+        return None
+
     @staticmethod
     @abstractmethod
     def exist(*name: str) -> bool:
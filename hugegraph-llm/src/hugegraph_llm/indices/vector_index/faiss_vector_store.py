@@ -15,69 +15,213 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import json
 import os
 import pickle as pkl
 from copy import deepcopy
-from typing import Any, Dict, List, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import faiss
 import numpy as np
 
-from hugegraph_llm.config import resource_path
+from hugegraph_llm.config import index_settings, resource_path
 from hugegraph_llm.indices.vector_index.base import VectorStoreBase
+from hugegraph_llm.indices.vector_index.property_store import MmapProperties, write_properties
 from hugegraph_llm.utils.log import log
 
 INDEX_FILE_NAME = "index.faiss"
+# pickled properties of indexes saved before the property store, only read
 PROPERTIES_FILE_NAME = "properties.pkl"
+# properties in a compact layout that can be memory-mapped
+PROPERTY_STORE_FILE_NAME = "properties.bin"
+# layout of the saved index, so it is reloaded as saved whatever the current index_settings are
+META_FILE_NAME = "index_meta.json"
+INDEX_TYPES = ("Flat", "IVFFlat", "IVFPQ", "HNSW")
+# faiss warns when a k-means centroid gets fewer training points than this
+MIN_POINTS_PER_CENTROID = 39
 
 
 class FaissVectorIndex(VectorStoreBase):
-    def __init__(self, embed_dim: int = 1024):
-        self.index = faiss.IndexFlatL2(embed_dim)
-        self.properties: list[Any] = []
+    """
+    Faiss index whose vectors carry stable int64 ids, so removals never shift rows.
+
+    ``_props`` maps id -> property and ``_prop_ids`` maps each hashable property to its ids, which makes
+    ``remove`` proportional to the removed entries.
+
+    ``index_type`` (default ``index_settings.faiss_index_type``) selects the layout: "Flat" is an exact
+    ``IndexIDMap(IndexFlatL2)``, "HNSW" an ``IndexIDMap(IndexHNSWFlat)``. "IVFFlat"/"IVFPQ" start as Flat and
+    are trained into an IVF index once they hold enough vectors for ``faiss_ivf_nlist`` centroids.
+
+    The properties are saved to a property store (``properties.bin``), the pickle of older indexes is only read
+    until they are saved again. With ``index_settings.faiss_mmap`` (off by default) ``from_name`` maps the saved
+    index and property store read-only instead of loading them, so opening is cheap and processes share the
+    pages. The first ``add`` or ``remove`` copies both into memory.
+    """
+
+    def __init__(self, embed_dim: int = 1024, index_type: Optional[str] = None):
+        self.index_type = index_type or index_settings.faiss_index_type
+        if self.index_type not in INDEX_TYPES:
+            raise ValueError(f"Unsupported faiss index type {self.index_type!r}, expected one of {INDEX_TYPES}")
+        # runtime search knobs, fall back to index_settings when unset
+        self.nprobe: Optional[int] = None
+        self.ef_search: Optional[int] = None
+        self.index = self._new_index(embed_dim)
+        self._props: Dict[int, Any] = {}
+        self._prop_ids: Dict[Any, List[int]] = {}
+        self._next_id = 0
+        self.mapped = False
+
+    def _new_index(self, embed_dim: int) -> faiss.Index:
+        if self.index_type == "HNSW":
+            return faiss.IndexIDMap(faiss.IndexHNSWFlat(embed_dim, index_settings.faiss_hnsw_m))
+        return faiss.IndexIDMap(faiss.IndexFlatL2(embed_dim))
+
+    def _inner_index(self) -> faiss.Index:
+        if isinstance(self.index, faiss.IndexIDMap):
+            return faiss.downcast_index(self.index.index)
+        return self.index
+
+    def _export_vectors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the (vectors, ids) of an IndexIDMap based index, in insertion order."""
+        vectors = self._inner_index().reconstruct_n(0, self.index.ntotal)
+        return vectors, faiss.vector_to_array(self.index.id_map)
+
+    @property
+    def properties(self) -> list[Any]:
+        return list(self._props.values())
+
+    def _materialize(self):
+        """Copy a memory-mapped index and its properties into memory before they are modified."""
+        if not self.mapped:
+            return
+        self.index = faiss.deserialize_index(faiss.serialize_index(self.index))
+        self._set_entries(dict(self._props.items()))
+        self.mapped = False
+        self._train_if_ready()
+
+    def _set_entries(self, props: Dict[int, Any]):
+        self._props = {}
+        self._prop_ids = {}
+        self._register(list(props), list(props.values()))
+        self._next_id = max(props) + 1 if props else 0
+
+    def _register(self, ids: List[int], props: List[Any]):
+        for vid, prop in zip(ids, props):
+            self._props[vid] = prop
+            try:
+                self._prop_ids.setdefault(prop, []).append(vid)
+            except TypeError:
+                # unhashable properties (e.g. gremlin examples) can't be removed by value anyway
+                pass
+
+    def _ivf_factory(self, embed_dim: int) -> str:
+        nlist = index_settings.faiss_ivf_nlist
+        if self.index_type == "IVFFlat":
+            return f"IVF{nlist},Flat"
+        pq_m = index_settings.faiss_pq_m
+        if embed_dim % pq_m != 0:
+            # PQ splits the vector into pq_m equal sub-vectors
+            pq_m = max(m for m in range(1, pq_m + 1) if embed_dim % m == 0)
+            log.warning("embed_dim %s is not divisible by faiss_pq_m, use %s sub-quantizers.", embed_dim, pq_m)
+        return f"IVF{nlist},PQ{pq_m}"
+
+    def _train_if_ready(self):
+        if not self.index_type.startswith("IVF") or isinstance(self.index, faiss.IndexIVF):
+            return
+        if self.index.ntotal < index_settings.faiss_ivf_nlist * MIN_POINTS_PER_CENTROID:
+            return
+        vectors, ids = self._export_vectors()
+        spec = self._ivf_factory(self.index.d)
+        ivf_index = faiss.index_factory(self.index.d, spec, faiss.METRIC_L2)
+        ivf_index.train(vectors)
+        ivf_index.add_with_ids(vectors, ids)
+        self.index = ivf_index
+        log.info("Trained faiss %s index on %s vectors.", spec, len(ids))
+
+    def _apply_search_params(self):
+        inner = self._inner_index()
+        if isinstance(inner, faiss.IndexIVF):
+            inner.nprobe = self.nprobe or index_settings.faiss_nprobe
+        elif isinstance(inner, faiss.IndexHNSW):
+            inner.hnsw.efSearch = self.ef_search or index_settings.faiss_ef_search
 
     def save_index_by_name(self, *name: str):
         os.makedirs(os.path.join(resource_path, *name), exist_ok=True)
         index_file = os.path.join(resource_path, *name, INDEX_FILE_NAME)
         properties_file = os.path.join(resource_path, *name, PROPERTIES_FILE_NAME)
-        faiss.write_index(self.index, index_file)
-        with open(properties_file, "wb") as f:
-            pkl.dump(self.properties, f)
+        store_file = os.path.join(resource_path, *name, PROPERTY_STORE_FILE_NAME)
+        meta_file = os.path.join(resource_path, *name, META_FILE_NAME)
+        props = dict(self._props.items()) if self.mapped else self._props
+        # write to temp files and rename them, the files may be memory-mapped by other readers
+        faiss.write_index(self.index, index_file + ".tmp")
+        write_properties(store_file + ".tmp", props)
+        with open(meta_file + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"index_type": self.index_type}, f)
+        for file in (index_file, store_file, meta_file):
+            os.replace(file + ".tmp", file)
+        # the legacy pickle is superseded by the property store
+        if os.path.exists(properties_file):
+            os.remove(properties_file)
 
     def add(self, vectors: List[List[float]], props: List[Any]):
         if len(vectors) == 0:
             return
+        self._materialize()
         if self.index.ntotal == 0 and len(vectors[0]) != self.index.d:
-            self.index = faiss.IndexFlatL2(len(vectors[0]))
-        self.index.add(np.array(vectors))
-        self.properties.extend(props)
+            self.index = self._new_index(len(vectors[0]))
+        ids = np.arange(self._next_id, self._next_id + len(vectors), dtype=np.int64)
+        self.index.add_with_ids(np.array(vectors, dtype=np.float32), ids)
+        self._next_id += len(vectors)
+        self._register(ids.tolist(), props)
+        self._train_if_ready()
 
     def remove(self, props: Union[Set[Any], List[Any]]) -> int:
         if isinstance(props, list):
             props = set(props)
-        indices = []
-        remove_num = 0
-
-        for i, p in enumerate(self.properties):
-            if p in props:
-                indices.append(i)
-                remove_num += 1
-        self.index.remove_ids(np.array(indices))
-        self.properties = [p for i, p in enumerate(self.properties) if i not in indices]
-        return remove_num
+        if not props:
+            return 0
+        self._materialize()
+        ids = [vid for p in props for vid in self._prop_ids.pop(p, ())]
+        if not ids:
+            return 0
+        removed = np.array(ids, dtype=np.int64)
+        if isinstance(self._inner_index(), faiss.IndexHNSW):
+            # HNSW graphs don't support deletion, rebuild from the remaining vectors
+            vectors, all_ids = self._export_vectors()
+            keep = ~np.isin(all_ids, removed)
+            self.index = self._new_index(self.index.d)
+            self.index.add_with_ids(vectors[keep], all_ids[keep])
+        else:
+            self.index.remove_ids(removed)
+        for vid in ids:
+            del self._props[vid]
+        return len(ids)
 
     def search(self, query_vector: List[float], top_k: int, dis_threshold: float = 0.9) -> List[Any]:
+        return self.search_batch([query_vector], top_k, dis_threshold)[0]
+
+    def search_batch(self, query_vectors: List[List[float]], top_k: int, dis_threshold: float = 0.9) -> List[List[Any]]:
         if self.index.ntotal == 0:
+            return [[] for _ in query_vectors]
+        if not query_vectors:
             return []
 
-        if len(query_vector) != self.index.d:
+        if any(len(query_vector) != self.index.d for query_vector in query_vectors):
             raise ValueError("Query vector dimension does not match index dimension!")
 
-        distances, indices = self.index.search(np.array([query_vector]), top_k)
+        self._apply_search_params()
+        # one matrix search for all the queries
+        distances, indices = self.index.search(np.array(query_vectors, dtype=np.float32), top_k)
+        return [self._collect_results(dists, ids, dis_threshold) for dists, ids in zip(distances, indices)]
+
+    def _collect_results(self, distances: np.ndarray, ids: np.ndarray, dis_threshold: float) -> List[Any]:
         results = []
-        for dist, i in zip(distances[0], indices[0]):
+        for dist, i in zip(distances, ids):
+            # faiss pads the result with id -1 when it finds fewer than top_k vectors
+            if i == -1:
+                continue
             if dist < dis_threshold:
-                results.append(deepcopy(self.properties[i]))
+                results.append(deepcopy(self._props[int(i)]))
                 log.debug("[✓] Add valid distance %s to results.", dist)
             else:
                 log.debug(
@@ -95,44 +239,133 @@ class FaissVectorIndex(VectorStoreBase):
     ) -> Dict:
         return {
             "embed_dim": self.index.d,
+            "index_type": self.index_type,
             "vector_info": {
                 "chunk_vector_num": self.index.ntotal,
                 "graph_vid_vector_num": self.index.ntotal,
-                "graph_properties_vector_num": len(self.properties),
+                "graph_properties_vector_num": len(self._props),
             },
+            "mapped": self.mapped,
         }
 
     @staticmethod
     def clean(*name: str):
         index_file = os.path.join(resource_path, *name, INDEX_FILE_NAME)
         properties_file = os.path.join(resource_path, *name, PROPERTIES_FILE_NAME)
-        if os.path.exists(index_file):
-            os.remove(index_file)
-        if os.path.exists(properties_file):
-            os.remove(properties_file)
+        store_file = os.path.join(resource_path, *name, PROPERTY_STORE_FILE_NAME)
+        meta_file = os.path.join(resource_path, *name, META_FILE_NAME)
+        for file in (index_file, properties_file, store_file, meta_file):
+            if os.path.exists(file):
+                os.remove(file)
+
+    @staticmethod
+    def _saved_index_type(faiss_index: faiss.Index, *name: str) -> str:
+        """The layout the index was saved with, inferred from the faiss index for indexes saved without meta."""
+        meta_file = os.path.join(resource_path, *name, META_FILE_NAME)
+        try:
+            with open(meta_file, "r", encoding="utf-8") as f:
+                index_type = json.load(f).get("index_type")
+            if index_type in INDEX_TYPES:
+                return index_type
+        except (OSError, ValueError, AttributeError):
+            pass
+        inner = faiss_index
+        if isinstance(faiss_index, faiss.IndexIDMap):
+            inner = faiss.downcast_index(faiss_index.index)
+        if isinstance(inner, faiss.IndexIVFPQ):
+            return "IVFPQ"
+        if isinstance(inner, faiss.IndexIVF):
+            return "IVFFlat"
+        if isinstance(inner, faiss.IndexHNSW):
+            return "HNSW"
+        # a flat index may also be an IVF one that was not trained yet
+        return index_settings.faiss_index_type if index_settings.faiss_index_type != "HNSW" else "Flat"
+
+    @staticmethod
+    def _has_property_store(*name: str) -> bool:
+        """Whether the index was saved with a property store, rather than only with the legacy pickle."""
+        index_file = os.path.join(resource_path, *name, INDEX_FILE_NAME)
+        store_file = os.path.join(resource_path, *name, PROPERTY_STORE_FILE_NAME)
+        # a store older than the index was left behind by a version that saved the pickle only
+        return os.path.exists(store_file) and os.path.getmtime(store_file) >= os.path.getmtime(index_file)
 
     @staticmethod
     def from_name(embed_dim: int, *name: str) -> "FaissVectorIndex":
         index_file = os.path.join(resource_path, *name, INDEX_FILE_NAME)
         properties_file = os.path.join(resource_path, *name, PROPERTIES_FILE_NAME)
-        if not os.path.exists(index_file) or not os.path.exists(properties_file):
+        store_file = os.path.join(resource_path, *name, PROPERTY_STORE_FILE_NAME)
+        if not FaissVectorIndex.exist(*name):
             log.warning("No index file found, create a new one.")
             return FaissVectorIndex(embed_dim)
+        has_store = FaissVectorIndex._has_property_store(*name)
+        if has_store and index_settings.faiss_mmap:
+            mapped = FaissVectorIndex._from_mapped_files(embed_dim, *name)
+            if mapped is not None:
+                return mapped
 
         faiss_index = faiss.read_index(index_file)
-        with open(properties_file, "rb") as f:
-            properties = pkl.load(f)
-        vector_index = FaissVectorIndex(embed_dim)
+        if has_store:
+            properties = dict(MmapProperties(store_file).items())
+        elif os.path.exists(properties_file):
+            with open(properties_file, "rb") as f:
+                properties = pkl.load(f)
+        else:
+            log.warning("The properties of index %s are outdated, create a new one.", index_file)
+            return FaissVectorIndex(embed_dim)
+        vector_index = FaissVectorIndex(embed_dim, FaissVectorIndex._saved_index_type(faiss_index, *name))
         if faiss_index.d == vector_index.index.d:
             # when dim same, use old
+            if isinstance(properties, list):
+                # indexes saved before the id layout address vectors by row, re-add them with row ids
+                ids = np.arange(faiss_index.ntotal, dtype=np.int64)
+                if not isinstance(faiss_index, faiss.IndexIDMap):
+                    vectors = faiss_index.reconstruct_n(0, faiss_index.ntotal)
+                    faiss_index = faiss.IndexIDMap(faiss.IndexFlatL2(faiss_index.d))
+                    faiss_index.add_with_ids(vectors, ids)
+                else:
+                    ids = faiss.vector_to_array(faiss_index.id_map)
+                properties = dict(zip(ids.tolist(), properties))
             vector_index.index = faiss_index
-            vector_index.properties = properties
+            vector_index._set_entries(properties)
+            vector_index._train_if_ready()
         else:
             log.warning("dim is different, create a new one.")
         return vector_index
 
+    @staticmethod
+    def _from_mapped_files(embed_dim: int, *name: str) -> Optional["FaissVectorIndex"]:
+        index_file = os.path.join(resource_path, *name, INDEX_FILE_NAME)
+        store_file = os.path.join(resource_path, *name, PROPERTY_STORE_FILE_NAME)
+        flags = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY
+        try:
+            faiss_index = faiss.read_index(index_file, flags)
+            properties = MmapProperties(store_file)
+        except (RuntimeError, OSError, ValueError) as e:
+            log.warning("Failed to map the faiss index %s, load it into memory instead: %s", index_file, e)
+            return None
+        vector_index = FaissVectorIndex(embed_dim, FaissVectorIndex._saved_index_type(faiss_index, *name))
+        if faiss_index.d != vector_index.index.d or len(properties) != faiss_index.ntotal:
+            return None
+        vector_index.index = faiss_index
+        vector_index._props = properties  # type: ignore[assignment]
+        vector_index._next_id = properties.max_id() + 1
+        vector_index.mapped = True
+        return vector_index
+
+    @staticmethod
+    def index_version(*name: str) -> Tuple[Optional[Tuple[int, int]], ...]:
+        versions = []
+        for file_name in (INDEX_FILE_NAME, PROPERTIES_FILE_NAME, PROPERTY_STORE_FILE_NAME):
+            try:
+                stat = os.stat(os.path.join(resource_path, *name, file_name))
+                versions.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                versions.append(None)
+        return tuple(versions)
+
     @staticmethod
     def exist(*name: str) -> bool:
         index_file = os.path.join(resource_path, *name, INDEX_FILE_NAME)
         properties_file = os.path.join(resource_path, *name, PROPERTIES_FILE_NAME)
-        return os.path.exists(index_file) and os.path.exists(properties_file)
+        store_file = os.path.join(resource_path, *name, PROPERTY_STORE_FILE_NAME)
+        return os.path.exists(index_file) and (os.path.exists(store_file) or os.path.exists(properties_file))
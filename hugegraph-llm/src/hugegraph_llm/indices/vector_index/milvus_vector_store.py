@@ -148,40 +148,44 @@ class MilvusVectorIndex(VectorStoreBase):
             self.collection.release()
 
     def search(self, query_vector: List[float], top_k: int, dis_threshold: float = 0.9) -> List[Any]:
+        return self.search_batch([query_vector], top_k, dis_threshold)[0]
+
+    def search_batch(self, query_vectors: List[List[float]], top_k: int, dis_threshold: float = 0.9) -> List[List[Any]]:
         try:
-            if self.collection.num_entities == 0:
-                return []
+            if self.collection.num_entities == 0 or not query_vectors:
+                return [[] for _ in query_vectors]
 
             self.collection.load()
             search_params = {"metric_type": "L2", "params": {"nprobe": 10}}
+            # milvus searches all the query vectors in one request, returning the hits per query
             results = self.collection.search(
-                data=[query_vector],
+                data=query_vectors,
                 anns_field="embedding",
                 param=search_params,
                 limit=top_k,
                 output_fields=["property"],
             )
-
-            ret = []
-            for hits in results:
-                for hit in hits:
-                    if hit.distance < dis_threshold:
-                        prop_str = hit.entity.get("property")
-                        prop = self._serialize_property(prop_str)
-                        ret.append(prop)
-                        log.debug("[✓] Add valid distance %s to results.", hit.distance)
-                    else:
-                        log.debug(
-                            "[x] Distance %s >= threshold %s, ignore this result.",
-                            hit.distance,
-                            dis_threshold,
-                        )
-
-            return ret
+            return [self._collect_hits(hits, dis_threshold) for hits in results]
 
         finally:
             self.collection.release()
 
+    def _collect_hits(self, hits, dis_threshold: float) -> List[Any]:
+        ret = []
+        for hit in hits:
+            if hit.distance < dis_threshold:
+                prop_str = hit.entity.get("property")
+                prop = self._serialize_property(prop_str)
+                ret.append(prop)
+                log.debug("[✓] Add valid distance %s to results.", hit.distance)
+            else:
+                log.debug(
+                    "[x] Distance %s >= threshold %s, ignore this result.",
+                    hit.distance,
+                    dis_threshold,
+                )
+        return ret
+
     def get_all_properties(self) -> list[str]:
         if self.collection.num_entities == 0:
             return []
@@ -0,0 +1,95 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import mmap
+import pickle as pkl
+import struct
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+
+import numpy as np
+
+MAGIC = b"HGPROPS1"
+HEADER = struct.Struct("<8sQ")
+
+
+def write_properties(path: str, props: Dict[int, Any]):
+    """
+    Write ``props`` (vector id -> property) in a compact layout that ``MmapProperties`` can map.
+
+    The file holds a header (magic, count), the sorted int64 ids, count + 1 uint64 offsets into the data
+    section and the pickled properties back to back.
+    """
+    ids = np.array(sorted(props), dtype="<i8")
+    blobs = [pkl.dumps(props[int(vid)], protocol=pkl.HIGHEST_PROTOCOL) for vid in ids]
+    offsets = np.zeros(len(blobs) + 1, dtype="<u8")
+    np.cumsum([len(blob) for blob in blobs], out=offsets[1:])
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(ids)))
+        f.write(ids.tobytes())
+        f.write(offsets.tobytes())
+        for blob in blobs:
+            f.write(blob)
+
+
+class MmapProperties(Mapping):
+    """
+    Read-only id -> property mapping over a memory-mapped ``write_properties`` file.
+
+    Only the ids and offsets are looked at on open, a property is unpickled when it is accessed, and the
+    pages are shared by every process that maps the same file.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a property store file")
+        self._ids = np.frombuffer(self._mm, dtype="<i8", count=count, offset=HEADER.size)
+        self._offsets = np.frombuffer(self._mm, dtype="<u8", count=count + 1, offset=HEADER.size + 8 * count)
+        self._data_start = HEADER.size + 16 * count + 8
+
+    def _position(self, vid: int) -> int:
+        pos = int(np.searchsorted(self._ids, vid))
+        if pos == len(self._ids) or self._ids[pos] != vid:
+            raise KeyError(vid)
+        return pos
+
+    def __getitem__(self, vid: int) -> Any:
+        pos = self._position(vid)
+        start = self._data_start + int(self._offsets[pos])
+        end = self._data_start + int(self._offsets[pos + 1])
+        return pkl.loads(self._mm[start:end])
+
+    def __contains__(self, vid: object) -> bool:
+        try:
+            self._position(vid)  # type: ignore[arg-type]
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[int]:
+        return (int(vid) for vid in self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def max_id(self) -> int:
+        return int(self._ids[-1]) if len(self._ids) else -1
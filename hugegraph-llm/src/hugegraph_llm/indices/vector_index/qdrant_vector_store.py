@@ -118,10 +118,25 @@ class QdrantVectorIndex(VectorStoreBase):
 
     def search(self, query_vector: List[float], top_k: int = 5, dis_threshold: float = 0.9):
         search_result = self.client.search(collection_name=self.name, query_vector=query_vector, limit=top_k)
+        return self._collect_hits(search_result, dis_threshold)
 
+    def search_batch(self, query_vectors: List[List[float]], top_k: int, dis_threshold: float = 0.9) -> List[List[Any]]:
+        if not query_vectors:
+            return []
+        search_results = self.client.search_batch(
+            collection_name=self.name,
+            requests=[
+                models.SearchRequest(vector=query_vector, limit=top_k, with_payload=True)
+                for query_vector in query_vectors
+            ],
+        )
+        return [self._collect_hits(hits, dis_threshold) for hits in search_results]
+
+    @staticmethod
+    def _collect_hits(hits, dis_threshold: float) -> List[Any]:
         result_properties = []
 
-        for hit in search_result:
+        for hit in hits:
             distance = 1.0 - hit.score
             if distance < dis_threshold:
                 if hit.payload is not None:
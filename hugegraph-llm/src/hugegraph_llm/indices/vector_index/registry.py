@@ -0,0 +1,154 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterator, Tuple
+
+from hugegraph_llm.indices.vector_index.base import VectorStoreBase
+from hugegraph_llm.utils.log import log
+
+IndexKey = Tuple[type, int, Tuple[str, ...]]
+
+
+class ReadWriteLock:
+    """Any number of readers or a single writer; waiting writers go before new readers."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._cond:
+            while self._writing or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writing or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+
+class VectorIndexRegistry:
+    """
+    Process-wide cache of loaded vector indexes, keyed by (store class, embed dim, index name).
+
+    An entry is reused as long as ``index_version`` of its store reports the same version, so an index
+    saved by a build is reloaded on the next ``get``. Only readers should use the shared instances, builders
+    keep loading a private one with ``from_name``. Stores that can't report a version are never cached.
+    """
+
+    def __init__(self):
+        self._lock = ReadWriteLock()
+        self._entries: Dict[IndexKey, Tuple[Hashable, VectorStoreBase]] = {}
+        # one loader per index, so concurrent misses don't load the same files twice
+        self._load_locks: Dict[IndexKey, threading.Lock] = {}
+        self._load_locks_guard = threading.Lock()
+        # readers share the read lock, so the counters have their own mutex
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, vector_index: type, embed_dim: int, *name: str) -> Any:
+        if not (isinstance(vector_index, type) and issubclass(vector_index, VectorStoreBase)):
+            return vector_index.from_name(embed_dim, *name)
+        version = vector_index.index_version(*name)
+        if version is None:
+            return vector_index.from_name(embed_dim, *name)
+
+        key = (vector_index, embed_dim, tuple(name))
+        entry = self._lookup(key, version)
+        if entry is not None:
+            return entry
+        with self._load_lock(key):
+            # another request may have loaded it meanwhile
+            entry = self._lookup(key, version)
+            if entry is not None:
+                return entry
+            index = vector_index.from_name(embed_dim, *name)
+            with self._lock.write():
+                self._entries[key] = (version, index)
+            with self._stats_lock:
+                self.misses += 1
+            log.debug("Loaded vector index %s into the registry.", "/".join(name))
+            return index
+
+    def _lookup(self, key: IndexKey, version: Hashable):
+        with self._lock.read():
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                return None
+        with self._stats_lock:
+            self.hits += 1
+        return entry[1]
+
+    def _load_lock(self, key: IndexKey) -> threading.Lock:
+        with self._load_locks_guard:
+            return self._load_locks.setdefault(key, threading.Lock())
+
+    def invalidate(self, *name: str) -> None:
+        """Drop the cached instances of the index ``name`` (of every store class and dimension)."""
+        with self._lock.write():
+            for key in [key for key in self._entries if key[2] == tuple(name)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock.write():
+            self._entries.clear()
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock.read():
+            indexes = len(self._entries)
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+            "indexes": indexes,
+        }
+
+
+vector_index_registry = VectorIndexRegistry()
@@ -0,0 +1,232 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from hugegraph_llm.config import llm_settings, resource_path
+from hugegraph_llm.models.embeddings.base import BaseEmbedding
+from hugegraph_llm.utils.log import log
+
+CACHE_DIR_NAME = "embedding_cache"
+CACHE_FILE_NAME = "embeddings.db"
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding store: an in-memory LRU in front of a size-bounded SQLite table.
+
+    Keys are sha256(api base + model name + text), so a cached vector is reused only for the same text,
+    model and endpoint.
+    When the table grows over ``max_entries`` the least recently used rows are evicted (0 = unbounded).
+    """
+
+    def __init__(self, db_path: Optional[str] = None, memory_size: int = 10000, max_entries: int = 0):
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL, accessed REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_accessed ON embeddings (accessed)")
+            self._conn.commit()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model_name: str, text: str, api_base: str = "") -> str:
+        return hashlib.sha256(f"{api_base}\x00{model_name}\x00{text}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, vector: List[float]):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Return the cached vectors of the given keys, missing keys are left out."""
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+            self.memory_hits += len(found)
+            pending = [key for key in dict.fromkeys(keys) if key not in found]
+            if pending and self._conn is not None:
+                for start in range(0, len(pending), 500):
+                    part = pending[start : start + 500]
+                    rows = self._conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(part))})",
+                        part,
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = np.frombuffer(blob, dtype=np.float32).tolist()
+                        found[key] = vector
+                        self._remember(key, vector)
+                        self.disk_hits += 1
+                    if rows:
+                        now = time.time()
+                        self._conn.executemany(
+                            "UPDATE embeddings SET accessed = ? WHERE key = ?", [(now, key) for key, _ in rows]
+                        )
+                self._conn.commit()
+            self.misses += len([key for key in pending if key not in found])
+        return found
+
+    def put_many(self, vectors: Dict[str, List[float]]):
+        if not vectors:
+            return
+        with self._lock:
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+            if self._conn is None:
+                return
+            now = time.time()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, accessed) VALUES (?, ?, ?)",
+                [(key, np.asarray(vector, dtype=np.float32).tobytes(), now) for key, vector in vectors.items()],
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        if self.max_entries <= 0:
+            return
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        if count > self.max_entries:
+            # evict 10% below the bound, so a full cache doesn't evict on every insert
+            excess = count - int(self.max_entries * 0.9)
+            self._conn.execute(
+                "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY accessed LIMIT ?)",
+                (excess,),
+            )
+            log.debug("Evicted %s embeddings from the cache.", excess)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM embeddings")
+                self._conn.commit()
+            self.memory_hits = self.disk_hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            total = hits + self.misses
+            disk_entries = (
+                self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] if self._conn is not None else 0
+            )
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": hits / total if total else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": disk_entries,
+            }
+
+
+class CachedEmbedding(BaseEmbedding):
+    """
+    Wrap a BaseEmbedding so only the texts missing from the EmbeddingCache reach the embedding service.
+    """
+
+    def __init__(self, embedding: BaseEmbedding, cache: EmbeddingCache, model_name: Optional[str] = None):
+        self.embedding = embedding
+        self.cache = cache
+        self.model_name = model_name or f"{type(embedding).__name__}/{getattr(embedding, 'model', '')}"
+        # two endpoints may serve different models under the same name
+        self.endpoint = getattr(embedding, "api_base", None) or ""
+
+    def __getattr__(self, name: str):
+        # expose backend attributes such as `model` or `embedding_dimension`
+        if name == "embedding":
+            raise AttributeError(name)
+        return getattr(self.embedding, name)
+
+    def _lookup(self, texts: List[str]):
+        keys = [self.cache.make_key(self.model_name, text, self.endpoint) for text in texts]
+        found = self.cache.get_many(keys)
+        # duplicated texts are embedded once
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        return keys, found, missing
+
+    def get_embedding_dim(self) -> int:
+        return self.embedding.get_embedding_dim()
+
+    def get_text_embedding(self, text: str) -> List[float]:
+        return self.get_texts_embeddings([text])[0]
+
+    def get_texts_embeddings(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+        keys, found, missing = self._lookup(texts)
+        if missing:
+            vectors = self.embedding.get_texts_embeddings(list(missing.values()), batch_size)
+            computed = dict(zip(missing, vectors))
+            self.cache.put_many(computed)
+            found.update(computed)
+        return [found[key] for key in keys]
+
+    async def async_get_text_embedding(self, text: str) -> List[float]:
+        return (await self.async_get_texts_embeddings([text]))[0]
+
+    async def async_get_texts_embeddings(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+        keys, found, missing = self._lookup(texts)
+        if missing:
+            vectors = await self.embedding.async_get_texts_embeddings(list(missing.values()), batch_size)
+            computed = dict(zip(missing, vectors))
+            self.cache.put_many(computed)
+            found.update(computed)
+        return [found[key] for key in keys]
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache stored under the resource directory."""
+    global _cache  # pylint: disable=global-statement
+    with _cache_lock:
+        if _cache is None:
+            _cache = EmbeddingCache(
+                os.path.join(resource_path, CACHE_DIR_NAME, CACHE_FILE_NAME),
+                memory_size=llm_settings.embedding_cache_memory_size,
+                max_entries=llm_settings.embedding_cache_max_entries,
+            )
+        return _cache
+
+
+def with_embedding_cache(embedding: BaseEmbedding) -> BaseEmbedding:
+    if not llm_settings.embedding_cache_enabled or isinstance(embedding, CachedEmbedding):
+        return embedding
+    return CachedEmbedding(embedding, get_embedding_cache())
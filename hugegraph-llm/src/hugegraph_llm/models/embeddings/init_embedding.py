@@ -17,6 +17,7 @@
 
 
 from hugegraph_llm.config import LLMConfig, llm_settings
+from hugegraph_llm.models.embeddings.cache import with_embedding_cache
 from hugegraph_llm.models.embeddings.litellm import LiteLLMEmbedding
 from hugegraph_llm.models.embeddings.ollama import OllamaEmbedding
 from hugegraph_llm.models.embeddings.openai import OpenAIEmbedding
@@ -30,25 +31,26 @@ model_map = {
 
 def get_embedding(llm_configs: LLMConfig):
     if llm_configs.embedding_type == "openai":
-        return OpenAIEmbedding(
+        embedding = OpenAIEmbedding(
             model_name=llm_configs.openai_embedding_model,
             api_key=llm_configs.openai_embedding_api_key,
             api_base=llm_configs.openai_embedding_api_base,
         )
-    if llm_configs.embedding_type == "ollama/local":
-        return OllamaEmbedding(
+    elif llm_configs.embedding_type == "ollama/local":
+        embedding = OllamaEmbedding(
             model=llm_configs.ollama_embedding_model,
             host=llm_configs.ollama_embedding_host,
             port=llm_configs.ollama_embedding_port,
         )
-    if llm_configs.embedding_type == "litellm":
-        return LiteLLMEmbedding(
+    elif llm_configs.embedding_type == "litellm":
+        embedding = LiteLLMEmbedding(
             model_name=llm_configs.litellm_embedding_model,
             api_key=llm_configs.litellm_embedding_api_key,
             api_base=llm_configs.litellm_embedding_api_base,
         )
-
-    raise ValueError("embedding type is not supported !")
+    else:
+        raise ValueError("embedding type is not supported !")
+    return with_embedding_cache(embedding)
 
 
 class Embeddings:
@@ -66,11 +68,11 @@ class Embeddings:
             )
             # Dynamically get actual dimension
             try:
-                test_vec = embedding.get_text_embedding("test")
+                test_vec = with_embedding_cache(embedding).get_text_embedding("test")
                 embedding.embedding_dimension = len(test_vec)
             except Exception:  # pylint: disable=broad-except
                 pass  # Keep default dimension
-            return embedding
+            return with_embedding_cache(embedding)
         if self.embedding_type == "ollama/local":
             # Create with default dimension first
             embedding = OllamaEmbedding(
@@ -80,11 +82,11 @@ class Embeddings:
             )
             # Dynamically get actual dimension
             try:
-                test_vec = embedding.get_text_embedding("test")
+                test_vec = with_embedding_cache(embedding).get_text_embedding("test")
                 embedding.embedding_dimension = len(test_vec)
             except Exception:  # pylint: disable=broad-except
                 pass  # Keep default dimension
-            return embedding
+            return with_embedding_cache(embedding)
         if self.embedding_type == "litellm":
             # For LiteLLM, we need to get dimension dynamically
             # Create a temporary instance to test dimension
@@ -96,7 +98,7 @@ class Embeddings:
             )
             # Get actual dimension
             try:
-                test_vec = temp_embedding.get_text_embedding("test")
+                test_vec = with_embedding_cache(temp_embedding).get_text_embedding("test")
                 actual_dim = len(test_vec)
             except Exception:  # pylint: disable=broad-except
                 actual_dim = 1536  # Fallback
@@ -108,6 +110,6 @@ class Embeddings:
                 api_key=llm_settings.litellm_embedding_api_key,
                 api_base=llm_settings.litellm_embedding_api_base,
             )
-            return embedding  # type: ignore
+            return with_embedding_cache(embedding)  # type: ignore
 
         raise Exception("embedding type is not supported !")
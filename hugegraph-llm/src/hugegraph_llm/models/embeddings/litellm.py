@@ -22,6 +22,8 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_ex
 
 from hugegraph_llm.models.embeddings.base import BaseEmbedding
 from hugegraph_llm.utils.log import log
+from hugegraph_llm.utils.rate_limiter import rate_limited
+from hugegraph_llm.utils.tracing import record_embedding_batch
 
 
 class LiteLLMEmbedding(BaseEmbedding):
@@ -49,6 +51,7 @@ class LiteLLMEmbedding(BaseEmbedding):
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry=retry_if_exception_type((RateLimitError, APIConnectionError, APIError)),
     )
+    @rate_limited("embedding")
     def get_text_embedding(self, text: str) -> List[float]:
         """Get embedding for a single text."""
         try:
@@ -64,6 +67,7 @@ class LiteLLMEmbedding(BaseEmbedding):
             log.error("Error in LiteLLM embedding call: %s", e)
             raise
 
+    @rate_limited("embedding")
     def get_texts_embeddings(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
         """Get embeddings for multiple texts with automatic batch splitting.
 
@@ -83,6 +87,7 @@ class LiteLLMEmbedding(BaseEmbedding):
         try:
             for i in range(0, len(texts), batch_size):
                 batch = texts[i : i + batch_size]
+                record_embedding_batch(len(batch))
                 response = embedding(
                     model=self.model,
                     input=batch,
@@ -96,6 +101,7 @@ class LiteLLMEmbedding(BaseEmbedding):
             log.error("Error in LiteLLM batch embedding call: %s", e)
             raise
 
+    @rate_limited("embedding")
     async def async_get_text_embedding(self, text: str) -> List[float]:
         """Get embedding for a single text asynchronously."""
         try:
@@ -111,6 +117,7 @@ class LiteLLMEmbedding(BaseEmbedding):
             log.error("Error in async LiteLLM embedding call: %s", e)
             raise
 
+    @rate_limited("embedding")
     async def async_get_texts_embeddings(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
         """Get embeddings for multiple texts asynchronously with automatic batch splitting.
 
@@ -130,6 +137,7 @@ class LiteLLMEmbedding(BaseEmbedding):
         try:
             for i in range(0, len(texts), batch_size):
                 batch = texts[i : i + batch_size]
+                record_embedding_batch(len(batch))
                 response = await aembedding(
                     model=self.model,
                     input=batch,
@@ -20,6 +20,9 @@ from typing import List
 
 import ollama
 
+from hugegraph_llm.utils.rate_limiter import rate_limited
+from hugegraph_llm.utils.tracing import record_embedding_batch
+
 from .base import BaseEmbedding
 
 
@@ -33,8 +36,9 @@ class OllamaEmbedding(BaseEmbedding):
         **kwargs,
     ):
         self.model = model
-        self.client = ollama.Client(host=f"http://{host}:{port}", **kwargs)
-        self.async_client = ollama.AsyncClient(host=f"http://{host}:{port}", **kwargs)
+        self.api_base = f"http://{host}:{port}"
+        self.client = ollama.Client(host=self.api_base, **kwargs)
+        self.async_client = ollama.AsyncClient(host=self.api_base, **kwargs)
         self.embedding_dimension = embedding_dimension
 
     def get_embedding_dim(
@@ -42,10 +46,12 @@ class OllamaEmbedding(BaseEmbedding):
     ) -> int:
         return self.embedding_dimension
 
+    @rate_limited("embedding")
     def get_text_embedding(self, text: str) -> List[float]:
         """Comment"""
         return list(self.client.embed(model=self.model, input=[text])["embeddings"][0])
 
+    @rate_limited("embedding")
     def get_texts_embeddings(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
         """Get embeddings for multiple texts with automatic batch splitting.
 
@@ -75,6 +81,7 @@ class OllamaEmbedding(BaseEmbedding):
         all_embeddings = []
         for i in range(0, len(texts), batch_size):
             batch = texts[i : i + batch_size]
+            record_embedding_batch(len(batch))
             response = self.client.embed(model=self.model, input=batch)
             all_embeddings.extend(self._get_embeddings_from_response(response))
         return all_embeddings
@@ -87,6 +94,7 @@ class OllamaEmbedding(BaseEmbedding):
             raise ValueError("Ollama embedding response returned no embeddings.")
         return [list(inner_sequence) for inner_sequence in embeddings]
 
+    @rate_limited("embedding")
     async def async_get_text_embedding(self, text: str) -> List[float]:
         """Get embedding for a single text asynchronously."""
         if not hasattr(self.async_client, "embed"):
@@ -99,6 +107,7 @@ class OllamaEmbedding(BaseEmbedding):
         response = await self.async_client.embed(model=self.model, input=[text])
         return self._get_embeddings_from_response(response)[0]
 
+    @rate_limited("embedding")
     async def async_get_texts_embeddings(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
         if not hasattr(self.async_client, "embed"):
             error_message = (
@@ -110,6 +119,7 @@ class OllamaEmbedding(BaseEmbedding):
         results: List[List[float]] = []
         for i in range(0, len(texts), batch_size):
             batch = texts[i : i + batch_size]
+            record_embedding_batch(len(batch))
             response = await self.async_client.embed(model=self.model, input=batch)
             results.extend(self._get_embeddings_from_response(response))
         return results
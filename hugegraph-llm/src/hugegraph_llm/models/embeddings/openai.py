@@ -21,6 +21,8 @@ from typing import List, Optional
 from openai import AsyncOpenAI, OpenAI
 
 from hugegraph_llm.models.embeddings.base import BaseEmbedding
+from hugegraph_llm.utils.rate_limiter import rate_limited
+from hugegraph_llm.utils.tracing import record_embedding_batch
 
 
 class OpenAIEmbedding(BaseEmbedding):
@@ -32,6 +34,7 @@ class OpenAIEmbedding(BaseEmbedding):
         api_base: Optional[str] = None,
     ):
         api_key = api_key or ""
+        self.api_base = api_base
         self.client = OpenAI(api_key=api_key, base_url=api_base)
         self.aclient = AsyncOpenAI(api_key=api_key, base_url=api_base)
         self.model = model_name
@@ -42,11 +45,13 @@ class OpenAIEmbedding(BaseEmbedding):
     ) -> int:
         return self.embedding_dimension
 
+    @rate_limited("embedding")
     def get_text_embedding(self, text: str) -> List[float]:
         """Comment"""
         response = self.client.embeddings.create(input=text, model=self.model)
         return response.data[0].embedding
 
+    @rate_limited("embedding")
     def get_texts_embeddings(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
         """Get embeddings for multiple texts with automatic batch splitting.
 
@@ -69,10 +74,12 @@ class OpenAIEmbedding(BaseEmbedding):
         all_embeddings = []
         for i in range(0, len(texts), batch_size):
             batch = texts[i : i + batch_size]
+            record_embedding_batch(len(batch))
             response = self.client.embeddings.create(input=batch, model=self.model)
             all_embeddings.extend([data.embedding for data in response.data])
         return all_embeddings
 
+    @rate_limited("embedding")
     async def async_get_texts_embeddings(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
         """Get embeddings for multiple texts with automatic batch splitting (async).
 
@@ -96,10 +103,12 @@ class OpenAIEmbedding(BaseEmbedding):
         all_embeddings = []
         for i in range(0, len(texts), batch_size):
             batch = texts[i : i + batch_size]
+            record_embedding_batch(len(batch))
             response = await self.aclient.embeddings.create(input=batch, model=self.model)
             all_embeddings.extend([data.embedding for data in response.data])
         return all_embeddings
 
+    @rate_limited("embedding")
     async def async_get_text_embedding(self, text: str) -> List[float]:
         response = await self.aclient.embeddings.create(input=[text], model=self.model)
         return response.data[0].embedding
@@ -0,0 +1,315 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncGenerator, Callable, ClassVar, Dict, Generator, List, Optional, Tuple
+
+from hugegraph_llm.config import llm_settings, resource_path
+from hugegraph_llm.models.llms.base import BaseLLM
+from hugegraph_llm.utils.log import log
+
+CACHE_DIR_NAME = "llm_cache"
+CACHE_FILE_NAME = "responses.db"
+
+
+class LLMResponseCache:
+    """
+    LLM responses keyed by a hash of (llm type, model, temperature, max tokens, messages), kept in an
+    in-memory LRU in front of a SQLite table.
+
+    Responses older than ``ttl`` seconds are ignored (0 keeps them forever), and the least recently
+    written rows are evicted when the table grows over ``max_entries`` (0 = unbounded).
+    """
+
+    def __init__(self, db_path: Optional[str] = None, ttl: float = 0, max_entries: int = 0, memory_size: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_created ON responses (created)")
+            self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(**params: Any) -> str:
+        payload = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _fresh(self, created: float) -> bool:
+        return self.ttl <= 0 or time.time() - created < self.ttl
+
+    def _remember(self, key: str, created: float, response: str):
+        self._memory[key] = (created, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None and self._conn is not None:
+                row = self._conn.execute("SELECT created, response FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    entry = (row[0], row[1])
+                    self._remember(key, *entry)
+            if entry is not None and self._fresh(entry[0]):
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, response: str):
+        with self._lock:
+            now = time.time()
+            self._remember(key, now, response)
+            if self._conn is None:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created) VALUES (?, ?, ?)", (key, response, now)
+            )
+            if self.max_entries > 0:
+                (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+                if count > self.max_entries:
+                    # evict 10% below the bound, so a full cache doesn't evict on every insert
+                    excess = count - int(self.max_entries * 0.9)
+                    self._conn.execute(
+                        "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY created LIMIT ?)",
+                        (excess,),
+                    )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "memory_entries": len(self._memory),
+            }
+
+
+class _Flight:
+    """A provider call shared by concurrent identical requests."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+
+class CachedLLM(BaseLLM):
+    """
+    Wrap a BaseLLM so generate/agenerate answer identical requests from the LLMResponseCache, and
+    concurrent identical requests wait for the one in flight instead of calling the provider again.
+    Streaming calls are passed through.
+    """
+
+    # in-flight requests are shared by all wrappers, operators usually create their own LLM instance
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _flights: ClassVar[Dict[str, _Flight]] = {}
+    _async_flights: ClassVar[Dict[Tuple[int, str], asyncio.Future]] = {}
+
+    def __init__(self, llm: BaseLLM, cache: LLMResponseCache):
+        self.llm = llm
+        self.cache = cache
+
+    def __getattr__(self, name: str):
+        # expose backend attributes such as `model` or `max_tokens`
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def _key(self, messages: Optional[List[Dict[str, Any]]], prompt: Optional[str]) -> str:
+        if messages is None:
+            assert prompt is not None, "Messages or prompt must be provided."
+            messages = [{"role": "user", "content": prompt}]
+        return self.cache.make_key(
+            llm_type=self.llm.get_llm_type(),
+            # two endpoints may serve different models under the same name
+            api_base=getattr(self.llm, "api_base", None),
+            model=getattr(self.llm, "model", None),
+            temperature=getattr(self.llm, "temperature", None),
+            max_tokens=getattr(self.llm, "max_tokens", None),
+            messages=messages,
+        )
+
+    def _store(self, key: str, response: Any):
+        # the backends report failures as "Error: ..." responses, which must be retried next time
+        if isinstance(response, str) and response and not response.startswith("Error:"):
+            self.cache.put(key, response)
+
+    def generate(
+        self,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        prompt: Optional[str] = None,
+    ) -> str:
+        key = self._key(messages, prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            log.debug("Waiting for an identical LLM request in flight")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = self.llm.generate(messages=messages, prompt=prompt)
+            self._store(key, flight.result)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def agenerate(
+        self,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        prompt: Optional[str] = None,
+    ) -> str:
+        key = self._key(messages, prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        # futures belong to one event loop, so requests only coalesce within the same loop
+        flight_key = (id(asyncio.get_running_loop()), key)
+        while True:
+            with self._lock:
+                future = self._async_flights.get(flight_key)
+                leader = future is None
+                if leader:
+                    future = self._async_flights[flight_key] = asyncio.get_running_loop().create_future()
+            if leader:
+                break
+            log.debug("Waiting for an identical LLM request in flight")
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # the leader was cancelled, not this request: retry, becoming the leader if nobody else did
+                if not future.cancelled():
+                    raise
+        try:
+            response = await self.llm.agenerate(messages=messages, prompt=prompt)
+            self._store(key, response)
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # mark the exception as retrieved when nobody else was waiting for it
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                del self._async_flights[flight_key]
+
+    def generate_streaming(
+        self,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        prompt: Optional[str] = None,
+        on_token_callback: Optional[Callable] = None,
+    ) -> Generator[str, None, None]:
+        return self.llm.generate_streaming(messages=messages, prompt=prompt, on_token_callback=on_token_callback)
+
+    def agenerate_streaming(
+        self,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        prompt: Optional[str] = None,
+        on_token_callback: Optional[Callable] = None,
+    ) -> AsyncGenerator[str, None]:
+        return self.llm.agenerate_streaming(messages=messages, prompt=prompt, on_token_callback=on_token_callback)
+
+    def num_tokens_from_string(self, string: str) -> str:
+        return self.llm.num_tokens_from_string(string)
+
+    def max_allowed_token_length(self) -> int:
+        return self.llm.max_allowed_token_length()
+
+    def get_llm_type(self) -> str:
+        return self.llm.get_llm_type()
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Return the process-wide LLM response cache stored under the resource directory."""
+    global _cache  # pylint: disable=global-statement
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache(
+                os.path.join(resource_path, CACHE_DIR_NAME, CACHE_FILE_NAME),
+                ttl=llm_settings.llm_cache_ttl,
+                max_entries=llm_settings.llm_cache_max_entries,
+            )
+        return _cache
+
+
+def with_llm_cache(llm: BaseLLM) -> BaseLLM:
+    if not llm_settings.llm_cache_enabled or isinstance(llm, CachedLLM):
+        return llm
+    return CachedLLM(llm, get_llm_cache())
+
+
+def cached_llm(func: Callable[..., BaseLLM]) -> Callable[..., BaseLLM]:
+    """Decorate an LLM factory so the LLM it returns goes through the response cache when enabled."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> BaseLLM:
+        return with_llm_cache(func(*args, **kwargs))
+
+    return wrapper
@@ -16,11 +16,13 @@
 # under the License.
 
 from hugegraph_llm.config import LLMConfig, llm_settings
+from hugegraph_llm.models.llms.cache import cached_llm
 from hugegraph_llm.models.llms.litellm import LiteLLMClient
 from hugegraph_llm.models.llms.ollama import OllamaClient
 from hugegraph_llm.models.llms.openai import OpenAIClient
 
 
+@cached_llm
 def get_chat_llm(llm_configs: LLMConfig):
     if llm_configs.chat_llm_type == "openai":
         return OpenAIClient(
@@ -45,6 +47,7 @@ def get_chat_llm(llm_configs: LLMConfig):
     raise Exception("chat llm type is not supported !")
 
 
+@cached_llm
 def get_extract_llm(llm_configs: LLMConfig):
     if llm_configs.extract_llm_type == "openai":
         return OpenAIClient(
@@ -69,6 +72,7 @@ def get_extract_llm(llm_configs: LLMConfig):
     raise Exception("extract llm type is not supported !")
 
 
+@cached_llm
 def get_text2gql_llm(llm_configs: LLMConfig):
     if llm_configs.text2gql_llm_type == "openai":
         return OpenAIClient(
@@ -99,6 +103,7 @@ class LLMs:
         self.extract_llm_type = llm_settings.extract_llm_type
         self.text2gql_llm_type = llm_settings.text2gql_llm_type
 
+    @cached_llm
     def get_chat_llm(self):
         if self.chat_llm_type == "openai":
             return OpenAIClient(
@@ -122,6 +127,7 @@ class LLMs:
             )
         raise Exception("chat llm type is not supported !")
 
+    @cached_llm
     def get_extract_llm(self):
         if self.extract_llm_type == "openai":
             return OpenAIClient(
@@ -145,6 +151,7 @@ class LLMs:
             )
         raise Exception("extract llm type is not supported !")
 
+    @cached_llm
     def get_text2gql_llm(self):
         if self.text2gql_llm_type == "openai":
             return OpenAIClient(
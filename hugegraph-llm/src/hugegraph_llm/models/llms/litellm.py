@@ -29,6 +29,8 @@ from tenacity import (
 
 from hugegraph_llm.models.llms.base import BaseLLM
 from hugegraph_llm.utils.log import log
+from hugegraph_llm.utils.rate_limiter import rate_limited
+from hugegraph_llm.utils.tracing import record_token_usage
 
 
 class LiteLLMClient(BaseLLM):
@@ -54,6 +56,7 @@ class LiteLLMClient(BaseLLM):
         retry=retry_if_exception_type((RateLimitError, APIError)),
         reraise=True,
     )
+    @rate_limited("llm")
     def generate(
         self,
         messages: Optional[List[Dict[str, Any]]] = None,
@@ -73,6 +76,7 @@ class LiteLLMClient(BaseLLM):
                 base_url=self.api_base,
             )
             log.info("Token usage: %s", response.usage)
+            record_token_usage(response.usage)
             return response.choices[0].message.content
         except (RateLimitError, BudgetExceededError, APIError) as e:
             log.error("Error in LiteLLM call: %s", e)
@@ -84,6 +88,7 @@ class LiteLLMClient(BaseLLM):
         retry=retry_if_exception_type((RateLimitError, APIError)),
         reraise=True,
     )
+    @rate_limited("llm")
     async def agenerate(
         self,
         messages: Optional[List[Dict[str, Any]]] = None,
@@ -103,11 +108,13 @@ class LiteLLMClient(BaseLLM):
                 base_url=self.api_base,
             )
             log.info("Token usage: %s", response.usage)
+            record_token_usage(response.usage)
             return response.choices[0].message.content
         except (RateLimitError, BudgetExceededError, APIError) as e:
             log.error("Error in async LiteLLM call: %s", e)
             raise
 
+    @rate_limited("llm")
     def generate_streaming(
         self,
         messages: Optional[List[Dict[str, Any]]] = None,
@@ -142,6 +149,7 @@ class LiteLLMClient(BaseLLM):
             log.error("Error in streaming LiteLLM call: %s", e)
             raise
 
+    @rate_limited("llm")
     async def agenerate_streaming(
         self,
         messages: Optional[List[Dict[str, Any]]] = None,
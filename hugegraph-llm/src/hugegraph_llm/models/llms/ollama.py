@@ -30,6 +30,8 @@ from tenacity import (
 
 from hugegraph_llm.models.llms.base import BaseLLM
 from hugegraph_llm.utils.log import log
+from hugegraph_llm.utils.rate_limiter import rate_limited
+from hugegraph_llm.utils.tracing import record_token_usage
 
 
 class OllamaClient(BaseLLM):
@@ -37,14 +39,16 @@ class OllamaClient(BaseLLM):
 
     def __init__(self, model: str, host: str = "127.0.0.1", port: int = 11434, **kwargs):
         self.model = model
-        self.client = ollama.Client(host=f"http://{host}:{port}", **kwargs)
-        self.async_client = ollama.AsyncClient(host=f"http://{host}:{port}", **kwargs)
+        self.api_base = f"http://{host}:{port}"
+        self.client = ollama.Client(host=self.api_base, **kwargs)
+        self.async_client = ollama.AsyncClient(host=self.api_base, **kwargs)
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry=retry_if_exception_type((ollama.ResponseError, httpx.ConnectError, httpx.TimeoutException)),
     )
+    @rate_limited("llm")
     def generate(
         self,
         messages: Optional[List[Dict[str, Any]]] = None,
@@ -65,6 +69,7 @@ class OllamaClient(BaseLLM):
                 "total_tokens": response["prompt_eval_count"] + response["eval_count"],
             }
             log.info("Token usage: %s", json.dumps(usage))
+            record_token_usage(usage)
             return response["message"]["content"]
         except (ollama.ResponseError, httpx.ConnectError, httpx.TimeoutException) as e:
             log.error("Retrying LLM call %s", e)
@@ -75,6 +80,7 @@ class OllamaClient(BaseLLM):
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry=retry_if_exception_type((ollama.ResponseError, httpx.ConnectError, httpx.TimeoutException)),
     )
+    @rate_limited("llm")
     async def agenerate(
         self,
         messages: Optional[List[Dict[str, Any]]] = None,
@@ -95,11 +101,13 @@ class OllamaClient(BaseLLM):
                 "total_tokens": response["prompt_eval_count"] + response["eval_count"],
             }
             log.info("Token usage: %s", json.dumps(usage))
+            record_token_usage(usage)
             return response["message"]["content"]
         except (ollama.ResponseError, httpx.ConnectError, httpx.TimeoutException) as e:
             log.error("Retrying LLM call %s", e)
             raise
 
+    @rate_limited("llm")
     def generate_streaming(
         self,
         messages: Optional[List[Dict[str, Any]]] = None,
@@ -120,6 +128,7 @@ class OllamaClient(BaseLLM):
                 on_token_callback(token)
             yield token
 
+    @rate_limited("llm")
     async def agenerate_streaming(
         self,
         messages: Optional[List[Dict[str, Any]]] = None,
@@ -29,6 +29,8 @@ from tenacity import (
 
 from hugegraph_llm.models.llms.base import BaseLLM
 from hugegraph_llm.utils.log import log
+from hugegraph_llm.utils.rate_limiter import rate_limited
+from hugegraph_llm.utils.tracing import record_token_usage
 
 
 class OpenAIClient(BaseLLM):
@@ -43,6 +45,7 @@ class OpenAIClient(BaseLLM):
         temperature: float = 0.01,
     ) -> None:
         api_key = api_key or ""
+        self.api_base = api_base
         self.client = OpenAI(api_key=api_key, base_url=api_base)
         self.aclient = AsyncOpenAI(api_key=api_key, base_url=api_base)
         self.model = model_name
@@ -54,6 +57,7 @@ class OpenAIClient(BaseLLM):
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError)),
     )
+    @rate_limited("llm")
     def generate(
         self,
         messages: Optional[List[Dict[str, Any]]] = None,
@@ -72,6 +76,7 @@ class OpenAIClient(BaseLLM):
             )
             if not completions.choices:
                 raise RuntimeError(f"Empty choices in LLM response: {str(completions)[:200]}")
+            record_token_usage(completions.usage)
             if completions.usage:
                 log.info("Token usage: %s", completions.usage.model_dump_json())
             return completions.choices[0].message.content
@@ -92,6 +97,7 @@ class OpenAIClient(BaseLLM):
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError)),
     )
+    @rate_limited("llm")
     async def agenerate(
         self,
         messages: Optional[List[Dict[str, Any]]] = None,
@@ -110,6 +116,7 @@ class OpenAIClient(BaseLLM):
             )
             if not completions.choices:
                 raise RuntimeError(f"Empty choices in LLM response: {str(completions)[:200]}")
+            record_token_usage(completions.usage)
             if completions.usage:
                 log.info("Token usage: %s", completions.usage.model_dump_json())
             return completions.choices[0].message.content
@@ -130,6 +137,7 @@ class OpenAIClient(BaseLLM):
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError)),
     )
+    @rate_limited("llm")
     def generate_streaming(
         self,
         messages: Optional[List[Dict[str, Any]]] = None,
@@ -175,6 +183,7 @@ class OpenAIClient(BaseLLM):
             log.error("Error in streaming: %s", e)
             raise e
 
+    @rate_limited("llm")
     async def agenerate_streaming(
         self,
         messages: Optional[List[Dict[str, Any]]] = None,
@@ -21,6 +21,7 @@ from pycgraph import CStatus, GNode
 from hugegraph_llm.nodes.util import init_context
 from hugegraph_llm.state.ai_state import WkFlowInput, WkFlowState
 from hugegraph_llm.utils.log import log
+from hugegraph_llm.utils.tracing import span
 
 
 def _format_node_err(node, exc: Exception, prefix: str = "Node failed") -> str:
@@ -74,7 +75,8 @@ class BaseNode(GNode):
             self.context.unlock()
 
         try:
-            res = self.operator_schedule(data_json)
+            with span(self.wk_input.trace, type(self).__name__):
+                res = self.operator_schedule(data_json)
         except (ValueError, TypeError, KeyError, NotImplementedError) as exc:
             err_msg = _format_node_err(self, exc)
             log.error(err_msg)
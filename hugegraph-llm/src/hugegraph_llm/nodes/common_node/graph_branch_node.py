@@ -0,0 +1,108 @@
+#  Licensed to the Apache Software Foundation (ASF) under one or more
+#  contributor license agreements.  See the NOTICE file distributed with
+#  this work for additional information regarding copyright ownership.
+#  The ASF licenses this file to You under the Apache License, Version 2.0
+#  (the "License"); you may not use this file except in compliance with
+#  the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Sequence
+
+from hugegraph_llm.config import huge_settings
+from hugegraph_llm.nodes.base_node import BaseNode, _format_node_err
+from hugegraph_llm.nodes.hugegraph_node.graph_query_node import GraphQueryNode
+from hugegraph_llm.nodes.hugegraph_node.schema import SchemaNode
+from hugegraph_llm.nodes.index_node.semantic_id_query_node import SemanticIdQueryNode
+from hugegraph_llm.nodes.llm_node.keyword_extract_node import KeywordExtractNode
+from hugegraph_llm.utils.log import log
+from hugegraph_llm.utils.tracing import current_trace, span
+
+# graph branches outliving their latency budget keep running here after the pipeline has moved on
+GRAPH_BRANCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=huge_settings.flow_worker_threads, thread_name_prefix="graph-branch"
+)
+# schema loading runs next to keyword extraction, a pool of its own so a full branch pool never blocks it
+GRAPH_SCHEMA_EXECUTOR = ThreadPoolExecutor(
+    max_workers=huge_settings.flow_worker_threads, thread_name_prefix="graph-schema"
+)
+
+
+class GraphBranchNode(BaseNode):
+    """
+    Graph branch of the hybrid RAG flow: (schema | keyword extract) -> semantic id query -> graph query as one node.
+
+    With a latency budget (``WkFlowInput.graph_latency_budget`` seconds) the node stops waiting once it is spent,
+    the answer is then synthesized from the vector results alone. The branch keeps running in the background and
+    its future is left in ``pending_graph_result`` so a refined answer can be streamed when it lands.
+    """
+
+    nodes: Sequence[BaseNode] = ()
+
+    def node_init(self):
+        sts = super().node_init()
+        if sts.isErr():
+            return sts
+        # fresh nodes on every run, a late branch of the previous run may still be using the old ones
+        self.nodes = (SchemaNode(), KeywordExtractNode(), SemanticIdQueryNode(), GraphQueryNode())
+        for node in self.nodes:
+            node.wk_input = self.wk_input
+            node.context = self.context
+            sts = node.node_init()
+            if sts.isErr():
+                return sts
+        return sts
+
+    @staticmethod
+    def run_node(node: BaseNode, data_json: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one sub-node on a copy of the context, return the entries it added or changed."""
+        context = dict(data_json)
+        try:
+            with span(current_trace(), type(node).__name__):
+                res = node.operator_schedule(context)
+        except (ValueError, TypeError, KeyError, NotImplementedError) as exc:
+            # the failures BaseNode.run turns into an error status, name the sub-node that raised them
+            err_msg = _format_node_err(node, exc, "Graph branch node failed")
+            log.error(err_msg)
+            raise ValueError(err_msg) from exc
+        if isinstance(res, dict):
+            context.update(res)
+        elif res is not None:
+            log.warning("operator_schedule returned non-dict type: %s", type(res))
+        return {k: v for k, v in context.items() if k not in data_json or data_json[k] is not v}
+
+    @classmethod
+    def run_branch(cls, nodes: Sequence[BaseNode], data_json: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the branch on a copy of the context, return the entries it added or changed."""
+        schema_node, keyword_node, *query_nodes = nodes
+        # schema and keywords don't depend on each other, they run side by side as in the former DAG
+        schema_future = GRAPH_SCHEMA_EXECUTOR.submit(
+            contextvars.copy_context().run, cls.run_node, schema_node, data_json
+        )
+        changes = cls.run_node(keyword_node, data_json)
+        changes.update(schema_future.result())
+        for node in query_nodes:
+            changes.update(cls.run_node(node, {**data_json, **changes}))
+        return changes
+
+    def operator_schedule(self, data_json: Dict[str, Any]) -> Dict[str, Any]:
+        budget = self.wk_input.graph_latency_budget or 0
+        if budget <= 0:
+            return self.run_branch(self.nodes, data_json)
+        # carry the current trace span over, the branch nodes are traced as its children
+        future = GRAPH_BRANCH_EXECUTOR.submit(contextvars.copy_context().run, self.run_branch, self.nodes, data_json)
+        try:
+            return future.result(timeout=budget)
+        except FutureTimeoutError:
+            log.warning("Graph branch exceeded its %ss latency budget, answering from vector results", budget)
+            return {"pending_graph_result": future}
@@ -33,7 +33,9 @@ class ChunkSplitNode(BaseNode):
         split_type = self.wk_input.split_type
         if isinstance(texts, str):
             texts = [texts]
-        self.chunk_split_op = ChunkSplit(texts, split_type, language)
+        self.chunk_split_op = ChunkSplit(
+            texts, split_type, language, self.wk_input.sources, hashes_only=bool(self.wk_input.lazy_chunks)
+        )
         return super().node_init()
 
     def operator_schedule(self, data_json):
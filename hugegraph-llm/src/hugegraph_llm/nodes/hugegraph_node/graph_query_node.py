@@ -13,7 +13,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import contextvars
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from pyhugegraph.client import PyHugeClient
@@ -21,7 +23,10 @@ from pyhugegraph.client import PyHugeClient
 from hugegraph_llm.config import huge_settings, prompt
 from hugegraph_llm.nodes.base_node import BaseNode
 from hugegraph_llm.operators.operator_list import OperatorList
+from hugegraph_llm.utils.graph_schema_cache import graph_schema_cache
+from hugegraph_llm.utils.hugegraph_utils import get_hg_client
 from hugegraph_llm.utils.log import log
+from hugegraph_llm.utils.tracing import timed
 
 # TODO: remove 'as('subj)' step
 VERTEX_QUERY_TPL = "g.V({keywords}).limit(8).as('subj').toList()"
@@ -93,13 +98,7 @@ class GraphQueryNode(BaseNode):
         """
         Initialize the graph query operator.
         """
-        self._client: PyHugeClient = PyHugeClient(
-            url=huge_settings.graph_url,
-            graph=huge_settings.graph_name,
-            user=huge_settings.graph_user,
-            pwd=huge_settings.graph_pwd,
-            graphspace=huge_settings.graph_space,
-        )
+        self._client: PyHugeClient = get_hg_client(self.wk_input.graph_client_config)
         self._max_deep = self.wk_input.max_deep or 2
         self._max_items = self.wk_input.max_graph_items or huge_settings.max_graph_items
         self._prop_to_match = self.wk_input.prop_to_match
@@ -150,7 +149,7 @@ class GraphQueryNode(BaseNode):
         log.info("Generated gremlin: %s", gremlin)
         context["gremlin"] = gremlin
         try:
-            result = self._client.gremlin().exec(gremlin=gremlin)["data"]
+            result = self._exec_gremlin(gremlin)
             if result == [None]:
                 result = []
             context["graph_result"] = [json.dumps(item, ensure_ascii=False) for item in result]
@@ -292,13 +291,12 @@ class GraphQueryNode(BaseNode):
         return subgraph, vertex_degree_list, subgraph_with_degree
 
     def _get_graph_schema(self, refresh: bool = False) -> str:
-        if self._schema and not refresh:
-            return self._schema
+        if refresh:
+            graph_schema_cache.invalidate(self._client)
 
-        schema = self._client.schema()
-        vertex_schema = schema.getVertexLabels()
-        edge_schema = schema.getEdgeLabels()
-        relationships = schema.getRelations()
+        vertex_schema = graph_schema_cache.get_vertex_labels(self._client)
+        edge_schema = graph_schema_cache.get_edge_labels(self._client)
+        relationships = graph_schema_cache.get_relations(self._client)
 
         self._schema = (
             f"Vertex properties: {vertex_schema}\nEdge properties: {edge_schema}\nRelationships: {relationships}\n"
@@ -334,6 +332,53 @@ class GraphQueryNode(BaseNode):
             knowledge.add(node_str)
         return knowledge
 
+    def _exec_gremlin(self, gremlin: str) -> Any:
+        with timed("gremlin"):
+            return self._client.gremlin().exec(gremlin=gremlin)["data"]
+
+    def _query_vid_neighbor(self, matched_vid: str, edge_labels_str: str, edge_limit_amount: int) -> List[Any]:
+        gremlin_query = VID_QUERY_NEIGHBOR_TPL.format(
+            keywords=f"'{matched_vid}'",
+            max_deep=self._max_deep,
+            edge_labels=edge_labels_str,
+            edge_limit=edge_limit_amount,
+            max_items=self._max_items,
+        )
+        log.debug("Kneighbor gremlin query: %s", gremlin_query)
+        return self._exec_gremlin(gremlin_query)
+
+    def _query_vid_neighbors(
+        self,
+        matched_vids: List[str],
+        edge_labels_str: str,
+        edge_limit_amount: int,
+    ) -> List[Any]:
+        """Expand the neighbors of each matched vid, fanning the queries out over a bounded thread pool.
+
+        Paths are concatenated in the order of ``matched_vids`` so the formatted result is identical to
+        the serial expansion.
+        """
+        max_workers = min(max(huge_settings.max_graph_query_workers, 1), len(matched_vids))
+
+        if max_workers == 1:
+            results = [self._query_vid_neighbor(vid, edge_labels_str, edge_limit_amount) for vid in matched_vids]
+        else:
+            # each query runs in a copy of the caller's context so it is counted on the node's trace span
+            contexts = [contextvars.copy_context() for _ in matched_vids]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda vid, ctx: ctx.run(self._query_vid_neighbor, vid, edge_labels_str, edge_limit_amount),
+                        matched_vids,
+                        contexts,
+                    )
+                )
+
+        paths: List[Any] = []
+        for vid_paths in results:
+            paths.extend(vid_paths)
+        return paths
+
     def _subgraph_query(self, context: Dict[str, Any]) -> Dict[str, Any]:
         # 1. Extract params from context
         matched_vids = context.get("match_vids")
@@ -356,22 +401,11 @@ class GraphQueryNode(BaseNode):
                 return context
 
             gremlin_query = VERTEX_QUERY_TPL.format(keywords=matched_vids)
-            vertexes = self._client.gremlin().exec(gremlin=gremlin_query)["data"]
+            vertexes = self._exec_gremlin(gremlin_query)
             log.debug("Vids gremlin query: %s", gremlin_query)
 
             vertex_knowledge = self._format_graph_from_vertex(query_result=vertexes)
-            paths: List[Any] = []
-            # TODO: use generator or asyncio to speed up the query logic
-            for matched_vid in matched_vids:
-                gremlin_query = VID_QUERY_NEIGHBOR_TPL.format(
-                    keywords=f"'{matched_vid}'",
-                    max_deep=self._max_deep,
-                    edge_labels=edge_labels_str,
-                    edge_limit=edge_limit_amount,
-                    max_items=self._max_items,
-                )
-                log.debug("Kneighbor gremlin query: %s", gremlin_query)
-                paths.extend(self._client.gremlin().exec(gremlin=gremlin_query)["data"])
+            paths = self._query_vid_neighbors(matched_vids, edge_labels_str, edge_limit_amount)
 
             (
                 graph_chain_knowledge,
@@ -401,7 +435,7 @@ class GraphQueryNode(BaseNode):
             )
             log.warning("Unable to find vid, downgraded to property query, please confirm if it meets expectation.")
 
-            paths: List[Any] = self._client.gremlin().exec(gremlin=gremlin_query)["data"]
+            paths: List[Any] = self._exec_gremlin(gremlin_query)
             (
                 graph_chain_knowledge,
                 vertex_degree_list,
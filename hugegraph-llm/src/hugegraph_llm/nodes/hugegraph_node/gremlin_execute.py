@@ -44,13 +44,14 @@ class GremlinExecuteNode(BaseNode):
         need_template = "template_execution_result" in requested
         need_raw = "raw_execution_result" in requested
 
+        connection = self.wk_input.graph_client_config
         tmpl_q = data_json.get("result", "")
         raw_q = data_json.get("raw_result", "")
 
         if need_template:
             try:
                 safe_q = _ensure_limit(tmpl_q)
-                data_json["template_exec_res"] = run_gremlin_query(query=safe_q)
+                data_json["template_exec_res"] = run_gremlin_query(query=safe_q, connection=connection)
             except Exception as exc:  # pylint: disable=broad-except
                 data_json["template_exec_res"] = f"{exc}"
         else:
@@ -59,7 +60,7 @@ class GremlinExecuteNode(BaseNode):
         if need_raw:
             try:
                 safe_q = _ensure_limit(raw_q)
-                data_json["raw_exec_res"] = run_gremlin_query(query=safe_q)
+                data_json["raw_exec_res"] = run_gremlin_query(query=safe_q, connection=connection)
             except Exception as exc:  # pylint: disable=broad-except
                 data_json["raw_exec_res"] = f"{exc}"
         else:
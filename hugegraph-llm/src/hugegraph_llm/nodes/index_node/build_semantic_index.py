@@ -18,6 +18,7 @@ from hugegraph_llm.models.embeddings.init_embedding import Embeddings
 from hugegraph_llm.nodes.base_node import BaseNode
 from hugegraph_llm.operators.index_op.build_semantic_index import BuildSemanticIndex
 from hugegraph_llm.state.ai_state import WkFlowInput, WkFlowState
+from hugegraph_llm.utils.hugegraph_utils import get_hg_client
 
 
 class BuildSemanticIndexNode(BaseNode):
@@ -32,7 +33,7 @@ class BuildSemanticIndexNode(BaseNode):
 
         vector_index = get_vector_index_class(index_settings.cur_vector_index)
         embedding = Embeddings().get_embedding()
-        self.build_semantic_index_op = BuildSemanticIndex(embedding, vector_index)
+        self.build_semantic_index_op = BuildSemanticIndex(embedding, vector_index, get_hg_client())
         return super().node_init()
 
     def operator_schedule(self, data_json):
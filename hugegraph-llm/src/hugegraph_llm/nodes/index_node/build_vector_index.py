@@ -16,6 +16,7 @@
 from hugegraph_llm.config import index_settings
 from hugegraph_llm.models.embeddings.init_embedding import Embeddings
 from hugegraph_llm.nodes.base_node import BaseNode
+from hugegraph_llm.operators.document_op.chunk_split import ChunkSplit
 from hugegraph_llm.operators.index_op.build_vector_index import BuildVectorIndex
 from hugegraph_llm.state.ai_state import WkFlowInput, WkFlowState
 
@@ -32,7 +33,13 @@ class BuildVectorIndexNode(BaseNode):
 
         vector_index = get_vector_index_class(index_settings.cur_vector_index)
         embedding = Embeddings().get_embedding()
-        self.build_vector_index_op = BuildVectorIndex(embedding, vector_index)
+        chunks = None
+        if self.wk_input.lazy_chunks:
+            # the state only holds the chunk hashes, split the texts again while they are embedded
+            chunks = ChunkSplit(
+                self.wk_input.texts, self.wk_input.split_type, self.wk_input.language, self.wk_input.sources
+            ).iter_chunks()
+        self.build_vector_index_op = BuildVectorIndex(embedding, vector_index, chunks=chunks)
         return super().node_init()
 
     def operator_schedule(self, data_json):
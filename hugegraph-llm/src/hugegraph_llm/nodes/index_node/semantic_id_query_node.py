@@ -21,6 +21,7 @@ from hugegraph_llm.config import huge_settings, index_settings
 from hugegraph_llm.models.embeddings.init_embedding import Embeddings
 from hugegraph_llm.nodes.base_node import BaseNode
 from hugegraph_llm.operators.index_op.semantic_id_query import SemanticIdQuery
+from hugegraph_llm.utils.hugegraph_utils import graph_connection
 from hugegraph_llm.utils.log import log
 
 
@@ -40,7 +41,7 @@ class SemanticIdQueryNode(BaseNode):
             # pylint: disable=import-outside-toplevel
             from hugegraph_llm.utils.vector_index_utils import get_vector_index_class
 
-            graph_name = huge_settings.graph_name
+            graph_name = graph_connection(self.wk_input.graph_client_config)["graph"]
             if not graph_name:
                 return CStatus(-1, "graph_name is required in wk_input")
 
@@ -67,6 +68,7 @@ class SemanticIdQueryNode(BaseNode):
                 topk_per_keyword=topk_per_keyword,
                 topk_per_query=topk_per_query,
                 vector_dis_threshold=vector_dis_threshold,
+                connection=self.wk_input.graph_client_config,
             )
 
             return super().node_init()
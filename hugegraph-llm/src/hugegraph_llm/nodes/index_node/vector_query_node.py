@@ -19,6 +19,7 @@ from hugegraph_llm.config import index_settings
 from hugegraph_llm.models.embeddings.init_embedding import Embeddings
 from hugegraph_llm.nodes.base_node import BaseNode
 from hugegraph_llm.operators.index_op.vector_index_query import VectorIndexQuery
+from hugegraph_llm.utils.hugegraph_utils import graph_connection
 from hugegraph_llm.utils.log import log
 
 
@@ -43,7 +44,12 @@ class VectorQueryNode(BaseNode):
             embedding = Embeddings().get_embedding()
             max_items = self.wk_input.max_items if self.wk_input.max_items is not None else 3
 
-            self.operator = VectorIndexQuery(vector_index=vector_index, embedding=embedding, topk=max_items)
+            self.operator = VectorIndexQuery(
+                vector_index=vector_index,
+                embedding=embedding,
+                topk=max_items,
+                graph_name=graph_connection(self.wk_input.graph_client_config)["graph"],
+            )
             return super().node_init()
         except Exception as e:  # pylint: disable=broad-exception-caught
             log.error("Failed to initialize VectorQueryNode: %s", e)
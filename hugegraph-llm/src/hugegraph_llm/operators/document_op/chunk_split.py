@@ -17,10 +17,12 @@
 
 
 import re
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Union
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from hugegraph_llm.indices.chunk_manifest import chunk_hash
+
 # Constants
 LANGUAGE_ZH = "zh"
 LANGUAGE_EN = "en"
@@ -45,10 +47,20 @@ class ChunkSplit:
         texts: Union[str, List[str]],
         split_type: Literal["document", "paragraph", "sentence"] = SPLIT_TYPE_DOCUMENT,
         language: Literal["zh", "en"] = LANGUAGE_ZH,
+        sources: Optional[List[str]] = None,
+        hashes_only: bool = False,
     ):
+        """
+        With ``hashes_only`` run() only puts the chunk hashes in the context (``chunk_hashes``), the consumer
+        splits the texts again lazily with iter_chunks() instead of holding every chunk in memory.
+        """
         if isinstance(texts, str):
             texts = [texts]
+        if sources is not None and len(sources) != len(texts):
+            raise ValueError("sources must have one source name per text")
         self.texts = texts
+        self.sources = sources
+        self.hashes_only = hashes_only
         self.separators = self._get_separators(language)
         self.text_splitter = self._get_text_splitter(split_type)
 
@@ -70,13 +82,25 @@ class ChunkSplit:
             return _split_sentence_boundaries
         raise ValueError("split_type must be document, paragraph, or sentence")
 
-    def run(self, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        all_chunks = []
+    def iter_chunks(self) -> Iterator[str]:
+        """Split the texts lazily, one text at a time."""
         for text in self.texts:
-            chunks = self.text_splitter(text)
-            all_chunks.extend(chunks)
+            yield from self.text_splitter(text)
 
+    def _iter_sourced_chunks(self) -> Iterator[Tuple[str, Optional[str]]]:
+        sources = self.sources if self.sources is not None else [None] * len(self.texts)
+        for text, source in zip(self.texts, sources):
+            for chunk in self.text_splitter(text):
+                yield chunk, source
+
+    def run(self, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         if context is None:
-            return {"chunks": all_chunks}
-        context["chunks"] = all_chunks
+            context = {}
+        chunks, chunk_sources = [], []
+        for chunk, source in self._iter_sourced_chunks():
+            chunks.append(chunk_hash(chunk) if self.hashes_only else chunk)
+            chunk_sources.append(source)
+        context["chunk_hashes" if self.hashes_only else "chunks"] = chunks
+        if self.sources is not None:
+            context["chunk_sources"] = chunk_sources
         return context
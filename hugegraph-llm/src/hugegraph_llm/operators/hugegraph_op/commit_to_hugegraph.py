@@ -15,19 +15,26 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from pyhugegraph.client import PyHugeClient
-from pyhugegraph.utils.exceptions import CreateError, NotFoundError
+from pyhugegraph.utils.exceptions import CreateError, NotFoundError, ServerError
 
 from hugegraph_llm.config import huge_settings
 from hugegraph_llm.enums.property_cardinality import PropertyCardinality
 from hugegraph_llm.enums.property_data_type import PropertyDataType, default_value_map
+from hugegraph_llm.utils.graph_schema_cache import graph_schema_cache
 from hugegraph_llm.utils.log import log
 
+# HugeGraph rejects batches larger than "batch.max_vertices_per_batch"/"batch.max_edges_per_batch" (500 by default)
+MAX_BATCH_SIZE = 500
+
 
 class Commit2Graph:
-    def __init__(self):
+    def __init__(self, batch_size: Optional[int] = None):
+        # <= 1 keeps the one-request-per-element import, otherwise write vertices/edges in batches of this size
+        batch_size = huge_settings.graph_commit_batch_size if batch_size is None else batch_size
+        self.batch_size = min(batch_size, MAX_BATCH_SIZE)
         self.client = PyHugeClient(
             url=huge_settings.graph_url,
             graph=huge_settings.graph_name,
@@ -82,6 +89,7 @@ class Commit2Graph:
         edge_label_map = {e_label["name"]: e_label for e_label in schema["edgelabels"]}
         property_label_map = {p_label["name"]: p_label for p_label in schema["propertykeys"]}
         vid_mapping = {}  # mapping from LLM-generated vertex ID to actual server vertex ID
+        pending_vertices = []  # validated (vertex, mapping_id, explicit_id) waiting to be written
 
         for vertex in vertices:
             input_label = vertex["label"]
@@ -146,28 +154,25 @@ class Commit2Graph:
             if has_problem:
                 continue
 
-            # TODO: we could try batch add vertices first, setback to single-mode if failed
             explicit_id = vertex.get("id")
             mapping_id = explicit_id
             if not mapping_id and primary_keys:
                 mapping_id = f"{input_label}:{'!'.join(str(input_properties[pk]) for pk in primary_keys)}"
+            if vertex_label.get("id_strategy") != "CUSTOMIZE_STRING":
+                explicit_id = None
+            pending_vertices.append((vertex, mapping_id, explicit_id))
 
-            if vertex_label.get("id_strategy") == "CUSTOMIZE_STRING" and explicit_id:
-                result = self._handle_graph_creation(
-                    self.client.graph().addVertex,
-                    input_label,
-                    input_properties,
-                    id=explicit_id,
-                )
-            else:
-                result = self._handle_graph_creation(self.client.graph().addVertex, input_label, input_properties)
-            if result is None:
-                raise ValueError(f"Failed to create vertex '{input_label}' with properties {input_properties}")
-            vid = result.id
-            vertex["id"] = vid
-            if mapping_id:
-                vid_mapping[mapping_id] = vid
+        failed_vertices = []
+        if self.batch_size > 1:
+            failed_vertices = self._batch_add_vertices(pending_vertices, vid_mapping)
+        else:
+            for vertex, mapping_id, explicit_id in pending_vertices:
+                if not self._add_vertex(vertex, mapping_id, explicit_id, vid_mapping):
+                    raise ValueError(
+                        f"Failed to create vertex '{vertex['label']}' with properties {vertex['properties']}"
+                    )
 
+        pending_edges = []
         for edge in edges:
             start = vid_mapping.get(edge.get("outV"), edge.get("outV"))
             end = vid_mapping.get(edge.get("inV"), edge.get("inV"))
@@ -181,8 +186,117 @@ class Commit2Graph:
                 )
                 continue
 
-            # TODO: we could try batch add edges first, setback to single-mode if failed
-            self._handle_graph_creation(self.client.graph().addEdge, label, start, end, properties)
+            pending_edges.append((label, start, end, properties))
+
+        if self.batch_size > 1:
+            self._batch_add_edges(pending_edges, edge_label_map)
+        else:
+            for label, start, end, properties in pending_edges:
+                self._handle_graph_creation(self.client.graph().addEdge, label, start, end, properties)
+
+        if failed_vertices:
+            # the rest of the data has been imported, but lost vertices still have to be surfaced explicitly
+            raise ValueError(
+                f"Failed to create {len(failed_vertices)} vertices, e.g. '{failed_vertices[0]['label']}' "
+                f"with properties {failed_vertices[0]['properties']}"
+            )
+
+    def _add_vertex(self, vertex, mapping_id, explicit_id, vid_mapping) -> bool:
+        input_label, input_properties = vertex["label"], vertex["properties"]
+        if explicit_id:
+            result = self._handle_graph_creation(
+                self.client.graph().addVertex,
+                input_label,
+                input_properties,
+                id=explicit_id,
+            )
+        else:
+            result = self._handle_graph_creation(self.client.graph().addVertex, input_label, input_properties)
+        if result is None:
+            return False
+        vertex["id"] = result.id
+        if mapping_id:
+            vid_mapping[mapping_id] = result.id
+        return True
+
+    def _batch_add_vertices(self, pending_vertices: List[Tuple], vid_mapping: Dict[str, Any]) -> List[Dict]:
+        failed = []
+        for start in range(0, len(pending_vertices), self.batch_size):
+            failed.extend(self._add_vertices_bisect(pending_vertices[start : start + self.batch_size], vid_mapping))
+        return failed
+
+    def _add_vertices_bisect(self, batch: List[Tuple], vid_mapping: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Write a batch of vertices, splitting a rejected batch in halves until the bad vertices are isolated.
+
+        Returns the vertices that could not be created.
+        """
+        if len(batch) == 1:
+            vertex, mapping_id, explicit_id = batch[0]
+            try:
+                created = self._add_vertex(vertex, mapping_id, explicit_id, vid_mapping)
+            except ServerError as e:
+                log.error("Error on creating vertex %s: %s", vertex, e)
+                created = False
+            return [] if created else [vertex]
+        try:
+            results = self.client.graph().addVertices(
+                [(vertex["label"], vertex["properties"], explicit_id) for vertex, _, explicit_id in batch]
+            )
+        except (NotFoundError, CreateError, ServerError) as e:
+            log.warning("Batch of %d vertices rejected (%s), retry in smaller batches", len(batch), e)
+            results = None
+        if not results or len(results) != len(batch):
+            mid = len(batch) // 2
+            return self._add_vertices_bisect(batch[:mid], vid_mapping) + self._add_vertices_bisect(
+                batch[mid:], vid_mapping
+            )
+
+        for (vertex, mapping_id, _), result in zip(batch, results):
+            vertex["id"] = result.id
+            if mapping_id:
+                vid_mapping[mapping_id] = result.id
+        return []
+
+    def _batch_add_edges(self, pending_edges: List[Tuple], edge_label_map: Dict[str, Any]) -> None:
+        failed_num = 0
+        for start in range(0, len(pending_edges), self.batch_size):
+            failed_num += self._add_edges_bisect(pending_edges[start : start + self.batch_size], edge_label_map)
+        if failed_num:
+            log.error("Failed to create %d edges, skip them & need check it again", failed_num)
+
+    def _add_edges_bisect(self, batch: List[Tuple], edge_label_map: Dict[str, Any]) -> int:
+        """Write a batch of edges the same way as vertices, returns the number of edges that failed."""
+        if len(batch) == 1:
+            label, start, end, properties = batch[0]
+            try:
+                result = self._handle_graph_creation(self.client.graph().addEdge, label, start, end, properties)
+            except ServerError as e:
+                log.error("Error on creating edge %s: %s", batch[0], e)
+                result = None
+            return 0 if result is not None else 1
+        try:
+            results = self.client.graph().addEdges(
+                [
+                    (
+                        label,
+                        start,
+                        end,
+                        edge_label_map[label]["source_label"],
+                        edge_label_map[label]["target_label"],
+                        properties,
+                    )
+                    for label, start, end, properties in batch
+                ]
+            )
+        except (NotFoundError, CreateError, ServerError) as e:
+            log.warning("Batch of %d edges rejected (%s), retry in smaller batches", len(batch), e)
+            results = None
+        if not results or len(results) != len(batch):
+            mid = len(batch) // 2
+            return self._add_edges_bisect(batch[:mid], edge_label_map) + self._add_edges_bisect(
+                batch[mid:], edge_label_map
+            )
+        return 0
 
     def init_schema_if_need(self, schema: dict):
         properties = schema["propertykeys"]
@@ -209,6 +323,7 @@ class Commit2Graph:
             self.schema.edgeLabel(edge_label).sourceLabel(source_vertex_label).targetLabel(
                 target_vertex_label
             ).properties(*properties).nullableKeys(*properties).ifNotExist().create()
+        graph_schema_cache.invalidate(self.client)
 
     def schema_free_mode(self, data):
         self.schema.propertyKey("name").asText().ifNotExist().create()
@@ -219,6 +334,7 @@ class Commit2Graph:
 
         self.schema.indexLabel("vertexByName").onV("vertex").by("name").secondary().ifNotExist().create()
         self.schema.indexLabel("edgeByName").onE("edge").by("name").secondary().ifNotExist().create()
+        graph_schema_cache.invalidate(self.client)
 
         for item in data:
             s, p, o = (element.strip() for element in item)
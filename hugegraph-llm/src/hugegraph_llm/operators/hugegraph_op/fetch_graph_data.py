@@ -29,7 +29,7 @@ class FetchGraphData:
         if graph_summary is None:
             graph_summary = {}
 
-        # TODO: v_limit will influence the vid embedding logic in build_semantic_index.py
+        # Only a brief overview, build_semantic_index.py pages through every vertex itself
         v_limit = 10000
         e_limit = 200
         keys = ["vertex_num", "edge_num", "vertices", "edges", "note"]
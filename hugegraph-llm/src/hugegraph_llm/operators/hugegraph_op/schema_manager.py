@@ -20,6 +20,7 @@ from pyhugegraph.client import PyHugeClient
 from requests.exceptions import RequestException
 
 from hugegraph_llm.config import huge_settings
+from hugegraph_llm.utils.graph_schema_cache import graph_schema_cache
 
 
 class SchemaManager:
@@ -71,10 +72,12 @@ class SchemaManager:
         if context is None:
             context = {}
         try:
-            schema = self.schema.getSchema()
+            schema = graph_schema_cache.get_schema(self.client)
         except RequestException as e:
             raise ValueError(f"Failed to connect to HugeGraph to get schema '{self.graph_name}': {e}") from e
         if not schema["vertexlabels"] and not schema["edgelabels"]:
+            # don't keep serving an empty schema, it may be created right after
+            graph_schema_cache.invalidate(self.client)
             raise ValueError(f"Cannot get {self.graph_name}'s schema from HugeGraph!")
 
         context.update({"schema": schema})
@@ -16,11 +16,12 @@
 # under the License.
 
 import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional
 
+from pyhugegraph.client import PyHugeClient
 from tqdm import tqdm
 
-from hugegraph_llm.config import huge_settings
+from hugegraph_llm.config import huge_settings, index_settings
 from hugegraph_llm.indices.vector_index.base import VectorStoreBase
 from hugegraph_llm.models.embeddings.base import BaseEmbedding
 from hugegraph_llm.operators.hugegraph_op.schema_manager import SchemaManager
@@ -28,57 +29,95 @@ from hugegraph_llm.utils.log import log
 
 
 class BuildSemanticIndex:
-    def __init__(self, embedding: BaseEmbedding, vector_index: type[VectorStoreBase]):
+    """
+    Sync the vid vector index with the vertices of the graph.
+
+    With a ``graph`` client every vertex label is paged through the REST API (``page_size`` vertices per
+    request), otherwise the vids in ``context["vertices"]`` are used. New vids are embedded page by page and
+    the vids the index holds that no page returned are removed at the end.
+    """
+
+    def __init__(
+        self,
+        embedding: BaseEmbedding,
+        vector_index: type[VectorStoreBase],
+        graph: Optional[PyHugeClient] = None,
+        page_size: Optional[int] = None,
+    ):
         self.vid_index = vector_index.from_name(embedding.get_embedding_dim(), huge_settings.graph_name, "graph_vids")
         self.embedding = embedding
         self.sm = SchemaManager(huge_settings.graph_name)
+        self.graph = graph
+        self.page_size = max(1, page_size or index_settings.vid_index_page_size)
 
     def _extract_names(self, vertices: list[str]) -> list[str]:
         return [v.split(":")[1] for v in vertices]
 
     async def _get_embeddings_parallel(self, vids: list[str]) -> list[Any]:
-        sem = asyncio.Semaphore(10)
+        # the concurrency is bounded by the rate limiter of the embedding client
         batch_size = 1000
 
-        async def get_embeddings_with_semaphore(vid_list: list[str]) -> Any:
-            async with sem:
-                loop = asyncio.get_running_loop()
-                return await loop.run_in_executor(None, self.embedding.get_texts_embeddings, vid_list)
+        async def get_embeddings(vid_list: list[str], pbar: tqdm) -> Any:
+            loop = asyncio.get_running_loop()
+            batch_embeddings = await loop.run_in_executor(None, self.embedding.get_texts_embeddings, vid_list)
+            pbar.update(1)
+            return batch_embeddings
 
         vid_batches = [vids[i : i + batch_size] for i in range(0, len(vids), batch_size)]
-        tasks = [get_embeddings_with_semaphore(batch) for batch in vid_batches]
-
         embeddings = []
-        with tqdm(total=len(tasks)) as pbar:
-            for future in asyncio.as_completed(tasks):
-                batch_embeddings = await future
+        with tqdm(total=len(vid_batches)) as pbar:
+            # gather keeps the batch order, so embeddings line up with the vids
+            for batch_embeddings in await asyncio.gather(*(get_embeddings(batch, pbar) for batch in vid_batches)):
                 embeddings.extend(batch_embeddings)
-                pbar.update(1)
         return embeddings
 
+    def _iter_vid_pages(self, context: Dict[str, Any], vertexlabels: List[Dict[str, Any]]) -> Iterator[List[Any]]:
+        if self.graph is None:
+            # Warning: data truncated by fetch_graph_data.py
+            vids = context["vertices"]
+            for i in range(0, len(vids), self.page_size):
+                yield vids[i : i + self.page_size]
+            return
+
+        for label in (data["name"] for data in vertexlabels):
+            page = None
+            while True:
+                vertices, page = self.graph.graph().getVertexByPage(label, self.page_size, page)
+                if vertices:
+                    yield [v.id for v in vertices]
+                if not page:
+                    break
+
     def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
         vertexlabels = self.sm.schema.getSchema()["vertexlabels"]
         all_pk_flag = bool(vertexlabels) and all(data.get("id_strategy") == "PRIMARY_KEY" for data in vertexlabels)
 
-        past_vids = self.vid_index.get_all_properties()
-        # TODO: We should build vid vector index separately, especially when the vertices may be very large
-        present_vids = context["vertices"]  # Warning: data truncated by fetch_graph_data.py
-        removed_vids = set(past_vids) - set(present_vids)
-        removed_num = self.vid_index.remove(removed_vids)
-        added_vids = list(set(present_vids) - set(past_vids))
-
-        if added_vids:
+        past_vids = set(self.vid_index.get_all_properties())
+        # vids of the index that no page has returned yet, whatever is left at the end was removed from the graph
+        unseen_vids = set(past_vids)
+        added_num = 0
+        for page_vids in self._iter_vid_pages(context, vertexlabels):
+            added_vids = [vid for vid in dict.fromkeys(page_vids) if vid not in past_vids]
+            unseen_vids.difference_update(page_vids)
+            if not added_vids:
+                continue
+            # a vid returned by a later page again is not embedded twice
+            past_vids.update(added_vids)
             vids_to_process = self._extract_names(added_vids) if all_pk_flag else added_vids
             added_embeddings = asyncio.run(self._get_embeddings_parallel(vids_to_process))
             log.info("Building vector index for %s vertices...", len(added_vids))
             self.vid_index.add(added_embeddings, added_vids)
+            added_num += len(added_vids)
+        removed_num = self.vid_index.remove(unseen_vids)
+
+        if added_num or removed_num:
             self.vid_index.save_index_by_name(huge_settings.graph_name, "graph_vids")
         else:
             log.debug("No update vertices to build vector index.")
         context.update(
             {
                 "removed_vid_vector_num": removed_num,
-                "added_vid_vector_num": len(added_vids),
+                "added_vid_vector_num": added_num,
             }
         )
         return context
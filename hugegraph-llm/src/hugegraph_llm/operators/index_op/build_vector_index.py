@@ -16,32 +16,174 @@
 # under the License.
 
 import asyncio
-from typing import Any, Dict
+import hashlib
+import itertools
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
 
-from hugegraph_llm.config import huge_settings
+from hugegraph_llm.config import huge_settings, index_settings, resource_path
+from hugegraph_llm.indices.chunk_manifest import ChunkManifest, chunk_hash
 from hugegraph_llm.indices.vector_index.base import VectorStoreBase
 from hugegraph_llm.models.embeddings.base import BaseEmbedding
 from hugegraph_llm.utils.embedding_utils import get_embeddings_parallel
 from hugegraph_llm.utils.log import log
 
+CHECKPOINT_FILE_NAME = "build_checkpoint.json"
+
 
 class BuildVectorIndex:
-    def __init__(self, embedding: BaseEmbedding, vector_index: type[VectorStoreBase]):
+    """
+    Embed chunks window by window and append them to the chunk vector index.
+
+    A ``ChunkManifest`` of chunk hashes per source document is kept next to the index: chunks that are
+    already indexed are skipped, and chunks a re-submitted source no longer contains are removed.
+
+    The index is saved every ``checkpoint_interval`` windows together with a checkpoint (number of chunks
+    indexed + a hash of them), so a build that crashed resumes after the last checkpoint when it is run
+    again with the same chunks.
+
+    The chunks come from ``context["chunks"]``, or are streamed from ``chunks`` (e.g. ChunkSplit.iter_chunks())
+    when the context only holds their hashes (``context["chunk_hashes"]``), so the chunks of a large
+    document set are never all in memory at once.
+    """
+
+    def __init__(
+        self,
+        embedding: BaseEmbedding,
+        vector_index: type[VectorStoreBase],
+        window_size: Optional[int] = None,
+        checkpoint_interval: Optional[int] = None,
+        chunks: Optional[Iterable[str]] = None,
+    ):
         self.embedding = embedding
+        self.chunks = chunks
+        self.embed_dim = embedding.get_embedding_dim()
         self.vector_index = vector_index.from_name(
-            embedding.get_embedding_dim(),
+            self.embed_dim,
             huge_settings.graph_name,
             "chunks",
         )
+        self.window_size = max(1, window_size or index_settings.vector_index_build_window)
+        self.checkpoint_interval = max(1, checkpoint_interval or index_settings.vector_index_checkpoint_interval)
+        self.checkpoint_file = os.path.join(resource_path, huge_settings.graph_name, "chunks", CHECKPOINT_FILE_NAME)
 
     def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        if "chunks" not in context:
+        if context.get("chunk_hashes") is not None and self.chunks is not None:
+            chunks = self.chunks
+            hashes = context["chunk_hashes"]
+        elif "chunks" in context:
+            chunks = context["chunks"]
+            hashes = [chunk_hash(chunk) for chunk in chunks]
+        else:
             raise ValueError("chunks not found in context.")
-        chunks = context["chunks"]
-        log.debug("Building vector index for %s chunks...", len(context["chunks"]))
-        # Use async parallel embedding to speed up
-        chunks_embedding = asyncio.run(get_embeddings_parallel(self.embedding, chunks))  # type: ignore
-        if len(chunks_embedding) > 0:
-            self.vector_index.add(chunks_embedding, chunks)
+        log.debug("Building vector index for %s chunks...", len(hashes))
+        manifest = self._load_manifest()
+        to_add, stale, sources = manifest.plan_hashes(hashes, context.get("chunk_sources"))
+        if len(to_add) < len(hashes):
+            log.info("Skipping %s chunks that are already indexed.", len(hashes) - len(to_add))
+
+        removed = self._remove_stale(stale)
+        added = self.add_chunks(self._select(chunks, set(to_add)))
+        if removed and not added:
             self.vector_index.save_index_by_name(huge_settings.graph_name, "chunks")
+        if added or removed or sources != manifest.sources or not manifest.persisted:
+            manifest.sources = sources
+            manifest.save()
+        context["added_chunk_vector_num"] = added
+        context["removed_chunk_vector_num"] = removed
         return context
+
+    @staticmethod
+    def _select(chunks: Iterable[str], hashes: Set[str]) -> Iterator[str]:
+        """Yield the chunks whose hash is to be added, each of them once."""
+        for chunk in chunks:
+            h = chunk_hash(chunk)
+            if h in hashes:
+                hashes.remove(h)
+                yield chunk
+
+    def _load_manifest(self) -> ChunkManifest:
+        manifest = ChunkManifest.from_name(huge_settings.graph_name, "chunks")
+        index_exists = self.vector_index.exist(huge_settings.graph_name, "chunks")
+        if not manifest.persisted:
+            # index built before the manifest existed: treat its chunks as already indexed
+            existing = self.vector_index.get_all_properties() if index_exists else []
+            manifest.reset(self.embed_dim, (chunk for chunk in existing if isinstance(chunk, str)))
+        elif manifest.embed_dim != self.embed_dim or (manifest.sources and not index_exists):
+            log.warning("The chunk manifest does not match the vector index, re-indexing every chunk.")
+            manifest.reset(self.embed_dim)
+        return manifest
+
+    def _remove_stale(self, stale) -> int:
+        if not stale:
+            return 0
+        props = [p for p in self.vector_index.get_all_properties() if isinstance(p, str) and chunk_hash(p) in stale]
+        removed = self.vector_index.remove(props)
+        log.info("Removed %s stale chunks from the vector index.", removed)
+        return removed
+
+    def add_chunks(self, chunks: Iterable[str]) -> int:
+        """Index the chunks (any iterable, consumed lazily) and return how many were added."""
+        chunk_iter = iter(chunks)
+        hasher = hashlib.sha256()
+        checkpoint = self._load_checkpoint()
+        done = 0
+        if checkpoint is not None:
+            skipped = list(itertools.islice(chunk_iter, checkpoint[0]))
+            for chunk in skipped:
+                hasher.update(chunk.encode("utf-8") + b"\x00")
+            if len(skipped) == checkpoint[0] and hasher.hexdigest() == checkpoint[1]:
+                done = len(skipped)
+                log.info("Resuming the vector index build after %s chunks.", done)
+            else:
+                log.warning("The vector index checkpoint belongs to other chunks, indexing from the first chunk.")
+                hasher = hashlib.sha256()
+                chunk_iter = itertools.chain(skipped, chunk_iter)
+
+        added = 0
+        unsaved_windows = 0
+        while True:
+            window = list(itertools.islice(chunk_iter, self.window_size))
+            if not window:
+                break
+            # Use async parallel embedding to speed up
+            embeddings = asyncio.run(get_embeddings_parallel(self.embedding, window))  # type: ignore
+            if len(embeddings) > 0:
+                self.vector_index.add(embeddings, window)
+            for chunk in window:
+                hasher.update(chunk.encode("utf-8") + b"\x00")
+            added += len(window)
+            unsaved_windows += 1
+            if unsaved_windows >= self.checkpoint_interval:
+                self.vector_index.save_index_by_name(huge_settings.graph_name, "chunks")
+                self._save_checkpoint(done + added, hasher.hexdigest())
+                unsaved_windows = 0
+                log.info("Vector index checkpoint: %s chunks indexed.", done + added)
+
+        if unsaved_windows:
+            self.vector_index.save_index_by_name(huge_settings.graph_name, "chunks")
+        self._remove_checkpoint()
+        return added
+
+    def _load_checkpoint(self) -> Optional[Tuple[int, str]]:
+        if not os.path.exists(self.checkpoint_file):
+            return None
+        try:
+            with open(self.checkpoint_file, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            return int(checkpoint["done"]), str(checkpoint["fingerprint"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log.warning("Ignoring unreadable vector index checkpoint %s: %s", self.checkpoint_file, e)
+            return None
+
+    def _save_checkpoint(self, done: int, fingerprint: str):
+        os.makedirs(os.path.dirname(self.checkpoint_file), exist_ok=True)
+        tmp_file = self.checkpoint_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"done": done, "fingerprint": fingerprint}, f)
+        os.replace(tmp_file, self.checkpoint_file)
+
+    def _remove_checkpoint(self):
+        if os.path.exists(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
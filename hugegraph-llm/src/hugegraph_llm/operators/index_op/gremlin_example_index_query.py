@@ -24,6 +24,7 @@ from tqdm import tqdm
 
 from hugegraph_llm.config import resource_path
 from hugegraph_llm.indices.vector_index.base import VectorStoreBase
+from hugegraph_llm.indices.vector_index.registry import vector_index_registry
 from hugegraph_llm.models.embeddings.base import BaseEmbedding
 from hugegraph_llm.models.embeddings.init_embedding import Embeddings
 from hugegraph_llm.utils.log import log
@@ -43,7 +44,9 @@ class GremlinExampleIndexQuery:
             self.vector_index = vector_index.from_name(self.embedding.get_embedding_dim(), "gremlin_examples")
             self._build_default_example_index()
         else:
-            self.vector_index = vector_index.from_name(self.embedding.get_embedding_dim(), "gremlin_examples")
+            self.vector_index = vector_index_registry.get(
+                vector_index, self.embedding.get_embedding_dim(), "gremlin_examples"
+            )
 
     def _get_match_result(self, context: Dict[str, Any], query: str) -> List[Dict[str, Any]]:
         if self.num_examples <= 0:
@@ -17,14 +17,18 @@
 
 
 import os
-from typing import Any, Dict, List, Literal, Tuple
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from pyhugegraph.client import PyHugeClient
 
 from hugegraph_llm.config import huge_settings, resource_path
 from hugegraph_llm.indices.vector_index.base import VectorStoreBase
+from hugegraph_llm.indices.vector_index.registry import vector_index_registry
 from hugegraph_llm.models.embeddings.base import BaseEmbedding
+from hugegraph_llm.utils.graph_schema_cache import graph_schema_cache
+from hugegraph_llm.utils.hugegraph_utils import graph_connection
 from hugegraph_llm.utils.log import log
+from hugegraph_llm.utils.tracing import timed
 
 
 class SemanticIdQuery:
@@ -38,10 +42,12 @@ class SemanticIdQuery:
         topk_per_query: int = 10,
         topk_per_keyword: int = huge_settings.topk_per_keyword,
         vector_dis_threshold: float = huge_settings.vector_dis_threshold,
+        connection: Optional[Dict[str, Any]] = None,
     ):
-        self.index_dir = str(os.path.join(resource_path, huge_settings.graph_name, "graph_vids"))
-        self.vector_index = vector_index.from_name(
-            embedding.get_embedding_dim(), huge_settings.graph_name, "graph_vids"
+        conn = graph_connection(connection)
+        self.index_dir = str(os.path.join(resource_path, conn["graph"], "graph_vids"))
+        self.vector_index = vector_index_registry.get(
+            vector_index, embedding.get_embedding_dim(), conn["graph"], "graph_vids"
         )
         self.embedding = embedding
         self.by = by
@@ -49,23 +55,23 @@ class SemanticIdQuery:
         self.topk_per_keyword = topk_per_keyword
         self.vector_dis_threshold = vector_dis_threshold
         self._client = PyHugeClient(
-            url=huge_settings.graph_url,
-            graph=huge_settings.graph_name,
-            user=huge_settings.graph_user,
-            pwd=huge_settings.graph_pwd,
-            graphspace=huge_settings.graph_space,
+            url=conn["url"],
+            graph=conn["graph"],
+            user=conn["user"],
+            pwd=conn["pwd"],
+            graphspace=conn["graphspace"],
         )
 
     def _exact_match_vids(self, keywords: List[str]) -> Tuple[List[str], List[str]]:
         assert keywords, "keywords can't be empty, please check the logic"
-        # TODO: we should add a global GraphSchemaCache to avoid calling the server every time
-        vertex_label_num = len(self._client.schema().getVertexLabels())
+        vertex_label_num = len(graph_schema_cache.get_vertex_labels(self._client) or [])
         possible_vids = set(keywords)
         for i in range(vertex_label_num):
             possible_vids.update([f"{i + 1}:{keyword}" for keyword in keywords])
 
         vids_str = ",".join([f"'{vid}'" for vid in possible_vids])
-        resp = self._client.gremlin().exec(SemanticIdQuery.ID_QUERY_TEMPL.format(vids_str=vids_str))
+        with timed("gremlin"):
+            resp = self._client.gremlin().exec(SemanticIdQuery.ID_QUERY_TEMPL.format(vids_str=vids_str))
         searched_vids = [v["id"] for v in resp["data"]]
 
         unsearched_keywords = set(keywords)
@@ -76,24 +82,41 @@ class SemanticIdQuery:
                     break
         return searched_vids, list(unsearched_keywords)
 
-    def _fuzzy_match_vids(self, keywords: List[str]) -> List[str]:
+    def _query_embedding(self, context: Dict[str, Any]) -> List[float]:
+        # reuse the embedding of an upstream node, and share ours with the downstream ones
+        query_embedding = context.get("query_embedding")
+        if not isinstance(query_embedding, list):
+            query_embedding = self.embedding.get_texts_embeddings([context["query"]])[0]
+            context["query_embedding"] = query_embedding
+        return query_embedding
+
+    def _fuzzy_match_vids(self, keywords: List[str], context: Optional[Dict[str, Any]] = None) -> List[str]:
+        if not keywords:
+            return []
+        context = context if context is not None else {}
+        texts = list(keywords)
+        # embed the query in the same round-trip when no upstream node did, later nodes reuse it
+        embed_query = bool(context.get("query")) and not isinstance(context.get("query_embedding"), list)
+        if embed_query:
+            texts.append(context["query"])
+        embeddings = self.embedding.get_texts_embeddings(texts)
+        if embed_query:
+            context["query_embedding"] = embeddings.pop()
+
+        batch_results = self.vector_index.search_batch(
+            embeddings,
+            top_k=self.topk_per_keyword,
+            dis_threshold=float(self.vector_dis_threshold),
+        )
         fuzzy_match_result = []
-        for keyword in keywords:
-            keyword_vector = self.embedding.get_text_embedding(keyword)
-            results = self.vector_index.search(
-                keyword_vector,
-                top_k=self.topk_per_keyword,
-                dis_threshold=float(self.vector_dis_threshold),
-            )
-            if results:
-                fuzzy_match_result.extend(results[: self.topk_per_keyword])
+        for results in batch_results:
+            fuzzy_match_result.extend(results[: self.topk_per_keyword])
         return fuzzy_match_result
 
     def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
         graph_query_list = set()
         if self.by == "query":
-            query = context["query"]
-            query_vector = self.embedding.get_text_embedding(query)
+            query_vector = self._query_embedding(context)
             results = self.vector_index.search(query_vector, top_k=self.topk_per_query)
             if results:
                 graph_query_list.update(results[: self.topk_per_query])
@@ -105,7 +128,7 @@ class SemanticIdQuery:
 
             exact_match_vids, unmatched_vids = self._exact_match_vids(keywords)
             graph_query_list.update(exact_match_vids)
-            fuzzy_match_vids = self._fuzzy_match_vids(unmatched_vids)
+            fuzzy_match_vids = self._fuzzy_match_vids(unmatched_vids, context)
             log.debug("Fuzzy match vids: %s", fuzzy_match_vids)
             graph_query_list.update(fuzzy_match_vids)
         context["match_vids"] = list(graph_query_list)
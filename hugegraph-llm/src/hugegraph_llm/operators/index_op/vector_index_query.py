@@ -16,23 +16,36 @@
 # under the License.
 
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from hugegraph_llm.config import huge_settings
 from hugegraph_llm.indices.vector_index.base import VectorStoreBase
+from hugegraph_llm.indices.vector_index.registry import vector_index_registry
 from hugegraph_llm.models.embeddings.base import BaseEmbedding
 from hugegraph_llm.utils.log import log
 
 
 class VectorIndexQuery:
-    def __init__(self, vector_index: type[VectorStoreBase], embedding: BaseEmbedding, topk: int = 3):
+    def __init__(
+        self,
+        vector_index: type[VectorStoreBase],
+        embedding: BaseEmbedding,
+        topk: int = 3,
+        graph_name: Optional[str] = None,
+    ):
         self.embedding = embedding
         self.topk = topk
-        self.vector_index = vector_index.from_name(embedding.get_embedding_dim(), huge_settings.graph_name, "chunks")
+        self.vector_index = vector_index_registry.get(
+            vector_index, embedding.get_embedding_dim(), graph_name or huge_settings.graph_name, "chunks"
+        )
 
     def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
         query = context.get("query")
-        query_embedding = self.embedding.get_texts_embeddings([query])[0]
+        # reuse the embedding of an upstream node, and share ours with the downstream ones
+        query_embedding = context.get("query_embedding")
+        if not isinstance(query_embedding, list):
+            query_embedding = self.embedding.get_texts_embeddings([query])[0]
+            context["query_embedding"] = query_embedding
         # TODO: why set dis_threshold=2?
         results = self.vector_index.search(query_embedding, self.topk, dis_threshold=2)
         # TODO: check format results
@@ -17,11 +17,12 @@
 
 # pylint: disable=W0621
 
+import asyncio
 import json
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from hugegraph_llm.config import prompt
+from hugegraph_llm.config import llm_settings, prompt
 from hugegraph_llm.document.chunk_split import ChunkSplitter
 from hugegraph_llm.models.llms.base import BaseLLM
 from hugegraph_llm.utils.log import log
@@ -78,9 +79,17 @@ def filter_item(schema, items) -> List[Dict[str, Any]]:
 
 
 class PropertyGraphExtract:
-    def __init__(self, llm: BaseLLM, example_prompt: str = prompt.extract_graph_prompt) -> None:
+    def __init__(
+        self,
+        llm: BaseLLM,
+        example_prompt: str = prompt.extract_graph_prompt,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
         self.llm = llm
         self.example_prompt = example_prompt
+        # chunks sent to the LLM at the same time, <= 1 extracts them one by one
+        # (the request rate is bounded by the provider limiter of the LLM client)
+        self.max_concurrency = max_concurrency if max_concurrency is not None else llm_settings.extract_max_concurrency
         self.NECESSARY_ITEM_KEYS = {"label", "type", "properties"}  # pylint: disable=invalid-name
 
     def run(self, context: Dict[str, Any]) -> Dict[str, List[Any]]:
@@ -91,8 +100,12 @@ class PropertyGraphExtract:
         if "edges" not in context:
             context["edges"] = []
         items = []
-        for chunk in chunks:
-            proceeded_chunk = self.extract_property_graph_by_llm(schema, chunk)
+        if self.max_concurrency > 1 and len(chunks) > 1:
+            responses = asyncio.run(self._extract_chunks_concurrently(schema, chunks))
+        else:
+            responses = [self.extract_property_graph_by_llm(schema, chunk) for chunk in chunks]
+        # responses keep the chunk order, so the merged vertices/edges are the same as a sequential run
+        for chunk, proceeded_chunk in zip(chunks, responses):
             log.debug(
                 "[LLM] %s input: %s \n output:%s",
                 self.__class__.__name__,
@@ -110,12 +123,29 @@ class PropertyGraphExtract:
         context["call_count"] = context.get("call_count", 0) + len(chunks)
         return context
 
-    def extract_property_graph_by_llm(self, schema, chunk):
+    def _build_prompt(self, schema, chunk) -> str:
         prompt = generate_extract_property_graph_prompt(chunk, schema)
         if self.example_prompt is not None:
             prompt = self.example_prompt + prompt
+        return prompt
+
+    def extract_property_graph_by_llm(self, schema, chunk):
+        prompt = self._build_prompt(schema, chunk)
         return self.llm.generate(prompt=prompt)
 
+    async def aextract_property_graph_by_llm(self, schema, chunk):
+        prompt = self._build_prompt(schema, chunk)
+        return await self.llm.agenerate(prompt=prompt)
+
+    async def _extract_chunks_concurrently(self, schema, chunks) -> List[str]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def extract(chunk):
+            async with semaphore:
+                return await self.aextract_property_graph_by_llm(schema, chunk)
+
+        return await asyncio.gather(*(extract(chunk) for chunk in chunks))
+
     @staticmethod
     def _primary_key_id(vertex_label, properties):
         id_strategy = vertex_label.get("id_strategy")
@@ -22,12 +22,17 @@ from hugegraph_llm.utils.log import log
 
 class WkFlowInput(GParam):
     texts: Optional[Union[str, List[str]]] = None  # texts input used by ChunkSplit Node
+    sources: Optional[List[str]] = None  # source name of each text, used by the chunk manifest
     language: Optional[str] = None  # language configuration used by ChunkSplit Node
     split_type: Optional[str] = None  # split type used by ChunkSplit Node
+    # keep only the chunk hashes in the state, the chunks are split again lazily where they are consumed
+    lazy_chunks: Optional[bool] = None
     example_prompt: Optional[str] = None  # need by graph information extract
     schema: Optional[str] = None  # Schema information requeired by SchemaNode
     # Request-scoped HugeGraph connection; None falls back to global huge_settings.
     graph_client_config: Optional[Dict[str, Any]] = None
+    # Request trace the nodes record their spans into; None when the request is not traced.
+    trace: Optional[Any] = None
     data_json: Optional[Dict[str, Any]] = None
     extract_type: Optional[str] = None
     query_examples: Optional[Any] = None
@@ -60,6 +65,8 @@ class WkFlowInput(GParam):
     topk_return_results: Optional[int] = None  # Top-k return results
     vector_dis_threshold: Optional[float] = None  # Vector distance threshold
     topk_per_keyword: Optional[int] = None  # Top-k per keyword
+    graph_latency_budget: Optional[float] = None  # Seconds to wait for the graph branch, None/0 waits for it
+    refine_graph_answer: Optional[bool] = None  # Stream a refined answer once a late graph branch lands
     max_keywords: Optional[int] = None
     max_items: Optional[int] = None
 
@@ -84,11 +91,14 @@ class WkFlowInput(GParam):
 
     def reset(self, _: CStatus) -> None:
         self.texts = None
+        self.sources = None
         self.language = None
         self.split_type = None
+        self.lazy_chunks = None
         self.example_prompt = None
         self.schema = None
         self.graph_client_config = None
+        self.trace = None
         self.data_json = None
         self.extract_type = None
         self.query_examples = None
@@ -120,6 +130,8 @@ class WkFlowInput(GParam):
         self.topk_return_results = None
         self.vector_dis_threshold = None
         self.topk_per_keyword = None
+        self.graph_latency_budget = None
+        self.refine_graph_answer = None
         self.max_keywords = None
         self.max_items = None
         # Semantic query related fields
@@ -141,6 +153,8 @@ class WkFlowState(GParam):
     schema: Optional[str] = None  # schema message
     simple_schema: Optional[str] = None
     chunks: Optional[List[str]] = None
+    chunk_hashes: Optional[List[str]] = None
+    chunk_sources: Optional[List[str]] = None
     edges: Optional[List[Any]] = None
     vertices: Optional[List[Any]] = None
     triples: Optional[List[Any]] = None
@@ -173,6 +187,8 @@ class WkFlowState(GParam):
     note: Optional[str] = None
     removed_vid_vector_num: Optional[int] = None
     added_vid_vector_num: Optional[int] = None
+    removed_chunk_vector_num: Optional[int] = None
+    added_chunk_vector_num: Optional[int] = None
     raw_texts: Optional[List] = None
     query_examples: Optional[List] = None
     few_shot_schema: Optional[Dict] = None
@@ -182,12 +198,15 @@ class WkFlowState(GParam):
 
     graph_ratio: Optional[float] = None
     query: Optional[str] = None
+    query_embedding: Optional[List[float]] = None
     vector_search: Optional[bool] = None
     graph_search: Optional[bool] = None
     max_graph_items: Optional[int] = None
     stream_generator: Optional[AsyncGenerator] = None
 
     graph_result_flag: Optional[int] = None
+    # future of a graph branch that outlived its latency budget
+    pending_graph_result: Optional[Any] = None
     vertex_degree_list: Optional[List] = None
     knowledge_with_degree: Optional[Dict] = None
     graph_context_head: Optional[str] = None
@@ -199,6 +218,8 @@ class WkFlowState(GParam):
         self.schema = None
         self.simple_schema = None
         self.chunks = None
+        self.chunk_hashes = None
+        self.chunk_sources = None
         self.edges = None
         self.vertices = None
         self.triples = None
@@ -230,6 +251,8 @@ class WkFlowState(GParam):
         self.note = None
         self.removed_vid_vector_num = None
         self.added_vid_vector_num = None
+        self.removed_chunk_vector_num = None
+        self.added_chunk_vector_num = None
 
         self.raw_texts = None
         self.query_examples = None
@@ -240,12 +263,14 @@ class WkFlowState(GParam):
 
         self.graph_ratio = None
         self.query = None
+        self.query_embedding = None
         self.vector_search = None
         self.graph_search = None
         self.max_graph_items = None
 
         self.stream_generator = None
         self.graph_result_flag = None
+        self.pending_graph_result = None
         self.vertex_degree_list = None
         self.knowledge_with_degree = None
         self.graph_context_head = None
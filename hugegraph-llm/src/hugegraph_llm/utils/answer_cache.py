@@ -0,0 +1,202 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hugegraph_llm.config import huge_settings, index_settings, llm_settings, prompt
+from hugegraph_llm.utils.log import log
+
+ANSWER_KEYS = ("raw_answer", "vector_only_answer", "graph_only_answer", "graph_vector_answer")
+
+# (created, normalized query vector, answer)
+CachedAnswer = Tuple[float, Optional[np.ndarray], Dict[str, Any]]
+
+
+class AnswerCache:
+    """
+    Process-wide cache of RAG flow answers, looked up by query embedding similarity.
+
+    An answer is reused for a query whose embedding has a cosine similarity of at least
+    ``huge_settings.rag_answer_cache_threshold`` with a cached query of the same flow, called with the
+    same parameters against the same graph, vector index, prompts and models. Entries expire after
+    ``huge_settings.rag_answer_cache_ttl`` seconds (0 disables caching) and are dropped whenever the
+    graph data or a vector index is rebuilt (see ``invalidate``).
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        threshold: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        embedding=None,
+    ):
+        self._ttl = ttl
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._embedding = embedding
+        self._shared_embedding = None
+        self._embedding_type = None
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], CachedAnswer]" = OrderedDict()
+        # bumped on invalidation so answers computed against the old graph/index are never reused
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl if self._ttl is not None else huge_settings.rag_answer_cache_ttl
+
+    @property
+    def threshold(self) -> float:
+        return self._threshold if self._threshold is not None else huge_settings.rag_answer_cache_threshold
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries if self._max_entries is not None else huge_settings.rag_answer_cache_size
+
+    def _get_embedding(self):
+        if self._embedding is not None:
+            return self._embedding
+        # Lazy import to avoid circular dependency
+        from hugegraph_llm.models.embeddings.init_embedding import (  # pylint: disable=import-outside-toplevel
+            Embeddings,
+        )
+
+        if self._embedding_type != llm_settings.embedding_type:
+            self._embedding_type = llm_settings.embedding_type
+            self._shared_embedding = Embeddings().get_embedding()
+        return self._shared_embedding
+
+    def _signature(self, flow_name: str, args: Sequence[Any], kwargs: Dict[str, Any]) -> str:
+        params = {
+            "flow": getattr(flow_name, "value", flow_name),
+            "args": list(args),
+            "kwargs": kwargs,
+            "generation": self._generation,
+            "graph": [huge_settings.graph_url, huge_settings.graph_space, huge_settings.graph_name],
+            "vector_index": index_settings.cur_vector_index,
+            "llm": [llm_settings.chat_llm_type, llm_settings.embedding_type],
+            "prompts": [prompt.answer_prompt, prompt.keywords_extract_prompt, prompt.gremlin_generate_prompt],
+        }
+        payload = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _embed(self, query: str) -> Optional[np.ndarray]:
+        try:
+            vector = np.asarray(self._get_embedding().get_text_embedding(query), dtype=np.float32)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            log.warning("Failed to embed the query for the answer cache: %s", e)
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def _find(self, signature: str, query: str, vector: Optional[np.ndarray], now: float):
+        with self._lock:
+            entry = self._entries.get((signature, query))
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end((signature, query))
+                return entry[2]
+            if vector is None:
+                return None
+            best_key, best_score = None, self.threshold
+            for key, (created, cached_vector, _) in self._entries.items():
+                if key[0] != signature or cached_vector is None or now - created >= self.ttl:
+                    continue
+                score = float(np.dot(cached_vector, vector))
+                if score >= best_score:
+                    best_key, best_score = key, score
+            if best_key is None:
+                return None
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key][2]
+
+    def get_or_compute(
+        self,
+        flow_name: str,
+        args: Sequence[Any],
+        kwargs: Dict[str, Any],
+        compute: Callable[[], Any],
+    ) -> Any:
+        """Return the cached answer of a similar query, or compute the answer and cache it."""
+        query = kwargs.get("query", args[0] if args else None)
+        if self.ttl <= 0 or not isinstance(query, str) or not query.strip():
+            return compute()
+        rest_args = list(args[1:]) if "query" not in kwargs else list(args)
+        rest_kwargs = {k: v for k, v in kwargs.items() if k != "query"}
+        signature = self._signature(flow_name, rest_args, rest_kwargs)
+        now = time.monotonic()
+
+        answer = self._find(signature, query, None, now)
+        vector = None
+        if answer is None:
+            vector = self._embed(query)
+            answer = self._find(signature, query, vector, now) if vector is not None else None
+        if answer is not None:
+            with self._lock:
+                self.hits += 1
+            log.debug("Answer cache hit for %s query: %s", flow_name, query)
+            return copy.deepcopy(answer)
+
+        with self._lock:
+            self.misses += 1
+        result = compute()
+        cacheable = isinstance(result, dict) and "error" not in result and not result.get("partial")
+        if cacheable and any(result.get(key) for key in ANSWER_KEYS):
+            with self._lock:
+                self._entries[(signature, query)] = (time.monotonic(), vector, copy.deepcopy(result))
+                self._entries.move_to_end((signature, query))
+                while len(self._entries) > max(self.max_entries, 0):
+                    self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self) -> None:
+        """Drop every cached answer, called when the graph data or a vector index changes."""
+        with self._lock:
+            self._generation += 1
+            if self._entries:
+                log.debug("Answer cache invalidated, %s answers dropped", len(self._entries))
+            self._entries.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "answers": len(self._entries),
+            }
+
+
+answer_cache = AnswerCache()
@@ -30,6 +30,7 @@ from hugegraph_llm.operators.document_op.chunk_split import (
 )
 
 from ..config import huge_settings
+from .answer_cache import answer_cache
 from .hugegraph_utils import clean_hg_data
 from .log import log
 from .vector_index_utils import read_documents
@@ -52,6 +53,7 @@ def clean_all_graph_index():
     vector_index = get_vector_index_class(index_settings.cur_vector_index)
     vector_index.clean(huge_settings.graph_name, "graph_vids")
     vector_index.clean("gremlin_examples")
+    answer_cache.invalidate()
     log.warning("Clear graph index and text2gql index successfully!")
     gr.Info("Clear graph index and text2gql index successfully!")
 
@@ -0,0 +1,123 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from pyhugegraph.client import PyHugeClient
+
+from hugegraph_llm.config import huge_settings
+from hugegraph_llm.utils.log import log
+
+GraphKey = Tuple[str, Optional[str], str]
+
+
+class GraphSchemaCache:
+    """
+    Process-wide cache of HugeGraph schema responses, keyed by (url, graphspace, graph).
+
+    Entries expire after ``huge_settings.graph_schema_cache_ttl`` seconds (0 disables caching) and
+    must be invalidated explicitly by code that writes the schema.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[GraphKey, Dict[str, Tuple[float, Any]]] = {}
+        # bumped on invalidation so a load racing with a schema write never stores a stale response
+        self._generations: Dict[GraphKey, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl if self._ttl is not None else huge_settings.graph_schema_cache_ttl
+
+    @staticmethod
+    def graph_key(client: PyHugeClient) -> Optional[GraphKey]:
+        cfg = getattr(client, "cfg", None)
+        if cfg is None:
+            return None
+        return cfg.url, cfg.graphspace, cfg.graph_name
+
+    def _get(self, client: PyHugeClient, kind: str, loader: Callable[[], Any]) -> Any:
+        key = self.graph_key(client)
+        if key is None or self.ttl <= 0:
+            return loader()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key, {}).get(kind)
+            if entry is not None and now - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generations.get(key, 0)
+
+        value = loader()
+        # A None response means the schema could not be read, retry on the next call
+        if value is not None:
+            with self._lock:
+                if self._generations.get(key, 0) == generation:
+                    self._entries.setdefault(key, {})[kind] = (now, value)
+        return value
+
+    def get_schema(self, client: PyHugeClient) -> Optional[Dict[str, Any]]:
+        # callers usually put the schema into the (mutable) flow context, so hand out a copy
+        return copy.deepcopy(self._get(client, "schema", lambda: client.schema().getSchema()))
+
+    def get_vertex_labels(self, client: PyHugeClient) -> Optional[list]:
+        return self._get(client, "vertex_labels", lambda: client.schema().getVertexLabels())
+
+    def get_edge_labels(self, client: PyHugeClient) -> Optional[list]:
+        return self._get(client, "edge_labels", lambda: client.schema().getEdgeLabels())
+
+    def get_relations(self, client: PyHugeClient) -> Optional[list]:
+        return self._get(client, "relations", lambda: client.schema().getRelations())
+
+    def invalidate(self, client: PyHugeClient) -> None:
+        """Drop every cached schema response of the graph the client points to."""
+        key = self.graph_key(client)
+        if key is None:
+            return
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if self._entries.pop(key, None) is not None:
+                log.debug("Graph schema cache invalidated for %s", key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in self._entries:
+                self._generations[key] = self._generations.get(key, 0) + 1
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "graphs": len(self._entries),
+            }
+
+
+graph_schema_cache = GraphSchemaCache()
@@ -19,13 +19,17 @@ import json
 import os
 import shutil
 from datetime import datetime
+from typing import Any, Dict, Optional
 
 import requests
 from pyhugegraph.client import PyHugeClient
 from requests.auth import HTTPBasicAuth
 
 from hugegraph_llm.config import huge_settings, resource_path
+from hugegraph_llm.utils.answer_cache import answer_cache
+from hugegraph_llm.utils.graph_schema_cache import graph_schema_cache
 from hugegraph_llm.utils.log import log
+from hugegraph_llm.utils.tracing import timed
 
 MAX_BACKUP_DIRS = 7
 MAX_VERTICES = 100000
@@ -33,18 +37,43 @@ MAX_EDGES = 200000
 BACKUP_DIR = str(os.path.join(resource_path, "backup-graph-data-4020", huge_settings.graph_name))
 
 
-def run_gremlin_query(query, fmt=True):
-    res = get_hg_client().gremlin().exec(query)
+def run_gremlin_query(query, fmt=True, connection: Optional[Dict[str, Any]] = None):
+    client = get_hg_client(connection)
+    with timed("gremlin"):
+        res = client.gremlin().exec(query)
     return json.dumps(res, indent=4, ensure_ascii=False) if fmt else res
 
 
-def get_hg_client():
+def graph_connection(connection: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Return the graph a request works on: its request-scoped ``connection`` (``WkFlowInput.graph_client_config``)
+    as a complete unit, or the global settings when the request has none.
+    """
+    if connection is not None:
+        return {
+            "url": connection.get("url"),
+            "graph": connection.get("graph"),
+            "user": connection.get("user"),
+            "pwd": connection.get("pwd"),
+            "graphspace": connection.get("graphspace"),
+        }
+    return {
+        "url": huge_settings.graph_url,
+        "graph": huge_settings.graph_name,
+        "user": huge_settings.graph_user,
+        "pwd": huge_settings.graph_pwd,
+        "graphspace": huge_settings.graph_space,
+    }
+
+
+def get_hg_client(connection: Optional[Dict[str, Any]] = None):
+    conn = graph_connection(connection)
     return PyHugeClient(
-        url=huge_settings.graph_url,
-        graph=huge_settings.graph_name,
-        user=huge_settings.graph_user,
-        pwd=huge_settings.graph_pwd,
-        graphspace=huge_settings.graph_space,
+        url=conn["url"],
+        graph=conn["graph"],
+        user=conn["user"],
+        pwd=conn["pwd"],
+        graphspace=conn["graphspace"],
     )
 
 
@@ -80,7 +109,8 @@ def init_hg_test_data():
     graph.addEdge("ActedIn", "Al Pacino", "The Godfather Part II", {})
     graph.addEdge("ActedIn", "Al Pacino", "The Godfather Coda The Death of Michael Corleone", {})
     graph.addEdge("ActedIn", "Robert De Niro", "The Godfather Part II", {})
-    schema.getSchema()
+    graph_schema_cache.invalidate(client)
+    answer_cache.invalidate()
     graph.close()
     return {
         "vertex": ["Person", "Movie"],
@@ -93,6 +123,8 @@ def init_hg_test_data():
 def clean_hg_data():
     client = get_hg_client()
     client.graphs().clear_graph_all_data()
+    graph_schema_cache.invalidate(client)
+    answer_cache.invalidate()
 
 
 def create_dir_safely(path):
@@ -0,0 +1,374 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import asyncio
+import contextlib
+import functools
+import inspect
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+
+from hugegraph_llm.config import llm_settings
+from hugegraph_llm.utils.log import log
+
+
+class TokenBucket:
+    """A bucket of ``per_minute`` units refilled continuously, its level may go negative to queue reservations."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` units and return the seconds to wait until they are actually available."""
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        # a single request larger than the bucket only has to wait for a full bucket
+        self.level -= min(amount, self.capacity)
+        return max(0.0, -self.level / self.rate)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limits shared by sync and async callers (0 disables a limit).
+    """
+
+    def __init__(self, rpm: int = 0, tpm: int = 0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests: Optional[TokenBucket] = TokenBucket(rpm) if rpm > 0 else None
+        self._tokens: Optional[TokenBucket] = TokenBucket(tpm) if tpm > 0 else None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._requests is not None or self._tokens is not None
+
+    def _reserve(self, tokens: int, requests: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            delay = 0.0
+            if self._requests is not None and requests > 0:
+                delay = max(delay, self._requests.reserve(requests, now))
+            if self._tokens is not None and tokens > 0:
+                delay = max(delay, self._tokens.reserve(tokens, now))
+            return delay
+
+    def wait(self, tokens: int = 0, requests: int = 1) -> None:
+        """Block until ``requests`` requests of ``tokens`` tokens in total may be sent."""
+        if self.enabled:
+            delay = self._reserve(tokens, requests)
+            if delay > 0:
+                time.sleep(delay)
+
+    async def acquire(self, tokens: int = 0, requests: int = 1) -> None:
+        """Wait until ``requests`` requests of ``tokens`` tokens may be sent, without blocking the event loop."""
+        if self.enabled:
+            delay = self._reserve(tokens, requests)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+
+class ConcurrencyTimeoutError(RuntimeError):
+    """Raised when no concurrency slot of a provider becomes available within the acquire timeout."""
+
+    def __init__(self, name: str, timeout: float, in_flight: int):
+        super().__init__(f"No concurrency slot of {name} became available in {timeout}s ({in_flight} calls in flight)")
+        self.name = name
+        self.timeout = timeout
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD limit of the calls in flight: halved when the provider rate limits us, raised by one per
+    ``limit`` successful calls otherwise, between 1 and ``max_limit``. Shared by threads and event loops.
+
+    A caller waits at most ``timeout`` seconds for a slot (0 waits forever) before ConcurrencyTimeoutError.
+    """
+
+    # ignore further rate limit errors of the calls that were already in flight when the limit was cut
+    DECREASE_COOLDOWN = 1.0
+
+    def __init__(
+        self,
+        max_limit: int,
+        initial_limit: Optional[int] = None,
+        timeout: float = 0,
+        name: str = "the provider",
+    ):
+        self.max_limit = max(1, max_limit)
+        self.limit = float(min(self.max_limit, initial_limit or self.max_limit))
+        self.timeout = timeout
+        self.name = name
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        self._last_decrease = 0.0
+
+    def _try_acquire(self) -> bool:
+        if self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return True
+        return False
+
+    def _remaining(self, deadline: Optional[float]) -> Optional[float]:
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise ConcurrencyTimeoutError(self.name, self.timeout, self.in_flight)
+        return remaining
+
+    def acquire(self) -> None:
+        deadline = time.monotonic() + self.timeout if self.timeout > 0 else None
+        with self._cond:
+            while not self._try_acquire():
+                self._cond.wait(self._remaining(deadline))
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + self.timeout if self.timeout > 0 else None
+        while True:
+            event = asyncio.Event()
+            with self._lock:
+                if self._try_acquire():
+                    return
+                remaining = self._remaining(deadline)
+                waiter = (loop, event)
+                self._async_waiters.append(waiter)
+            try:
+                await asyncio.wait_for(event.wait(), remaining)
+            except asyncio.TimeoutError:
+                raise ConcurrencyTimeoutError(self.name, self.timeout, self.in_flight) from None
+            finally:
+                # a cancelled or timed out waiter must not stay registered on a loop that may be closed
+                with self._lock:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    def _wake_up(self) -> None:
+        # called with the lock held
+        self._cond.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, event in waiters:
+            if loop.is_closed():
+                continue
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # the loop was closed meanwhile, its waiter is gone
+                continue
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._wake_up()
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self.limit < self.max_limit:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                self._wake_up()
+
+    def on_rate_limited(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < self.DECREASE_COOLDOWN:
+                return
+            self._last_decrease = now
+            self.limit = max(1.0, self.limit / 2)
+            log.warning("Rate limited by the provider, concurrency lowered to %s", int(self.limit))
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    # openai / litellm raise RateLimitError, ollama and http clients report the 429 status code
+    return type(error).__name__ == "RateLimitError" or getattr(error, "status_code", None) == 429
+
+
+class ProviderLimiter:
+    """Rate and adaptive concurrency limits of one provider + model + endpoint."""
+
+    def __init__(
+        self,
+        rpm: int = 0,
+        tpm: int = 0,
+        max_concurrency: int = 16,
+        acquire_timeout: float = 0,
+        name: str = "the provider",
+    ):
+        self.rate = RateLimiter(rpm, tpm)
+        self.concurrency = AdaptiveConcurrency(max_concurrency, timeout=acquire_timeout, name=name)
+
+    def _report(self, error: Optional[BaseException]) -> None:
+        if error is None:
+            self.concurrency.on_success()
+        elif is_rate_limit_error(error):
+            self.concurrency.on_rate_limited()
+
+    @contextlib.contextmanager
+    def limit(self, tokens: int = 0, requests: int = 1):
+        self.concurrency.acquire()
+        try:
+            self.rate.wait(tokens, requests)
+            yield
+            self._report(None)
+        except BaseException as e:
+            self._report(e)
+            raise
+        finally:
+            self.concurrency.release()
+
+    @contextlib.asynccontextmanager
+    async def alimit(self, tokens: int = 0, requests: int = 1):
+        await self.concurrency.acquire_async()
+        try:
+            await self.rate.acquire(tokens, requests)
+            yield
+            self._report(None)
+        except BaseException as e:
+            self._report(e)
+            raise
+        finally:
+            self.concurrency.release()
+
+
+LimiterKind = Literal["llm", "embedding"]
+
+_limiters: Dict[Tuple[str, str, Optional[str], Optional[str]], ProviderLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_provider_limiter(
+    kind: LimiterKind, provider: str, model: Optional[str], api_base: Optional[str] = None
+) -> ProviderLimiter:
+    """
+    Return the process-wide limiter of a provider + model + endpoint, created from the llm settings on first use.
+
+    Two hosts serving the same model name have their own budgets.
+    """
+    key = (kind, provider, model, api_base)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = ProviderLimiter(
+                rpm=getattr(llm_settings, f"{kind}_rpm_limit"),
+                tpm=getattr(llm_settings, f"{kind}_tpm_limit"),
+                max_concurrency=getattr(llm_settings, f"{kind}_max_concurrency"),
+                acquire_timeout=getattr(llm_settings, f"{kind}_acquire_timeout"),
+                name=f"{kind} {provider}/{model}" + (f" at {api_base}" if api_base else ""),
+            )
+        return limiter
+
+
+def _estimate_cost(client: Any, limiter: ProviderLimiter, arguments: Dict[str, Any]) -> Tuple[int, int]:
+    """Return the (requests, tokens) a call will send, tokens are only counted when a TPM limit is set."""
+    requests = 1
+    texts = arguments.get("texts")
+    if isinstance(texts, list):
+        requests = max(1, math.ceil(len(texts) / max(1, arguments.get("batch_size") or 1)))
+    if not limiter.rate.tpm:
+        return requests, 0
+    if isinstance(texts, list):
+        text = " ".join(texts)
+    elif arguments.get("messages"):
+        text = " ".join(str(message.get("content", "")) for message in arguments["messages"])
+    else:
+        text = arguments.get("prompt") or arguments.get("text") or ""
+    try:
+        return requests, int(client.num_tokens_from_string(text))
+    except Exception:  # pylint: disable=broad-exception-caught
+        # rough estimate for clients without a tokenizer
+        return requests, len(text) // 4
+
+
+# marks a stream that ended before its first chunk
+_END = object()
+
+
+def rate_limited(kind: LimiterKind) -> Callable:
+    """
+    Run an LLM / embedding client method under the limiter of its provider (class), model and endpoint.
+
+    Streaming methods only hold their concurrency slot until the first chunk arrives, so a slow or
+    abandoned consumer does not block the other calls of the provider.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        def prepare(self, args, kwargs) -> Tuple[ProviderLimiter, int, int]:
+            limiter = get_provider_limiter(
+                kind, type(self).__name__, getattr(self, "model", None), getattr(self, "api_base", None)
+            )
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            return (limiter, *_estimate_cost(self, limiter, bound.arguments))
+
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def async_gen_wrapper(self, *args, **kwargs):
+                limiter, requests, tokens = prepare(self, args, kwargs)
+                stream = func(self, *args, **kwargs)
+                async with limiter.alimit(tokens, requests):
+                    first = await anext(stream, _END)
+                if first is not _END:
+                    yield first
+                    async for item in stream:
+                        yield item
+
+            return async_gen_wrapper
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                limiter, requests, tokens = prepare(self, args, kwargs)
+                async with limiter.alimit(tokens, requests):
+                    return await func(self, *args, **kwargs)
+
+            return async_wrapper
+
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def gen_wrapper(self, *args, **kwargs):
+                limiter, requests, tokens = prepare(self, args, kwargs)
+                stream = func(self, *args, **kwargs)
+                with limiter.limit(tokens, requests):
+                    first = next(stream, _END)
+                if first is not _END:
+                    yield first
+                    yield from stream
+
+            return gen_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            limiter, requests, tokens = prepare(self, args, kwargs)
+            with limiter.limit(tokens, requests):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,367 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from hugegraph_llm.config import huge_settings
+from hugegraph_llm.utils.log import log
+
+TRACE_EXPORTERS = ("none", "memory", "file", "otel")
+
+
+class Span:
+    """A timed step of a request (the request itself, a flow or a node) with its counters."""
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str] = None, **attributes: Any):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.status = "ok"
+        self.attributes: Dict[str, Any] = dict(attributes)
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._duration: Optional[float] = None
+
+    def add(self, key: str, value: float = 1) -> None:
+        with self._lock:
+            self.attributes[key] = self.attributes.get(key, 0) + value
+
+    def append(self, key: str, value: Any) -> None:
+        with self._lock:
+            self.attributes.setdefault(key, []).append(value)
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self._duration = time.perf_counter() - self._start
+            self.end_ns = self.start_ns + int(self._duration * 1e9)
+
+    @property
+    def duration(self) -> Optional[float]:
+        return self._duration
+
+    def to_json(self) -> Dict[str, Any]:
+        with self._lock:
+            attributes = {k: list(v) if isinstance(v, list) else v for k, v in self.attributes.items()}
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start_ns / 1e9,
+            "end": self.end_ns / 1e9 if self.end_ns is not None else None,
+            "duration": self._duration,
+            "status": self.status,
+            "attributes": attributes,
+        }
+
+
+class RequestTrace:
+    """All spans of one request, rooted at a span named after the request (or the flow it runs)."""
+
+    def __init__(self, name: str = "request", request_id: Optional[str] = None):
+        self.request_id = request_id or uuid.uuid4().hex
+        self.trace_id = uuid.uuid4().hex
+        self.root = Span(name, self.trace_id, request_id=self.request_id)
+        self._lock = threading.Lock()
+        self._spans: List[Span] = [self.root]
+
+    def start_span(self, name: str, parent: Optional[Span] = None, **attributes: Any) -> Span:
+        if parent is None or parent.trace_id != self.trace_id:
+            parent = self.root
+        span_ = Span(name, self.trace_id, parent.span_id, **attributes)
+        with self._lock:
+            self._spans.append(span_)
+        return span_
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "request_id": self.request_id,
+            "trace_id": self.trace_id,
+            "duration": self.root.duration,
+            "spans": [span_.to_json() for span_ in self.spans],
+        }
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """The trace as an OTLP/JSON ``ExportTraceServiceRequest``."""
+        spans = []
+        for span_ in self.spans:
+            failed = span_.status != "ok"
+            item = {
+                "traceId": self.trace_id,
+                "spanId": span_.span_id,
+                "name": span_.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(span_.start_ns),
+                "endTimeUnixNano": str(span_.end_ns or span_.start_ns),
+                "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in span_.to_json()["attributes"].items()],
+                # STATUS_CODE_ERROR / STATUS_CODE_OK
+                "status": {"code": 2, "message": span_.status} if failed else {"code": 1},
+            }
+            if span_.parent_id:
+                item["parentSpanId"] = span_.parent_id
+            spans.append(item)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "hugegraph-llm"}}]},
+                    "scopeSpans": [{"scope": {"name": "hugegraph_llm"}, "spans": spans}],
+                }
+            ]
+        }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+class TraceExporter:
+    """Sink of finished request traces, the default one drops them."""
+
+    def export(self, trace: RequestTrace) -> None:
+        pass
+
+
+class InMemoryTraceExporter(TraceExporter):
+    """Keeps the latest finished traces in memory, for tests and debugging."""
+
+    def __init__(self, max_traces: int = 1000):
+        self.traces: "deque[Dict[str, Any]]" = deque(maxlen=max_traces)
+
+    def export(self, trace: RequestTrace) -> None:
+        self.traces.append(trace.to_json())
+
+    def clear(self) -> None:
+        self.traces.clear()
+
+
+class FileTraceExporter(TraceExporter):
+    """Appends every trace as one OTLP/JSON line, the format read by the OpenTelemetry collector's file receiver."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def export(self, trace: RequestTrace) -> None:
+        line = json.dumps(trace.to_otlp(), ensure_ascii=False)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class OpenTelemetryTraceExporter(TraceExporter):
+    """Replays finished traces through the OpenTelemetry API, so whatever SDK/exporter the process set up ships them."""
+
+    def __init__(self):
+        try:
+            from opentelemetry import trace as otel_trace  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError("TRACE_EXPORTER=otel requires `pip install opentelemetry-api`") from e
+        self._otel_trace = otel_trace
+        self._tracer = otel_trace.get_tracer("hugegraph_llm")
+
+    def export(self, trace: RequestTrace) -> None:
+        otel_spans = {}
+        # spans are recorded in start order, every parent is replayed before its children
+        for span_ in trace.spans:
+            parent = otel_spans.get(span_.parent_id)
+            context = self._otel_trace.set_span_in_context(parent) if parent is not None else None
+            attributes = {
+                k: v if isinstance(v, (bool, int, float, str, list)) else str(v)
+                for k, v in span_.to_json()["attributes"].items()
+            }
+            otel_span = self._tracer.start_span(
+                span_.name, context=context, start_time=span_.start_ns, attributes=attributes
+            )
+            if span_.status != "ok":
+                otel_span.set_status(self._otel_trace.Status(self._otel_trace.StatusCode.ERROR, span_.status))
+            otel_span.end(end_time=span_.end_ns or span_.start_ns)
+            otel_spans[span_.span_id] = otel_span
+
+
+_exporter: Optional[TraceExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def get_trace_exporter() -> TraceExporter:
+    global _exporter  # pylint: disable=global-statement
+    if _exporter is None:
+        with _exporter_lock:
+            if _exporter is None:
+                kind = (huge_settings.trace_exporter or "none").lower()
+                if kind == "memory":
+                    _exporter = InMemoryTraceExporter()
+                elif kind == "file":
+                    _exporter = FileTraceExporter(huge_settings.trace_file_path)
+                elif kind == "otel":
+                    _exporter = OpenTelemetryTraceExporter()
+                else:
+                    if kind != "none":
+                        log.warning("Unknown trace exporter %s, expected one of %s", kind, TRACE_EXPORTERS)
+                    _exporter = TraceExporter()
+    return _exporter
+
+
+def set_trace_exporter(exporter: Optional[TraceExporter]) -> None:
+    """Replace the exporter, None rebuilds it from the settings on the next trace."""
+    global _exporter  # pylint: disable=global-statement
+    with _exporter_lock:
+        _exporter = exporter
+
+
+def tracing_enabled() -> bool:
+    return type(get_trace_exporter()) is not TraceExporter  # pylint: disable=unidiomatic-typecheck
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("hugegraph_llm_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("hugegraph_llm_span", default=None)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    return _current_trace.get()
+
+
+def new_trace(name: str, request_id: Optional[str] = None, force: bool = False) -> Optional[RequestTrace]:
+    """A trace for a new request, None when tracing is off and the caller did not ask for one."""
+    if not force and not tracing_enabled():
+        return None
+    return RequestTrace(name, request_id)
+
+
+def finish_trace(trace: Optional[RequestTrace]) -> None:
+    if trace is None:
+        return
+    trace.root.end()
+    try:
+        get_trace_exporter().export(trace)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        log.warning("Failed to export trace %s: %s", trace.request_id, e)
+
+
+@contextmanager
+def span(trace: Optional[RequestTrace], name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Time a step as a child of the current span, the counters recorded meanwhile land on it."""
+    if trace is None:
+        yield None
+        return
+    span_ = trace.start_span(name, _current_span.get(), **attributes)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(span_)
+    try:
+        yield span_
+    except BaseException as e:
+        span_.status = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        span_.end()
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+
+
+@contextmanager
+def request_trace(
+    name: str = "request", request_id: Optional[str] = None, force: bool = False
+) -> Iterator[Optional[RequestTrace]]:
+    """
+    Trace a request and export it when done. Inside an already traced request it only adds a child span,
+    ``force`` traces the request even if no exporter is configured (e.g. to return the trace in the response).
+    """
+    parent = current_trace()
+    if parent is not None:
+        with span(parent, name):
+            yield parent
+        return
+    trace = new_trace(name, request_id, force)
+    if trace is None:
+        yield None
+        return
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(trace.root)
+    try:
+        yield trace
+    except BaseException as e:
+        trace.root.status = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+        finish_trace(trace)
+
+
+def record(key: str, value: float = 1) -> None:
+    """Add to a counter of the current span, a no-op outside a traced request."""
+    span_ = _current_span.get()
+    if span_ is not None:
+        span_.add(key, value)
+
+
+def record_token_usage(usage: Any) -> None:
+    """Count an LLM call and its token usage (an OpenAI/LiteLLM usage object or a dict) on the current span."""
+    span_ = _current_span.get()
+    if span_ is None:
+        return
+    span_.add("llm_calls")
+    if usage is None:
+        return
+    for key in ("prompt_tokens", "completion_tokens", "total_tokens"):
+        value = usage.get(key) if isinstance(usage, dict) else getattr(usage, key, None)
+        if isinstance(value, int):
+            span_.add(key, value)
+
+
+def record_embedding_batch(size: int) -> None:
+    span_ = _current_span.get()
+    if span_ is not None:
+        span_.add("embedding_texts", size)
+        span_.append("embedding_batch_sizes", size)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Count a call (e.g. a gremlin query) and its latency as ``<name>_count``/``<name>_seconds``."""
+    span_ = _current_span.get()
+    if span_ is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        span_.add(f"{name}_count")
+        span_.add(f"{name}_seconds", time.perf_counter() - start)
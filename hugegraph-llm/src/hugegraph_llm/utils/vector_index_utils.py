@@ -25,9 +25,11 @@ from pypdf import PdfReader
 
 from hugegraph_llm.config import huge_settings, index_settings
 from hugegraph_llm.flows.scheduler import SchedulerSingleton
+from hugegraph_llm.indices.chunk_manifest import ChunkManifest
 from hugegraph_llm.indices.vector_index.base import VectorStoreBase
 from hugegraph_llm.indices.vector_index.faiss_vector_store import FaissVectorIndex
 from hugegraph_llm.models.embeddings.init_embedding import Embeddings
+from hugegraph_llm.utils.answer_cache import answer_cache
 
 
 def read_pdf_text(full_path: str) -> str:
@@ -104,6 +106,8 @@ def get_vector_index_info():
 def clean_vector_index():
     vector_index = get_vector_index_class(index_settings.cur_vector_index)
     vector_index.clean(huge_settings.graph_name, "chunks")
+    ChunkManifest.clean(huge_settings.graph_name, "chunks")
+    answer_cache.invalidate()
     gr.Info("Clean vector index successfully!")
 
 
@@ -111,8 +115,10 @@ def build_vector_index(input_file, input_text):
     if input_file and input_text:
         raise gr.Error("Please only choose one between file and text.")
     texts = read_documents(input_file, input_text)
+    # uploaded files are tracked by name, so re-uploading a changed file replaces its old chunks
+    sources = None if input_text else [Path(file.name).name for file in input_file]
     scheduler = SchedulerSingleton.get_instance()
-    return scheduler.schedule_flow("build_vector_index", texts)
+    return scheduler.schedule_flow("build_vector_index", texts, sources=sources)
 
 
 def get_vector_index_class(vector_index_str: str) -> Type[VectorStoreBase]:
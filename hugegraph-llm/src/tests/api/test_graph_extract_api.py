@@ -23,12 +23,14 @@ from fastapi import APIRouter, FastAPI, HTTPException, status
 from fastapi.testclient import TestClient
 from pydantic import ValidationError
 
+from hugegraph_llm.api.exceptions.rag_exceptions import scheduler_busy_handler
 from hugegraph_llm.api.graph_extract_api import GraphExtractService, graph_extract_http_api
 from hugegraph_llm.api.models.graph_extract_requests import GraphExtractClientConfig, GraphExtractRequest
 from hugegraph_llm.api.models.graph_extract_responses import GraphExtractResponse
 from hugegraph_llm.api.rag_api import rag_http_api
 from hugegraph_llm.config import huge_settings
 from hugegraph_llm.flows.graph_extract import GraphExtractFlow
+from hugegraph_llm.flows.pipeline_pool import SchedulerBusyError
 from hugegraph_llm.state.ai_state import WkFlowInput
 
 INLINE_SCHEMA = {"vertexlabels": [], "edgelabels": []}
@@ -76,6 +78,20 @@ def test_graph_extract_returns_envelope(mock_singleton):
     assert body["meta"] == {"vertex_count": 1, "edge_count": 0, "text_count": 1}
 
 
+@patch("hugegraph_llm.api.graph_extract_api.SchedulerSingleton")
+def test_graph_extract_busy_scheduler_returns_503(mock_singleton):
+    scheduler = MagicMock()
+    scheduler.schedule_flow.side_effect = SchedulerBusyError("graph_extract", 2.5)
+    mock_singleton.get_instance.return_value = scheduler
+    client = _graph_client()
+    client.app.add_exception_handler(SchedulerBusyError, scheduler_busy_handler)
+
+    response = client.post("/graph/extract", json={"texts": "x", "schema": INLINE_SCHEMA})
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "3"
+
+
 @patch("hugegraph_llm.api.graph_extract_api.SchedulerSingleton")
 def test_graph_extract_omits_meta_by_default(mock_singleton):
     scheduler = MagicMock()
@@ -308,6 +324,7 @@ def test_flow_prepare_sets_request_local_graph_config():
 
     assert prepared_input.graph_client_config == {
         "url": huge_settings.graph_url,
+        "graph": "custom_graph",
         "user": "admin",
         "pwd": "secret",
         "graphspace": "space_a",
@@ -358,6 +375,7 @@ def test_flow_build_flow_preserves_split_type_and_client_config(monkeypatch):
     assert prepared_input.split_type == "paragraph"
     assert prepared_input.graph_client_config == {
         "url": huge_settings.graph_url,
+        "graph": "custom_graph",
         "user": "admin",
         "pwd": "secret",
         "graphspace": "space_a",
@@ -286,20 +286,17 @@ def test_rag_api_invalid_request_body_returns_validation_shape():
     assert response.json()["detail"][0]["loc"][-1] == "query"
 
 
-def test_rag_client_config_updates_only_explicit_graph_fields(monkeypatch):
+def test_rag_client_config_is_passed_as_request_scoped_graph_config(monkeypatch):
     monkeypatch.setattr(huge_settings, "graph_url", "http://original:8080")
     monkeypatch.setattr(huge_settings, "graph_name", "original_graph")
     monkeypatch.setattr(huge_settings, "graph_user", "original_user")
     monkeypatch.setattr(huge_settings, "graph_pwd", "original_pwd")
     monkeypatch.setattr(huge_settings, "graph_space", "original_space")
-    observed_settings = {}
-
-    def rag_answer_func(**_kwargs):
-        observed_settings["graph_url"] = huge_settings.graph_url
-        observed_settings["graph_name"] = huge_settings.graph_name
-        observed_settings["graph_user"] = huge_settings.graph_user
-        observed_settings["graph_pwd"] = huge_settings.graph_pwd
-        observed_settings["graph_space"] = huge_settings.graph_space
+    observed = {}
+
+    def rag_answer_func(**kwargs):
+        observed["graph_client_config"] = kwargs["graph_client_config"]
+        observed["graph_url"] = huge_settings.graph_url
         return ("raw", "vector", "graph", "graph_vector")
 
     client, callbacks = _make_test_client(rag_answer_func=Mock(side_effect=rag_answer_func))
@@ -316,18 +313,39 @@ def test_rag_client_config_updates_only_explicit_graph_fields(monkeypatch):
 
     assert response.status_code == status.HTTP_200_OK
     callbacks["rag_answer_func"].assert_called_once()
-    assert observed_settings == {
-        "graph_url": "http://override:8080",
-        "graph_name": "original_graph",
-        "graph_user": "original_user",
-        "graph_pwd": "original_pwd",
-        "graph_space": "original_space",
+    # only the explicit fields override the configured graph, the global settings are never touched
+    assert observed == {
+        "graph_client_config": {
+            "url": "http://override:8080",
+            "graph": "original_graph",
+            "user": "original_user",
+            "pwd": "original_pwd",
+            "graphspace": "original_space",
+        },
+        "graph_url": "http://original:8080",
     }
-    assert huge_settings.graph_url == "http://original:8080"
-    assert huge_settings.graph_name == "original_graph"
-    assert huge_settings.graph_user == "original_user"
-    assert huge_settings.graph_pwd == "original_pwd"
-    assert huge_settings.graph_space == "original_space"
+
+
+def test_rag_without_client_config_uses_configured_graph():
+    client, callbacks = _make_test_client()
+
+    response = client.post("/rag", json={"query": "find vertices"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert callbacks["rag_answer_func"].call_args.kwargs["graph_client_config"] is None
+
+
+def test_rag_returns_request_trace_when_asked():
+    client, _ = _make_test_client()
+
+    response = client.post("/rag", json={"query": "find vertices", "request_id": "req-1", "trace": True})
+    untraced = client.post("/rag", json={"query": "find vertices"})
+
+    assert response.status_code == status.HTTP_200_OK
+    trace = response.json()["trace"]
+    assert trace["request_id"] == "req-1"
+    assert trace["spans"][0]["name"] == "rag"
+    assert "trace" not in untraced.json()
 
 
 def test_llm_config_rejects_unsupported_provider_without_mutating(monkeypatch):
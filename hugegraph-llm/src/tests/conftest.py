@@ -51,6 +51,7 @@ def hugegraph_client(hugegraph_service):
     from pyhugegraph.client import PyHugeClient
 
     from hugegraph_llm.config import huge_settings
+    from hugegraph_llm.utils.graph_schema_cache import graph_schema_cache
 
     original = {
         "graph_url": huge_settings.graph_url,
@@ -74,12 +75,14 @@ def hugegraph_client(hugegraph_service):
     )
     client.graphs().clear_graph_all_data()
     _clear_quality_schema(client)
+    graph_schema_cache.clear()
     try:
         yield client
     finally:
         try:
             client.graphs().clear_graph_all_data()
             _clear_quality_schema(client)
+            graph_schema_cache.clear()
         finally:
             for key, value in original.items():
                 setattr(huge_settings, key, value)
@@ -0,0 +1,139 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from hugegraph_llm.flows.pipeline_pool import PipelinePool, SchedulerBusyError
+
+
+class FakeManager:
+    """Minimal GPipelineManager: added and released pipelines become fetchable again."""
+
+    def __init__(self):
+        self.idle = []
+
+    def fetch(self):
+        return self.idle.pop() if self.idle else None
+
+    def add(self, pipeline):
+        self.idle.append(pipeline)
+
+    def release(self, pipeline):
+        self.idle.append(pipeline)
+
+
+class TestPipelinePool(unittest.TestCase):
+    def setUp(self):
+        self.manager = FakeManager()
+        self.pool = PipelinePool("test_flow", self.manager, 2)
+
+    def test_builds_until_max_size_then_reuses(self):
+        first, new = self.pool.acquire(0)
+        self.assertIsNone(first)
+        self.assertTrue(new)
+        pipeline = MagicMock()
+        self.pool.release(pipeline, new=True)
+
+        reused, new = self.pool.acquire(0)
+        self.assertIs(reused, pipeline)
+        self.assertFalse(new)
+        self.assertEqual(self.pool.stats()["size"], 1)
+
+    def test_rejects_when_busy_past_timeout(self):
+        self.pool.acquire(0)
+        self.pool.acquire(0)
+
+        with self.assertRaises(SchedulerBusyError) as ctx:
+            self.pool.acquire(0.05)
+        self.assertEqual(ctx.exception.flow_name, "test_flow")
+        self.assertEqual(self.pool.stats()["rejected"], 1)
+        self.assertEqual(self.pool.stats()["size"], 2)
+
+    def test_release_wakes_a_waiter(self):
+        self.pool.acquire(0)
+        self.pool.acquire(0)
+        pipeline = MagicMock()
+        result = {}
+
+        def waiter():
+            result["value"] = self.pool.acquire(5)
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        while self.pool.stats()["waiting"] == 0:
+            time.sleep(0.01)
+        self.pool.release(pipeline, new=True)
+        thread.join(5)
+
+        self.assertEqual(result["value"], (pipeline, False))
+        stats = self.pool.stats()
+        self.assertEqual(stats["waited"], 1)
+        self.assertGreater(stats["max_wait"], 0)
+        self.assertEqual(stats["in_use"], 2)
+
+    def test_release_wakes_an_async_waiter(self):
+        self.pool.acquire(0)
+        self.pool.acquire(0)
+        pipeline = MagicMock()
+
+        async def wait_and_release():
+            waiter = asyncio.ensure_future(self.pool.acquire_async(5))
+            while self.pool.stats()["waiting"] == 0:
+                await asyncio.sleep(0.01)
+            threading.Thread(target=self.pool.release, args=(pipeline, True)).start()
+            return await waiter
+
+        self.assertEqual(asyncio.run(wait_and_release()), (pipeline, False))
+        self.assertEqual(self.pool.stats()["waiting"], 0)
+
+    def test_async_waiter_times_out_without_leaking(self):
+        self.pool.acquire(0)
+        self.pool.acquire(0)
+
+        with self.assertRaises(SchedulerBusyError):
+            asyncio.run(self.pool.acquire_async(0.05))
+        self.assertEqual(self.pool._async_waiters, [])
+        # handing back after the waiter's loop closed must not fail
+        self.pool.release(MagicMock(), new=True)
+        self.assertEqual(self.pool.stats()["in_use"], 1)
+
+    def test_discard_frees_the_slot(self):
+        self.pool.acquire(0)
+        self.pool.acquire(0)
+        self.pool.discard()
+
+        pipeline, new = self.pool.acquire(0)
+        self.assertIsNone(pipeline)
+        self.assertTrue(new)
+
+    def test_prewarm_is_bounded_by_max_size(self):
+        built = self.pool.prewarm(5, MagicMock)
+
+        self.assertEqual(built, 2)
+        self.assertEqual(len(self.manager.idle), 2)
+        self.assertEqual(self.pool.stats()["idle"], 2)
+
+    def test_prewarm_stops_on_build_failure(self):
+        built = self.pool.prewarm(2, MagicMock(side_effect=RuntimeError("boom")))
+
+        self.assertEqual(built, 0)
+        self.assertEqual(self.pool.stats()["size"], 0)
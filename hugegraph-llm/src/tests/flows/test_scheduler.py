@@ -24,10 +24,14 @@ second time (duplicate LLM calls, doubled streaming output).
 """
 
 import asyncio
-from unittest.mock import MagicMock
+import threading
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from hugegraph_llm.flows import FlowName
+from hugegraph_llm.flows.pipeline_pool import PipelinePool
 from hugegraph_llm.flows.scheduler import Scheduler
 
 pytestmark = pytest.mark.unit
@@ -83,7 +87,9 @@ def _make_scheduler_no_reusable_pipeline():
     flow.post_deal_stream = _StreamRecorder(["chunk-1", "chunk-2"])
 
     scheduler = Scheduler.__new__(Scheduler)
-    scheduler.pipeline_pool = {FLOW_NAME: {"manager": manager, "flow": flow}}
+    scheduler.pipeline_pool = {
+        FLOW_NAME: {"manager": manager, "flow": flow, "pool": PipelinePool(FLOW_NAME, manager, 10)}
+    }
     scheduler.max_pipeline = 10
     return scheduler, manager, pipeline, flow
 
@@ -123,3 +129,62 @@ def test_stream_flow_rejects_unknown_flow_name():
 
     with pytest.raises(ValueError):
         _drain(scheduler, flow_name="does-not-exist")
+
+
+def test_index_updating_flow_invalidates_answer_cache():
+    scheduler, _manager, _pipeline, flow = _make_scheduler_no_reusable_pipeline()
+    scheduler.pipeline_pool[FlowName.BUILD_VECTOR_INDEX] = scheduler.pipeline_pool.pop(FLOW_NAME)
+    flow.post_deal.return_value = "ok"
+
+    with patch("hugegraph_llm.flows.scheduler.answer_cache") as answer_cache:
+        assert scheduler.schedule_flow(FlowName.BUILD_VECTOR_INDEX) == "ok"
+
+    answer_cache.invalidate.assert_called_once()
+
+
+def test_failed_init_frees_the_pool_slot():
+    scheduler, manager, pipeline, _flow = _make_scheduler_no_reusable_pipeline()
+    status = MagicMock()
+    status.isErr.return_value = True
+    pipeline.init.return_value = status
+
+    with patch("hugegraph_llm.flows.scheduler.answer_cache"), pytest.raises(RuntimeError):
+        scheduler.schedule_flow(FLOW_NAME)
+
+    # the broken pipeline is never cached and does not count against the pool
+    manager.add.assert_not_called()
+    assert scheduler.pool_stats()[FLOW_NAME]["size"] == 0
+    assert scheduler.pool_stats()[FLOW_NAME]["in_use"] == 0
+
+
+def test_stream_flow_runs_pipeline_off_the_event_loop():
+    scheduler, _manager, pipeline, _flow = _make_scheduler_no_reusable_pipeline()
+    run_threads = []
+
+    def slow_run():
+        run_threads.append(threading.current_thread().name)
+        time.sleep(0.3)
+        return _ok_status()
+
+    pipeline.run.side_effect = slow_run
+
+    async def _run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        chunks = [chunk async for chunk in scheduler.schedule_stream_flow(FLOW_NAME)]
+        ticker_task.cancel()
+        return chunks, ticks
+
+    chunks, ticks = asyncio.run(_run())
+
+    assert chunks == ["chunk-1", "chunk-2"]
+    # the event loop kept serving other tasks while the pipeline ran
+    assert ticks > 5
+    assert run_threads[0].startswith("flow-worker")
@@ -0,0 +1,87 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from hugegraph_llm.indices.chunk_manifest import ChunkManifest, chunk_hash
+
+
+class TestChunkManifest(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "chunks", "chunk_manifest.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_new_chunks_are_added_once(self):
+        manifest = ChunkManifest(self.path)
+        to_add, stale, sources = manifest.plan(["a", "b", "a"], ["f1", "f1", "f2"])
+        self.assertEqual(to_add, ["a", "b"])
+        self.assertEqual(stale, set())
+        self.assertEqual(sources, {"f1": [chunk_hash("a"), chunk_hash("b")], "f2": [chunk_hash("a")]})
+
+    def test_unchanged_source_is_skipped(self):
+        manifest = ChunkManifest(self.path)
+        manifest.sources = manifest.plan(["a", "b"], ["f1", "f1"])[2]
+        manifest.save()
+
+        reloaded = ChunkManifest(self.path)
+        self.assertTrue(reloaded.persisted)
+        to_add, stale, sources = reloaded.plan(["a", "b"], ["f1", "f1"])
+        self.assertEqual(to_add, [])
+        self.assertEqual(stale, set())
+        self.assertEqual(sources, reloaded.sources)
+
+    def test_changed_source_replaces_its_chunks(self):
+        manifest = ChunkManifest(self.path)
+        manifest.sources = manifest.plan(["a", "b", "c"], ["f1", "f1", "f2"])[2]
+
+        to_add, stale, _ = manifest.plan(["a", "d"], ["f1", "f1"])
+        self.assertEqual(to_add, ["d"])
+        # "c" belongs to f2, which was not re-submitted
+        self.assertEqual(stale, {chunk_hash("b")})
+
+    def test_chunk_shared_with_another_source_is_not_stale(self):
+        manifest = ChunkManifest(self.path)
+        manifest.sources = manifest.plan(["a", "a"], ["f1", "f2"])[2]
+        _, stale, _ = manifest.plan(["b"], ["f1"])
+        self.assertEqual(stale, set())
+
+    def test_anonymous_chunks_are_never_stale(self):
+        manifest = ChunkManifest(self.path)
+        manifest.sources = manifest.plan(["a"])[2]
+        to_add, stale, sources = manifest.plan(["a", "b"])
+        self.assertEqual(to_add, ["b"])
+        self.assertEqual(stale, set())
+        self.assertEqual(sources, {"": [chunk_hash("a"), chunk_hash("b")]})
+
+    def test_unreadable_manifest_is_ignored(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        manifest = ChunkManifest(self.path)
+        self.assertFalse(manifest.persisted)
+        self.assertEqual(manifest.indexed(), set())
+
+    def test_source_count_mismatch(self):
+        with self.assertRaises(ValueError):
+            ChunkManifest(self.path).plan(["a", "b"], ["f1"])
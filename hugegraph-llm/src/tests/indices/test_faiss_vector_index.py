@@ -17,11 +17,17 @@
 
 
 import os
+import pickle as pkl
 import shutil
 import tempfile
 import unittest
 from pprint import pprint
+from unittest.mock import patch
 
+import faiss
+import numpy as np
+
+from hugegraph_llm.config import index_settings
 from hugegraph_llm.indices.vector_index.faiss_vector_store import FaissVectorIndex
 from hugegraph_llm.models.embeddings.ollama import OllamaEmbedding
 
@@ -80,6 +86,16 @@ class TestVectorIndex(unittest.TestCase):
         self.assertGreater(len(results), 0)
         self.assertEqual(results[0], "doc1")  # Most similar to first vector
 
+    def test_search_batch(self):
+        """Test searching several query vectors in one call"""
+        index = FaissVectorIndex(self.embed_dim)
+        index.add(self.vectors, self.properties)
+
+        results = index.search_batch([[0.0, 0.9, 0.1, 0.0], [0.0, 0.0, 0.1, 0.9], [-5.0, 0.0, 0.0, 0.0]], top_k=1)
+
+        self.assertEqual(results, [["doc2"], ["doc4"], []])
+        self.assertEqual(index.search_batch([], top_k=1), [])
+
     def test_search_empty_index(self):
         """Test searching in an empty index"""
         index = FaissVectorIndex(self.embed_dim)
@@ -124,6 +140,72 @@ class TestVectorIndex(unittest.TestCase):
         self.assertEqual(index.index.ntotal, 4)
         self.assertEqual(len(index.properties), 4)
 
+    def test_search_after_remove(self):
+        """Test that removals keep the remaining vectors mapped to their properties"""
+        index = FaissVectorIndex(self.embed_dim)
+        index.add(self.vectors, self.properties)
+        index.add([[0.9, 0.1, 0.0, 0.0]], ["doc1"])
+
+        self.assertEqual(index.remove({"doc1", "doc2"}), 3)
+        index.add([[0.0, 1.0, 0.0, 0.0]], ["doc5"])
+
+        self.assertEqual(index.properties, ["doc3", "doc4", "doc5"])
+        self.assertEqual(index.search([0.0, 0.0, 0.0, 1.0], top_k=1), ["doc4"])
+        self.assertEqual(index.search([0.0, 1.0, 0.0, 0.0], top_k=1), ["doc5"])
+
+    def test_load_legacy_flat_index(self):
+        """Test loading an index saved with the row-addressed IndexFlatL2 layout"""
+        flat_index = faiss.IndexFlatL2(self.embed_dim)
+        flat_index.add(np.array(self.vectors, dtype=np.float32))
+        faiss.write_index(flat_index, os.path.join(self.test_dir, "index.faiss"))
+        with open(os.path.join(self.test_dir, "properties.pkl"), "wb") as f:
+            pkl.dump(self.properties, f)
+
+        loaded_index = FaissVectorIndex.from_name(self.embed_dim, self.test_dir)
+
+        self.assertEqual(loaded_index.remove(["doc1"]), 1)
+        self.assertEqual(loaded_index.properties, ["doc2", "doc3", "doc4"])
+        self.assertEqual(loaded_index.search([0.0, 0.0, 1.0, 0.0], top_k=1), ["doc3"])
+
+    @patch.object(index_settings, "faiss_ivf_nlist", 2)
+    def test_ivf_index_is_trained_when_enough_vectors(self):
+        """Test that an IVF index stays exact until it can be trained"""
+        rng = np.random.default_rng(0)
+        vectors = rng.random((100, self.embed_dim), dtype=np.float32).tolist()
+        props = [f"doc{i}" for i in range(100)]
+        index = FaissVectorIndex(self.embed_dim, index_type="IVFFlat")
+
+        index.add(vectors[:50], props[:50])
+        self.assertNotIsInstance(index.index, faiss.IndexIVF)
+
+        index.add(vectors[50:], props[50:])
+        self.assertIsInstance(index.index, faiss.IndexIVF)
+        index.nprobe = 2
+        self.assertEqual(index.search(vectors[70], top_k=1), ["doc70"])
+        self.assertEqual(index.index.nprobe, 2)
+
+        self.assertEqual(index.remove(["doc70"]), 1)
+        index.save_index_by_name(self.test_dir)
+        loaded_index = FaissVectorIndex.from_name(self.embed_dim, self.test_dir)
+        self.assertIsInstance(loaded_index.index, faiss.IndexIVF)
+        self.assertEqual(loaded_index.index.ntotal, 99)
+        self.assertEqual(loaded_index.search(vectors[80], top_k=1), ["doc80"])
+
+    def test_hnsw_index_remove(self):
+        """Test removing from an HNSW index, which is rebuilt without the removed vectors"""
+        index = FaissVectorIndex(self.embed_dim, index_type="HNSW")
+        index.add(self.vectors, self.properties)
+
+        self.assertEqual(index.remove(["doc2"]), 1)
+
+        self.assertEqual(index.index.ntotal, 3)
+        self.assertEqual(index.search([0.0, 0.0, 1.0, 0.0], top_k=1), ["doc3"])
+        self.assertEqual(index.get_vector_index_info()["index_type"], "HNSW")
+
+    def test_unknown_index_type(self):
+        with self.assertRaises(ValueError):
+            FaissVectorIndex(self.embed_dim, index_type="LSH")
+
     def test_save_load(self):
         """Test saving and loading the index"""
         # Create and populate an index
@@ -147,6 +229,103 @@ class TestVectorIndex(unittest.TestCase):
         results = loaded_index.search(query_vector, top_k=1)
         self.assertEqual(results[0], "doc1")
 
+    @patch.object(index_settings, "faiss_mmap", True)
+    def test_load_mapped(self):
+        """Test a saved index is memory-mapped on load and copied into memory on the first write"""
+        for index_type in ("Flat", "HNSW"):
+            index = FaissVectorIndex(self.embed_dim, index_type=index_type)
+            index.add(self.vectors, self.properties)
+            index.save_index_by_name(self.test_dir, index_type)
+
+            loaded_index = FaissVectorIndex.from_name(self.embed_dim, self.test_dir, index_type)
+            self.assertTrue(loaded_index.mapped)
+            self.assertEqual(loaded_index.properties, self.properties)
+            self.assertEqual(loaded_index.search([0.0, 0.0, 1.0, 0.0], top_k=1), ["doc3"])
+
+            self.assertEqual(loaded_index.remove(["doc3"]), 1)
+            loaded_index.add([[0.0, 0.0, 1.0, 0.0]], ["doc5"])
+            self.assertFalse(loaded_index.mapped)
+            self.assertEqual(loaded_index.search([0.0, 0.0, 1.0, 0.0], top_k=1), ["doc5"])
+
+            # saving replaces the files the first loaded index may still map
+            loaded_index.save_index_by_name(self.test_dir, index_type)
+            reloaded = FaissVectorIndex.from_name(self.embed_dim, self.test_dir, index_type)
+            self.assertEqual(reloaded.properties, ["doc1", "doc2", "doc4", "doc5"])
+
+    @patch.object(index_settings, "faiss_ivf_nlist", 2)
+    @patch.object(index_settings, "faiss_mmap", True)
+    def test_load_mapped_ivf(self):
+        """Test a trained IVF index can be mapped and written to"""
+        rng = np.random.default_rng(0)
+        vectors = rng.random((100, self.embed_dim), dtype=np.float32).tolist()
+        props = [f"doc{i}" for i in range(100)]
+        index = FaissVectorIndex(self.embed_dim, index_type="IVFFlat")
+        index.add(vectors, props)
+        index.save_index_by_name(self.test_dir)
+
+        with patch.object(index_settings, "faiss_index_type", "IVFFlat"):
+            loaded_index = FaissVectorIndex.from_name(self.embed_dim, self.test_dir)
+            self.assertTrue(loaded_index.mapped)
+            loaded_index.nprobe = 2
+            self.assertEqual(loaded_index.search(vectors[30], top_k=1), ["doc30"])
+            loaded_index.add([vectors[30]], ["copy30"])
+        self.assertEqual(loaded_index.index.ntotal, 101)
+        self.assertIn(loaded_index.search(vectors[30], top_k=2)[0], ("doc30", "copy30"))
+
+    @patch.object(index_settings, "faiss_ivf_nlist", 2)
+    def test_load_keeps_saved_index_type(self):
+        """Test an index is reloaded with the layout it was saved with, whatever the current settings"""
+        rng = np.random.default_rng(0)
+        # PQ codebooks need at least 256 training vectors
+        vectors = rng.random((300, self.embed_dim), dtype=np.float32).tolist()
+        props = [f"doc{i}" for i in range(300)]
+        for index_type in ("HNSW", "IVFFlat", "IVFPQ"):
+            index = FaissVectorIndex(self.embed_dim, index_type=index_type)
+            index.add(vectors, props)
+            index.save_index_by_name(self.test_dir, index_type)
+
+            for mmap in (True, False):
+                with (
+                    patch.object(index_settings, "faiss_index_type", "Flat"),
+                    patch.object(index_settings, "faiss_mmap", mmap),
+                ):
+                    loaded_index = FaissVectorIndex.from_name(self.embed_dim, self.test_dir, index_type)
+                    self.assertEqual(loaded_index.index_type, index_type)
+                    self.assertEqual(loaded_index.get_vector_index_info()["index_type"], index_type)
+                    self.assertEqual(loaded_index.remove(["doc3"]), 1)
+                    self.assertEqual(loaded_index.index_type, index_type)
+                    self.assertEqual(type(loaded_index._inner_index()), type(index._inner_index()))
+
+    @patch.object(index_settings, "faiss_mmap", True)
+    def test_load_without_property_store(self):
+        """Test indexes saved before the property store are loaded from their pickle, which a save replaces"""
+        index = FaissVectorIndex(self.embed_dim)
+        index.add(self.vectors, self.properties)
+        index.save_index_by_name(self.test_dir)
+        os.remove(os.path.join(self.test_dir, "properties.bin"))
+        with open(os.path.join(self.test_dir, "properties.pkl"), "wb") as f:
+            pkl.dump(dict(enumerate(self.properties)), f)
+
+        loaded_index = FaissVectorIndex.from_name(self.embed_dim, self.test_dir)
+        self.assertFalse(loaded_index.mapped)
+        self.assertEqual(loaded_index.properties, self.properties)
+
+        loaded_index.save_index_by_name(self.test_dir)
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, "properties.pkl")))
+        self.assertTrue(FaissVectorIndex.from_name(self.embed_dim, self.test_dir).mapped)
+
+    def test_load_mmap_disabled(self):
+        """Test the index is loaded into memory by default, from the property store only"""
+        index = FaissVectorIndex(self.embed_dim)
+        index.add(self.vectors, self.properties)
+        index.save_index_by_name(self.test_dir)
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, "properties.pkl")))
+
+        loaded_index = FaissVectorIndex.from_name(self.embed_dim, self.test_dir)
+        self.assertFalse(loaded_index.mapped)
+        self.assertEqual(loaded_index.properties, self.properties)
+        self.assertEqual(loaded_index.remove(["doc3"]), 1)
+
     def test_load_nonexistent(self):
         """Test loading from a nonexistent directory"""
         nonexistent_dir = os.path.join(self.test_dir, "nonexistent")
@@ -166,7 +345,7 @@ class TestVectorIndex(unittest.TestCase):
 
         # Verify files exist
         self.assertTrue(os.path.exists(os.path.join(self.test_dir, "index.faiss")))
-        self.assertTrue(os.path.exists(os.path.join(self.test_dir, "properties.pkl")))
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, "properties.bin")))
 
         # Clean the index
         FaissVectorIndex.clean(self.test_dir)
@@ -174,6 +353,7 @@ class TestVectorIndex(unittest.TestCase):
         # Verify files are removed
         self.assertFalse(os.path.exists(os.path.join(self.test_dir, "index.faiss")))
         self.assertFalse(os.path.exists(os.path.join(self.test_dir, "properties.pkl")))
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, "properties.bin")))
 
     @unittest.skip("Requires Ollama service to be running")
     def test_vector_index(self):
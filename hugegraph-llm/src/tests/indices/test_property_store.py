@@ -0,0 +1,60 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from hugegraph_llm.indices.vector_index.property_store import MmapProperties, write_properties
+
+
+class TestPropertyStore(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "properties.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_round_trip(self):
+        props = {7: "doc7", 2: {"query": "q", "gremlin": "g.V()"}, 40: ["a", 1]}
+        write_properties(self.path, props)
+
+        store = MmapProperties(self.path)
+        self.assertEqual(len(store), 3)
+        self.assertEqual(list(store), [2, 7, 40])
+        self.assertEqual(dict(store.items()), props)
+        self.assertEqual(store.max_id(), 40)
+        self.assertIn(7, store)
+        self.assertNotIn(8, store)
+        with self.assertRaises(KeyError):
+            _ = store[100]
+
+    def test_empty(self):
+        write_properties(self.path, {})
+        store = MmapProperties(self.path)
+        self.assertEqual(len(store), 0)
+        self.assertEqual(list(store.values()), [])
+        self.assertEqual(store.max_id(), -1)
+
+    def test_reject_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a property store at all")
+        with self.assertRaises(ValueError):
+            MmapProperties(self.path)
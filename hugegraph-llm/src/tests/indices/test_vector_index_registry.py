@@ -0,0 +1,143 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from hugegraph_llm.indices.vector_index.base import VectorStoreBase
+from hugegraph_llm.indices.vector_index.faiss_vector_store import FaissVectorIndex
+from hugegraph_llm.indices.vector_index.registry import ReadWriteLock, VectorIndexRegistry
+
+
+class TestVectorIndexRegistry(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.registry = VectorIndexRegistry()
+        index = FaissVectorIndex(4)
+        index.add([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]], ["doc1", "doc2"])
+        index.save_index_by_name(self.test_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_loaded_index_is_reused(self):
+        first = self.registry.get(FaissVectorIndex, 4, self.test_dir)
+        second = self.registry.get(FaissVectorIndex, 4, self.test_dir)
+        self.assertIs(first, second)
+        self.assertEqual(self.registry.stats()["hits"], 1)
+        # another dimension is another entry
+        self.assertIsNot(self.registry.get(FaissVectorIndex, 8, self.test_dir), first)
+
+    def test_reload_after_save(self):
+        first = self.registry.get(FaissVectorIndex, 4, self.test_dir)
+
+        index = FaissVectorIndex.from_name(4, self.test_dir)
+        index.add([[0.0, 0.0, 1.0, 0.0]], ["doc3"])
+        index.save_index_by_name(self.test_dir)
+        # make sure the version changes even on coarse mtime file systems
+        index_file = os.path.join(self.test_dir, "index.faiss")
+        os.utime(index_file, ns=(time.time_ns(), os.stat(index_file).st_mtime_ns + 1))
+
+        second = self.registry.get(FaissVectorIndex, 4, self.test_dir)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.properties, ["doc1", "doc2", "doc3"])
+        # the instance a request already holds keeps working
+        self.assertEqual(first.search([0.0, 1.0, 0.0, 0.0], top_k=1), ["doc2"])
+
+    def test_invalidate(self):
+        first = self.registry.get(FaissVectorIndex, 4, self.test_dir)
+        self.registry.invalidate(self.test_dir)
+        self.assertIsNot(self.registry.get(FaissVectorIndex, 4, self.test_dir), first)
+
+    def test_unversioned_stores_are_not_cached(self):
+        store_class = MagicMock()
+        self.registry.get(store_class, 4, "graph", "chunks")
+        self.registry.get(store_class, 4, "graph", "chunks")
+        self.assertEqual(store_class.from_name.call_count, 2)
+
+        class RemoteStore(VectorStoreBase):  # pylint: disable=abstract-method
+            from_name = MagicMock()
+
+        self.registry.get(RemoteStore, 4, "graph", "chunks")
+        self.registry.get(RemoteStore, 4, "graph", "chunks")
+        self.assertEqual(RemoteStore.from_name.call_count, 2)
+
+    def test_concurrent_misses_load_once(self):
+        from_name = FaissVectorIndex.from_name
+        calls = []
+
+        def slow_from_name(*args):
+            calls.append(args)
+            time.sleep(0.05)
+            return from_name(*args)
+
+        results = []
+        with patch.object(FaissVectorIndex, "from_name", side_effect=slow_from_name):
+            threads = [
+                threading.Thread(target=lambda: results.append(self.registry.get(FaissVectorIndex, 4, self.test_dir)))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_concurrent_hits_are_all_counted(self):
+        self.registry.get(FaissVectorIndex, 4, self.test_dir)
+
+        def read():
+            for _ in range(200):
+                self.registry.get(FaissVectorIndex, 4, self.test_dir)
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = self.registry.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1600, 1))
+
+
+class TestReadWriteLock(unittest.TestCase):
+    def test_readers_share_writer_excludes(self):
+        lock = ReadWriteLock()
+        events = []
+
+        def write():
+            with lock.write():
+                events.append("writer")
+
+        with lock.read():
+            with lock.read():
+                events.append("two readers")
+
+            writer = threading.Thread(target=write)
+            writer.start()
+            time.sleep(0.05)
+            self.assertEqual(events, ["two readers"])
+        writer.join(1)
+        self.assertEqual(events, ["two readers", "writer"])
@@ -53,12 +53,27 @@ class InMemoryVectorIndex:
     def save_index_by_name(self, graph_name, index_name):
         return None
 
+    def get_all_properties(self):
+        return [chunk for _, chunk in self.entries]
+
+    def remove(self, chunks):
+        before = len(self.entries)
+        self.entries = [entry for entry in self.entries if entry[1] not in chunks]
+        return before - len(self.entries)
+
+    @classmethod
+    def exist(cls, graph_name, index_name):
+        return any(key[1:] == (graph_name, index_name) for key in cls.stores)
+
     def search(self, query_embedding, topk, dis_threshold=2):
         scored = [(sum(a * b for a, b in zip(query_embedding, embedding)), chunk) for embedding, chunk in self.entries]
         return [chunk for _, chunk in sorted(scored, reverse=True)[:topk]]
 
 
-def test_graphrag_smoke_uses_production_vector_and_rerank_operators():
+def test_graphrag_smoke_uses_production_vector_and_rerank_operators(monkeypatch, tmp_path):
+    # keep the chunk manifest of the index build out of the real resource path
+    monkeypatch.setattr("hugegraph_llm.indices.chunk_manifest.resource_path", str(tmp_path))
+    monkeypatch.setattr("hugegraph_llm.operators.index_op.build_vector_index.resource_path", str(tmp_path))
     from hugegraph_llm.operators.common_op.merge_dedup_rerank import MergeDedupRerank
     from hugegraph_llm.operators.index_op.build_vector_index import BuildVectorIndex
     from hugegraph_llm.operators.index_op.vector_index_query import VectorIndexQuery
@@ -0,0 +1,131 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import List
+from unittest.mock import patch
+
+from hugegraph_llm.config import llm_settings
+from hugegraph_llm.models.embeddings.base import BaseEmbedding
+from hugegraph_llm.models.embeddings.cache import CachedEmbedding, EmbeddingCache, with_embedding_cache
+
+
+class CountingEmbedding(BaseEmbedding):
+    def __init__(self, model: str = "mock-model", api_base: str = "http://127.0.0.1:8000/v1"):
+        self.model = model
+        self.api_base = api_base
+        self.calls: List[List[str]] = []
+
+    def get_text_embedding(self, text: str) -> List[float]:
+        return self.get_texts_embeddings([text])[0]
+
+    def get_texts_embeddings(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0, 0.5] for text in texts]
+
+    async def async_get_texts_embeddings(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+        return self.get_texts_embeddings(texts, batch_size)
+
+    def get_embedding_dim(self) -> int:
+        return 3
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "cache", "embeddings.db")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_only_missing_texts_are_embedded(self):
+        inner = CountingEmbedding()
+        embedding = CachedEmbedding(inner, EmbeddingCache(self.db_path))
+
+        first = embedding.get_texts_embeddings(["a", "bb", "a"])
+        second = embedding.get_texts_embeddings(["bb", "ccc"])
+
+        self.assertEqual(first, [[1.0, 1.0, 0.5], [2.0, 1.0, 0.5], [1.0, 1.0, 0.5]])
+        self.assertEqual(second, [[2.0, 1.0, 0.5], [3.0, 1.0, 0.5]])
+        self.assertEqual(inner.calls, [["a", "bb"], ["ccc"]])
+        self.assertEqual(embedding.model, "mock-model")
+        self.assertEqual(embedding.get_embedding_dim(), 3)
+
+    def test_async_embeddings_share_the_cache(self):
+        inner = CountingEmbedding()
+        embedding = CachedEmbedding(inner, EmbeddingCache(self.db_path))
+        embedding.get_text_embedding("a")
+
+        result = asyncio.run(embedding.async_get_texts_embeddings(["a", "bb"]))
+
+        self.assertEqual(result, [[1.0, 1.0, 0.5], [2.0, 1.0, 0.5]])
+        self.assertEqual(inner.calls, [["a"], ["bb"]])
+
+    def test_entries_persist_and_are_keyed_by_model(self):
+        CachedEmbedding(CountingEmbedding(), EmbeddingCache(self.db_path)).get_texts_embeddings(["a"])
+
+        reopened = EmbeddingCache(self.db_path)
+        inner = CountingEmbedding()
+        self.assertEqual(CachedEmbedding(inner, reopened).get_text_embedding("a"), [1.0, 1.0, 0.5])
+        self.assertEqual(inner.calls, [])
+        self.assertEqual(reopened.stats()["disk_hits"], 1)
+
+        other_model = CountingEmbedding(model="other-model")
+        CachedEmbedding(other_model, reopened).get_text_embedding("a")
+        self.assertEqual(other_model.calls, [["a"]])
+
+    def test_entries_are_keyed_by_api_base(self):
+        cache = EmbeddingCache(self.db_path)
+        CachedEmbedding(CountingEmbedding(), cache).get_text_embedding("a")
+
+        other_endpoint = CountingEmbedding(api_base="http://10.0.0.1:8000/v1")
+        CachedEmbedding(other_endpoint, cache).get_text_embedding("a")
+        self.assertEqual(other_endpoint.calls, [["a"]])
+
+    def test_cache_is_opt_in(self):
+        inner = CountingEmbedding()
+        with patch.object(llm_settings, "embedding_cache_enabled", False):
+            self.assertIs(with_embedding_cache(inner), inner)
+        with (
+            patch.object(llm_settings, "embedding_cache_enabled", True),
+            patch("hugegraph_llm.models.embeddings.cache.get_embedding_cache", return_value=EmbeddingCache()),
+        ):
+            self.assertIsInstance(with_embedding_cache(inner), CachedEmbedding)
+
+    def test_stats_and_eviction(self):
+        cache = EmbeddingCache(self.db_path, memory_size=2, max_entries=10)
+        embedding = CachedEmbedding(CountingEmbedding(), cache)
+        embedding.get_texts_embeddings([str(i) for i in range(12)])
+        embedding.get_texts_embeddings(["11"])
+
+        stats = cache.stats()
+        self.assertEqual(stats["misses"], 12)
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertAlmostEqual(stats["hit_rate"], 1 / 13)
+        self.assertEqual(stats["memory_entries"], 2)
+        self.assertLessEqual(stats["disk_entries"], 10)
+
+        cache.clear()
+        self.assertEqual(cache.stats()["disk_entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from typing import Any, Dict, List, Optional
+
+from hugegraph_llm.models.llms.base import BaseLLM
+from hugegraph_llm.models.llms.cache import CachedLLM, LLMResponseCache
+
+
+class CountingLLM(BaseLLM):
+    def __init__(self, delay: float = 0.0, response: str = "answer", api_base: str = "http://127.0.0.1:8000/v1"):
+        self.model = "mock-model"
+        self.api_base = api_base
+        self.temperature = 0.01
+        self.delay = delay
+        self.response = response
+        self.calls = 0
+
+    def generate(self, messages: Optional[List[Dict[str, Any]]] = None, prompt: Optional[str] = None) -> str:
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.response
+
+    async def agenerate(self, messages: Optional[List[Dict[str, Any]]] = None, prompt: Optional[str] = None) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.response
+
+    def generate_streaming(self, messages=None, prompt=None, on_token_callback=None):
+        yield self.response
+
+    async def agenerate_streaming(self, messages=None, prompt=None, on_token_callback=None):
+        yield self.response
+
+    def num_tokens_from_string(self, string: str) -> int:
+        return len(string)
+
+    def max_allowed_token_length(self) -> int:
+        return 4096
+
+    def get_llm_type(self) -> str:
+        return "mock"
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "llm_cache", "responses.db")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_identical_requests_hit_the_cache(self):
+        llm = CountingLLM()
+        cached = CachedLLM(llm, LLMResponseCache(self.db_path))
+
+        self.assertEqual(cached.generate(prompt="hello"), "answer")
+        self.assertEqual(cached.generate(messages=[{"role": "user", "content": "hello"}]), "answer")
+        self.assertEqual(asyncio.run(cached.agenerate(prompt="hello")), "answer")
+        cached.generate(prompt="bye")
+
+        self.assertEqual(llm.calls, 2)
+        self.assertEqual(cached.model, "mock-model")
+
+    def test_responses_persist_and_depend_on_temperature(self):
+        CachedLLM(CountingLLM(), LLMResponseCache(self.db_path)).generate(prompt="hello")
+
+        llm = CountingLLM()
+        cached = CachedLLM(llm, LLMResponseCache(self.db_path))
+        cached.generate(prompt="hello")
+        self.assertEqual(llm.calls, 0)
+
+        llm.temperature = 0.7
+        cached.generate(prompt="hello")
+        self.assertEqual(llm.calls, 1)
+
+    def test_responses_depend_on_the_endpoint(self):
+        cache = LLMResponseCache(self.db_path)
+        CachedLLM(CountingLLM(), cache).generate(prompt="hello")
+
+        other_endpoint = CountingLLM(api_base="http://10.0.0.1:8000/v1")
+        CachedLLM(other_endpoint, cache).generate(prompt="hello")
+        self.assertEqual(other_endpoint.calls, 1)
+
+    def test_expired_and_error_responses_are_not_reused(self):
+        llm = CountingLLM(response="Error: quota exceeded")
+        cached = CachedLLM(llm, LLMResponseCache(self.db_path))
+        cached.generate(prompt="hello")
+        cached.generate(prompt="hello")
+        self.assertEqual(llm.calls, 2)
+
+        llm = CountingLLM()
+        cached = CachedLLM(llm, LLMResponseCache(ttl=0.01))
+        cached.generate(prompt="hello")
+        time.sleep(0.02)
+        cached.generate(prompt="hello")
+        self.assertEqual(llm.calls, 2)
+
+    def test_concurrent_identical_requests_call_the_llm_once(self):
+        llm = CountingLLM(delay=0.2)
+        cache = LLMResponseCache()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(CachedLLM(llm, cache).generate(prompt="hello")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["answer"] * 4)
+        self.assertEqual(llm.calls, 1)
+
+    def test_concurrent_identical_async_requests_call_the_llm_once(self):
+        llm = CountingLLM(delay=0.1)
+        cached = CachedLLM(llm, LLMResponseCache())
+
+        async def run():
+            return await asyncio.gather(*(cached.agenerate(prompt="hello") for _ in range(4)))
+
+        self.assertEqual(asyncio.run(run()), ["answer"] * 4)
+        self.assertEqual(llm.calls, 1)
+
+    def test_followers_retry_when_the_leader_is_cancelled(self):
+        llm = CountingLLM(delay=0.1)
+        cached = CachedLLM(llm, LLMResponseCache())
+
+        async def run():
+            leader = asyncio.create_task(cached.agenerate(prompt="hello"))
+            await asyncio.sleep(0.01)
+            followers = [asyncio.create_task(cached.agenerate(prompt="hello")) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await asyncio.gather(*followers)
+
+        self.assertEqual(asyncio.run(run()), ["answer"] * 3)
+        # the cancelled leader and the follower that took over
+        self.assertEqual(llm.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from hugegraph_llm.nodes.common_node.graph_branch_node import GraphBranchNode
+from hugegraph_llm.state.ai_state import WkFlowInput
+
+
+class _StepNode:
+    def __init__(self, key, value, wait=None):
+        self.key = key
+        self.value = value
+        self.wait = wait
+
+    def operator_schedule(self, data_json):
+        if self.wait is not None:
+            self.wait()
+        data_json[self.key] = self.value
+        return data_json
+
+
+def _branch_nodes(graph_wait=None, schema_wait=None, keyword_wait=None):
+    return [
+        _StepNode("schema", "person", schema_wait),
+        _StepNode("keywords", ["tom"], keyword_wait),
+        _StepNode("match_vids", ["1:tom"]),
+        _StepNode("graph_result", ["g"], graph_wait),
+    ]
+
+
+def _branch_node(nodes, budget=None):
+    node = GraphBranchNode()
+    node.wk_input = WkFlowInput()
+    node.wk_input.graph_latency_budget = budget
+    node.context = MagicMock()
+    node.nodes = nodes
+    return node
+
+
+BRANCH_RESULT = {"schema": "person", "keywords": ["tom"], "match_vids": ["1:tom"], "graph_result": ["g"]}
+
+
+def test_run_branch_returns_only_changed_entries():
+    data_json = {"query": "who is tom", "vector_result": ["v"]}
+
+    res = GraphBranchNode.run_branch(_branch_nodes(), data_json)
+
+    assert res == BRANCH_RESULT
+    assert "keywords" not in data_json
+
+
+def test_schema_and_keywords_run_concurrently():
+    # both nodes wait for each other, a sequential run breaks the barrier
+    barrier = threading.Barrier(2, timeout=2)
+
+    res = GraphBranchNode.run_branch(_branch_nodes(schema_wait=barrier.wait, keyword_wait=barrier.wait), {})
+
+    assert res == BRANCH_RESULT
+
+
+def test_sub_node_failure_names_the_node():
+    nodes = _branch_nodes()
+    nodes[2] = MagicMock()
+    nodes[2].operator_schedule.side_effect = KeyError("keywords")
+
+    with pytest.raises(ValueError, match="Graph branch node failed"):
+        GraphBranchNode.run_branch(nodes, {"query": "q"})
+
+
+def test_operator_schedule_waits_without_budget():
+    node = _branch_node(_branch_nodes())
+
+    assert node.operator_schedule({"query": "q"}) == BRANCH_RESULT
+
+
+def test_operator_schedule_within_budget_returns_graph_result():
+    node = _branch_node(_branch_nodes(), budget=5)
+
+    assert node.operator_schedule({"query": "q"}) == BRANCH_RESULT
+
+
+def test_operator_schedule_over_budget_leaves_pending_future():
+    release = threading.Event()
+    node = _branch_node(_branch_nodes(graph_wait=lambda: release.wait(5)), budget=0.05)
+
+    res = node.operator_schedule({"query": "q"})
+
+    future = res["pending_graph_result"]
+    assert list(res) == ["pending_graph_result"]
+    assert not future.done()
+    release.set()
+    assert future.result(timeout=5) == BRANCH_RESULT
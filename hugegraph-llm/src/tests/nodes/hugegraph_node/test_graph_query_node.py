@@ -0,0 +1,82 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from unittest.mock import MagicMock, patch
+
+from hugegraph_llm.nodes.hugegraph_node.graph_query_node import GraphQueryNode
+
+
+def _path(vid):
+    return {"objects": [{"label": "person", "id": vid, "props": {"name": vid}}]}
+
+
+def _node_with_client():
+    node = GraphQueryNode()
+    node._client = MagicMock()
+    node._max_deep = 2
+    node._max_items = 30
+
+    def exec_gremlin(gremlin):
+        vid = gremlin.split("'")[1]
+        return {"data": [_path(vid), _path(f"{vid}-neighbor")]}
+
+    node._client.gremlin.return_value.exec.side_effect = exec_gremlin
+    return node
+
+
+@patch("hugegraph_llm.nodes.hugegraph_node.graph_query_node.huge_settings")
+def test_concurrent_neighbor_expansion_keeps_vid_order(mock_settings):
+    mock_settings.max_graph_query_workers = 4
+    node = _node_with_client()
+
+    paths = node._query_vid_neighbors(["1:a", "1:b", "1:c"], "'knows'", 8)
+
+    assert [p["objects"][0]["id"] for p in paths] == [
+        "1:a",
+        "1:a-neighbor",
+        "1:b",
+        "1:b-neighbor",
+        "1:c",
+        "1:c-neighbor",
+    ]
+    assert node._client.gremlin.return_value.exec.call_count == 3
+
+
+@patch("hugegraph_llm.nodes.hugegraph_node.graph_query_node.ThreadPoolExecutor")
+@patch("hugegraph_llm.nodes.hugegraph_node.graph_query_node.huge_settings")
+def test_single_worker_expands_serially(mock_settings, mock_executor):
+    mock_settings.max_graph_query_workers = 1
+    node = _node_with_client()
+
+    paths = node._query_vid_neighbors(["1:a", "1:b"], "'knows'", 8)
+
+    assert len(paths) == 4
+    mock_executor.assert_not_called()
+
+
+@patch("hugegraph_llm.nodes.hugegraph_node.graph_query_node.get_hg_client")
+def test_node_init_connects_to_request_scoped_graph(mock_get_client):
+    node = GraphQueryNode()
+    node.wk_input = MagicMock()
+    node.wk_input.graph_client_config = {"url": "http://tenant:8080", "graph": "tenant_graph"}
+    node.wk_input.gremlin_tmpl_num = None
+
+    with patch("hugegraph_llm.nodes.hugegraph_node.graph_query_node.BaseNode.node_init"):
+        node.node_init()
+
+    mock_get_client.assert_called_once_with({"url": "http://tenant:8080", "graph": "tenant_graph"})
+    assert node._client is mock_get_client.return_value
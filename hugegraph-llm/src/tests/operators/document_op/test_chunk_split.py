@@ -17,6 +17,7 @@
 
 import unittest
 
+from hugegraph_llm.indices.chunk_manifest import chunk_hash
 from hugegraph_llm.operators.document_op.chunk_split import ChunkSplit
 
 
@@ -73,6 +74,33 @@ class TestChunkSplit(unittest.TestCase):
         chunk_split = ChunkSplit("test", split_type="sentence")
         self.assertIsNotNone(chunk_split.text_splitter)
 
+    def test_iter_chunks(self):
+        """Test chunks are produced lazily in the same order as run."""
+        chunk_split = ChunkSplit(self.test_texts, split_type="paragraph")
+        chunks = chunk_split.iter_chunks()
+        self.assertFalse(isinstance(chunks, list))
+        self.assertEqual(list(chunks), chunk_split.run(None)["chunks"])
+
+    def test_run_hashes_only(self):
+        """Test only the chunk hashes are kept in the context when the chunks are consumed lazily."""
+        chunk_split = ChunkSplit(["a. b.", "c."], split_type="sentence", sources=["x.txt", "y.txt"], hashes_only=True)
+        result = chunk_split.run(None)
+        self.assertNotIn("chunks", result)
+        self.assertEqual(result["chunk_hashes"], [chunk_hash(chunk) for chunk in chunk_split.iter_chunks()])
+        self.assertEqual(result["chunk_sources"], ["x.txt", "x.txt", "y.txt"])
+
+    def test_run_with_sources(self):
+        """Test every chunk is tagged with the source of its text."""
+        chunk_split = ChunkSplit(["a. b.", "c."], split_type="sentence", sources=["x.txt", "y.txt"])
+        result = chunk_split.run(None)
+        self.assertEqual(result["chunks"], ["a.", "b.", "c."])
+        self.assertEqual(result["chunk_sources"], ["x.txt", "x.txt", "y.txt"])
+
+    def test_sources_length_mismatch(self):
+        """Test sources must match the texts."""
+        with self.assertRaises(ValueError):
+            ChunkSplit(["a", "b"], sources=["x.txt"])
+
     def test_get_text_splitter_invalid(self):
         """Test getting text splitter with invalid type."""
         with self.assertRaises(ValueError):
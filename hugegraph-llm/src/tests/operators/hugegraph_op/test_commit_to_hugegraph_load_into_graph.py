@@ -428,3 +428,78 @@ class TestCommit2GraphLoadIntoGraph(unittest.TestCase):
         self.commit2graph.load_into_graph(vertices, edges, self.schema)
 
         self.assertEqual(mock_handle_graph_creation.call_count, 1)
+
+    def test_batch_mode_writes_vertices_and_edges_in_batches(self):
+        """Test batch mode maps server ids from addVertices and writes edges with their vertex labels."""
+        self.commit2graph.batch_size = 100
+        graph = self.mock_client.graph.return_value
+        graph.addVertices.return_value = [MagicMock(id="1:Tom Hanks"), MagicMock(id="2:Forrest Gump")]
+        graph.addEdges.return_value = [MagicMock(id="edge_1"), MagicMock(id="edge_2")]
+
+        vertices = [
+            {"id": "person:Tom Hanks", "label": "person", "properties": {"name": "Tom Hanks", "age": 67}},
+            {"label": "movie", "properties": {"title": "Forrest Gump", "year": 1994}},
+        ]
+        edges = [
+            {
+                "label": "acted_in",
+                "properties": {"role": "Forrest Gump"},
+                "outV": "person:Tom Hanks",
+                "inV": "movie:Forrest Gump",
+            },
+            {"label": "acted_in", "properties": {}, "outV": "1:Tom Hanks", "inV": "2:Cast Away"},
+        ]
+
+        self.commit2graph.load_into_graph(vertices, edges, self.schema)
+
+        graph.addVertices.assert_called_once_with(
+            [
+                ("person", {"name": "Tom Hanks", "age": 67}, None),
+                ("movie", {"title": "Forrest Gump", "year": 1994}, None),
+            ]
+        )
+        graph.addEdges.assert_called_once_with(
+            [
+                ("acted_in", "1:Tom Hanks", "2:Forrest Gump", "person", "movie", {"role": "Forrest Gump"}),
+                ("acted_in", "1:Tom Hanks", "2:Cast Away", "person", "movie", {}),
+            ]
+        )
+        graph.addVertex.assert_not_called()
+        graph.addEdge.assert_not_called()
+        self.assertEqual(vertices[1]["id"], "2:Forrest Gump")
+
+    def test_batch_mode_bisects_failed_batch_to_offending_vertex(self):
+        """Test a rejected batch is split until only the bad vertex is skipped, the rest is still imported."""
+        from pyhugegraph.utils.exceptions import ServerError
+
+        self.commit2graph.batch_size = 4
+        graph = self.mock_client.graph.return_value
+
+        def add_vertices(items):
+            if any(props.get("name") == "bad" for _, props, _ in items):
+                raise ServerError("Server Exception: bad vertex")
+            return [MagicMock(id=f"1:{props['name']}") for _, props, _ in items]
+
+        def add_vertex(label, props):
+            if props.get("name") == "bad":
+                raise ServerError("Server Exception: bad vertex")
+            return MagicMock(id=f"1:{props['name']}")
+
+        graph.addVertices.side_effect = add_vertices
+        graph.addVertex.side_effect = add_vertex
+        graph.addEdges.return_value = [MagicMock(id="edge_1"), MagicMock(id="edge_2")]
+
+        vertices = [{"label": "person", "properties": {"name": name}} for name in ["a", "b", "bad", "c"]]
+        edges = [
+            {"label": "acted_in", "properties": {}, "outV": "person:a", "inV": "person:b"},
+            {"label": "acted_in", "properties": {}, "outV": "person:b", "inV": "person:c"},
+        ]
+
+        with self.assertRaisesRegex(ValueError, "Failed to create 1 vertices"):
+            self.commit2graph.load_into_graph(vertices, edges, self.schema)
+
+        self.assertEqual([v.get("id") for v in vertices], ["1:a", "1:b", None, "1:c"])
+        self.assertEqual(graph.addVertex.call_count, 2)
+        graph.addEdges.assert_called_once_with(
+            [("acted_in", "1:a", "1:b", "person", "movie", {}), ("acted_in", "1:b", "1:c", "person", "movie", {})]
+        )
@@ -114,6 +114,16 @@ class TestBuildSemanticIndex(unittest.TestCase):
         finally:
             loop.close()
 
+    def test_get_embeddings_parallel_keeps_batch_order(self):
+        builder = BuildSemanticIndex(self.mock_embedding, self.mock_vector_store_class)
+        self.mock_embedding.get_texts_embeddings.side_effect = lambda texts: [[float(text)] for text in texts]
+        vids = [str(i) for i in range(2500)]
+
+        result = asyncio.run(builder._get_embeddings_parallel(vids))
+
+        self.assertEqual(result, [[float(vid)] for vid in vids])
+        self.assertEqual(self.mock_embedding.get_texts_embeddings.call_count, 3)
+
     def test_run_with_primary_key_strategy(self):
         # Create a builder
         builder = BuildSemanticIndex(self.mock_embedding, self.mock_vector_store_class)
@@ -216,6 +226,49 @@ class TestBuildSemanticIndex(unittest.TestCase):
         }
         self.assertEqual(result, expected_context)
 
+    def test_run_pages_through_graph(self):
+        self.mock_schema_manager.schema.getSchema.return_value = {
+            "vertexlabels": [
+                {"name": "person", "id_strategy": "CUSTOMIZE"},
+                {"name": "software", "id_strategy": "CUSTOMIZE"},
+            ]
+        }
+        self.mock_vector_store.get_all_properties.return_value = ["p1", "gone"]
+        self.mock_vector_store.remove.return_value = 1
+        pages = {
+            ("person", None): (["p1", "p2"], "token"),
+            ("person", "token"): (["p3"], None),
+            ("software", None): (["s1"], None),
+        }
+        graph = MagicMock()
+        graph.graph().getVertexByPage.side_effect = lambda label, limit, page: (
+            [MagicMock(id=vid) for vid in pages[(label, page)][0]],
+            pages[(label, page)][1],
+        )
+
+        builder = BuildSemanticIndex(self.mock_embedding, self.mock_vector_store_class, graph=graph, page_size=2)
+        with patch("asyncio.run", side_effect=lambda coro: coro.close() or [[0.1]]):
+            result = builder.run({"vertices": ["p1"]})
+
+        added = [call.args[1] for call in self.mock_vector_store.add.call_args_list]
+        self.assertEqual(added, [["p2"], ["p3"], ["s1"]])
+        self.mock_vector_store.remove.assert_called_once_with({"gone"})
+        self.mock_vector_store.save_index_by_name.assert_called_once_with("test_graph", "graph_vids")
+        self.assertEqual(result["added_vid_vector_num"], 3)
+        self.assertEqual(result["removed_vid_vector_num"], 1)
+        graph.graph().getVertexByPage.assert_any_call("person", 2, "token")
+
+    def test_run_splits_context_vertices_into_pages(self):
+        self.mock_vector_store.get_all_properties.return_value = []
+        builder = BuildSemanticIndex(self.mock_embedding, self.mock_vector_store_class, page_size=2)
+
+        with patch("asyncio.run", side_effect=lambda coro: coro.close() or [[0.1]]):
+            builder.run({"vertices": ["l:a", "l:b", "l:c"]})
+
+        added = [call.args[1] for call in self.mock_vector_store.add.call_args_list]
+        self.assertEqual(added, [["l:a", "l:b"], ["l:c"]])
+        self.mock_vector_store.save_index_by_name.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -17,9 +17,13 @@
 
 # pylint: disable=unused-argument,unused-variable
 
+import os
+import shutil
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
+from hugegraph_llm.indices.chunk_manifest import chunk_hash
 from hugegraph_llm.indices.vector_index.base import VectorStoreBase
 from hugegraph_llm.models.embeddings.base import BaseEmbedding
 from hugegraph_llm.operators.index_op.build_vector_index import BuildVectorIndex
@@ -47,9 +51,21 @@ class TestBuildVectorIndex(unittest.TestCase):
         self.patcher_embeddings = patch("hugegraph_llm.operators.index_op.build_vector_index.get_embeddings_parallel")
         self.mock_get_embeddings = self.patcher_embeddings.start()
 
+        # Keep build checkpoints in a temp directory
+        self.temp_dir = tempfile.mkdtemp()
+        self.patcher_resource_path = patch(
+            "hugegraph_llm.operators.index_op.build_vector_index.resource_path", self.temp_dir
+        )
+        self.patcher_resource_path.start()
+        self.patcher_manifest_path = patch("hugegraph_llm.indices.chunk_manifest.resource_path", self.temp_dir)
+        self.patcher_manifest_path.start()
+
     def tearDown(self):
         self.patcher_settings.stop()
         self.patcher_embeddings.stop()
+        self.patcher_resource_path.stop()
+        self.patcher_manifest_path.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_init(self):
         # Create a builder
@@ -146,6 +162,137 @@ class TestBuildVectorIndex(unittest.TestCase):
             # Check if debug log was called
             mock_log.debug.assert_called_once_with("Building vector index for %s chunks...", 1)
 
+    def _embed_window(self, coro):
+        coro.close()
+        window = self.mock_get_embeddings.call_args.args[1]
+        return [[0.0]] * len(window)
+
+    def test_run_in_windows(self):
+        builder = BuildVectorIndex(
+            self.mock_embedding, self.mock_vector_store_class, window_size=2, checkpoint_interval=2
+        )
+        chunks = ["c1", "c2", "c3", "c4", "c5"]
+
+        with patch("asyncio.run", side_effect=self._embed_window):
+            builder.run({"chunks": chunks})
+
+        windows = [call.args[1] for call in self.mock_vector_store.add.call_args_list]
+        self.assertEqual(windows, [["c1", "c2"], ["c3", "c4"], ["c5"]])
+        # one checkpoint save after two windows and a final save for the last window
+        self.assertEqual(self.mock_vector_store.save_index_by_name.call_count, 2)
+        self.assertFalse(os.path.exists(builder.checkpoint_file))
+
+    def test_resume_from_checkpoint(self):
+        chunks = ["c1", "c2", "c3", "c4", "c5"]
+
+        # Crash while embedding the third window, after the checkpoint of the first two
+        crashing = BuildVectorIndex(
+            self.mock_embedding, self.mock_vector_store_class, window_size=2, checkpoint_interval=2
+        )
+        with patch("asyncio.run", side_effect=[[[0.0]] * 2, [[0.0]] * 2, RuntimeError("crash")]):
+            with self.assertRaises(RuntimeError):
+                crashing.run({"chunks": chunks})
+        self.assertTrue(os.path.exists(crashing.checkpoint_file))
+
+        self.mock_vector_store.add.reset_mock()
+        builder = BuildVectorIndex(
+            self.mock_embedding, self.mock_vector_store_class, window_size=2, checkpoint_interval=2
+        )
+        with patch("asyncio.run", return_value=[[0.0]]):
+            builder.run({"chunks": chunks})
+        self.mock_vector_store.add.assert_called_once_with([[0.0]], ["c5"])
+        self.assertFalse(os.path.exists(builder.checkpoint_file))
+
+    def test_checkpoint_of_other_chunks_is_ignored(self):
+        builder = BuildVectorIndex(
+            self.mock_embedding, self.mock_vector_store_class, window_size=2, checkpoint_interval=1
+        )
+        builder._save_checkpoint(2, "not-a-fingerprint")  # pylint: disable=protected-access
+
+        with patch("asyncio.run", side_effect=self._embed_window):
+            builder.run({"chunks": ["c1", "c2", "c3"]})
+
+        windows = [call.args[1] for call in self.mock_vector_store.add.call_args_list]
+        self.assertEqual(windows, [["c1", "c2"], ["c3"]])
+
+    def test_run_streams_lazy_chunks(self):
+        self.mock_vector_store.exist.return_value = True
+        self.mock_vector_store.get_all_properties.return_value = ["c1"]
+        produced, produced_at_embed = [], []
+
+        def chunk_stream():
+            for chunk in ["c1", "c2", "c2", "c3"]:
+                produced.append(chunk)
+                yield chunk
+
+        def embed_window(coro):
+            produced_at_embed.append(len(produced))
+            return self._embed_window(coro)
+
+        builder = BuildVectorIndex(
+            self.mock_embedding, self.mock_vector_store_class, window_size=1, chunks=chunk_stream()
+        )
+        hashes = [chunk_hash(chunk) for chunk in ["c1", "c2", "c2", "c3"]]
+        with patch("asyncio.run", side_effect=embed_window):
+            result = builder.run({"chunk_hashes": hashes})
+
+        self.assertEqual(self._added_chunks(), ["c2", "c3"])
+        self.assertEqual(result["added_chunk_vector_num"], 2)
+        # the stream is consumed window by window, not materialized up front
+        self.assertEqual(produced_at_embed, [2, 4])
+
+    def _index_chunks(self, chunks, chunk_sources=None):
+        self.mock_vector_store.add.reset_mock()
+        builder = BuildVectorIndex(self.mock_embedding, self.mock_vector_store_class)
+        with patch("asyncio.run", side_effect=self._embed_window):
+            return builder.run({"chunks": chunks, "chunk_sources": chunk_sources})
+
+    def _added_chunks(self):
+        return [chunk for call in self.mock_vector_store.add.call_args_list for chunk in call.args[1]]
+
+    def test_rerun_skips_indexed_chunks(self):
+        self.mock_vector_store.exist.return_value = True
+        self.mock_vector_store.get_all_properties.return_value = []
+        self._index_chunks(["c1", "c2"], ["a.txt", "a.txt"])
+        self.assertEqual(self._added_chunks(), ["c1", "c2"])
+
+        self.mock_vector_store.save_index_by_name.reset_mock()
+        result = self._index_chunks(["c1", "c2", "c3"], ["a.txt", "a.txt", "b.txt"])
+        self.assertEqual(self._added_chunks(), ["c3"])
+        self.assertEqual(result["added_chunk_vector_num"], 1)
+
+        self._index_chunks(["c1", "c2"], ["a.txt", "a.txt"])
+        self.mock_vector_store.add.assert_not_called()
+        self.mock_vector_store.remove.assert_not_called()
+
+    def test_changed_source_removes_stale_chunks(self):
+        self.mock_vector_store.exist.return_value = True
+        self.mock_vector_store.get_all_properties.return_value = []
+        self._index_chunks(["c1", "c2"], ["a.txt", "a.txt"])
+
+        self.mock_vector_store.get_all_properties.return_value = ["c1", "c2"]
+        self.mock_vector_store.remove.return_value = 1
+        result = self._index_chunks(["c1", "c2-new"], ["a.txt", "a.txt"])
+        self.mock_vector_store.remove.assert_called_once_with(["c2"])
+        self.assertEqual(self._added_chunks(), ["c2-new"])
+        self.assertEqual(result["removed_chunk_vector_num"], 1)
+
+    def test_existing_index_without_manifest_is_not_duplicated(self):
+        self.mock_vector_store.exist.return_value = True
+        self.mock_vector_store.get_all_properties.return_value = ["c1"]
+        self._index_chunks(["c1", "c2"])
+        self.assertEqual(self._added_chunks(), ["c2"])
+
+    def test_missing_index_resets_manifest(self):
+        self.mock_vector_store.exist.return_value = True
+        self.mock_vector_store.get_all_properties.return_value = []
+        self._index_chunks(["c1"], ["a.txt"])
+
+        # the index files were deleted behind the manifest's back
+        self.mock_vector_store.exist.return_value = False
+        self._index_chunks(["c1"], ["a.txt"])
+        self.assertEqual(self._added_chunks(), ["c1"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -31,6 +31,7 @@ class MockVectorStore:
 
     def __init__(self):
         self.search = MagicMock()
+        self.search_batch = MagicMock()
 
     @classmethod
     def from_name(cls, dim, graph_name, index_name):
@@ -156,3 +157,73 @@ class TestSemanticIdQuery(unittest.TestCase):
 
             # Verify search was not called for empty keywords
             query.vector_index.search.assert_not_called()
+            query.vector_index.search_batch.assert_not_called()
+
+    @patch("hugegraph_llm.operators.index_op.semantic_id_query.resource_path")
+    @patch("hugegraph_llm.operators.index_op.semantic_id_query.huge_settings")
+    @patch("hugegraph_llm.operators.index_op.semantic_id_query.PyHugeClient", new=MockPyHugeClient)
+    def test_run_by_keywords_with_fuzzy_match(self, mock_settings, mock_resource_path):
+        mock_settings.graph_name = "test_graph"
+        mock_settings.topk_per_keyword = 1
+        mock_settings.vector_dis_threshold = 1.5
+
+        context = {"keywords": ["keyword1", "unknown1", "unknown2"]}
+
+        with patch("os.path.join", return_value=self.test_dir):
+            query = SemanticIdQuery(self.embedding, self.mock_vector_store_class, by="keywords", topk_per_keyword=1)
+            query.vector_index.search_batch.return_value = [["1:fuzzy1"], ["2:fuzzy2"]]
+
+            result_context = query.run(context)
+
+            # The unmatched keywords are searched with a single batched call
+            query.vector_index.search_batch.assert_called_once()
+            self.assertEqual(len(query.vector_index.search_batch.call_args.args[0]), 2)
+            query.vector_index.search.assert_not_called()
+            self.assertEqual(
+                set(result_context["match_vids"]),
+                {"1:keyword1", "2:keyword2", "1:fuzzy1", "2:fuzzy2"},
+            )
+
+    @patch("hugegraph_llm.operators.index_op.semantic_id_query.resource_path")
+    @patch("hugegraph_llm.operators.index_op.semantic_id_query.huge_settings")
+    @patch("hugegraph_llm.operators.index_op.semantic_id_query.PyHugeClient", new=MockPyHugeClient)
+    def test_fuzzy_match_embeds_keywords_and_query_in_one_call(self, mock_settings, mock_resource_path):
+        mock_settings.graph_name = "test_graph"
+        mock_settings.topk_per_keyword = 1
+        mock_settings.vector_dis_threshold = 1.5
+
+        context = {"query": "query", "keywords": ["keyword1", "unknown1", "unknown2"]}
+
+        with patch("os.path.join", return_value=self.test_dir):
+            query = SemanticIdQuery(self.embedding, self.mock_vector_store_class, by="keywords", topk_per_keyword=1)
+            query.vector_index.search_batch.return_value = [[], []]
+
+            embed_texts = self.embedding.get_texts_embeddings
+            with patch.object(self.embedding, "get_texts_embeddings", wraps=embed_texts) as embed:
+                result_context = query.run(context)
+
+            embed.assert_called_once()
+            self.assertEqual(sorted(embed.call_args.args[0][:2]), ["unknown1", "unknown2"])
+            self.assertEqual(embed.call_args.args[0][2], "query")
+            self.assertEqual(result_context["query_embedding"], self.embedding.get_text_embedding("query"))
+            self.assertEqual(len(query.vector_index.search_batch.call_args.args[0]), 2)
+
+    @patch("hugegraph_llm.operators.index_op.semantic_id_query.resource_path")
+    @patch("hugegraph_llm.operators.index_op.semantic_id_query.huge_settings")
+    @patch("hugegraph_llm.operators.index_op.semantic_id_query.PyHugeClient", new=MockPyHugeClient)
+    def test_run_by_query_reuses_query_embedding(self, mock_settings, mock_resource_path):
+        mock_settings.graph_name = "test_graph"
+        mock_settings.topk_per_keyword = 5
+        mock_settings.vector_dis_threshold = 1.5
+
+        context = {"query": "query1", "query_embedding": [0.0, 0.0, 0.0, 1.0]}
+
+        with patch("os.path.join", return_value=self.test_dir):
+            query = SemanticIdQuery(self.embedding, self.mock_vector_store_class, by="query", topk_per_query=2)
+            query.vector_index.search.return_value = ["1:vid1"]
+
+            with patch.object(self.embedding, "get_texts_embeddings") as embed:
+                query.run(context)
+
+            embed.assert_not_called()
+            query.vector_index.search.assert_called_once_with([0.0, 0.0, 0.0, 1.0], top_k=2)
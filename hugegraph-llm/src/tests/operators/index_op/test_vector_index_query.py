@@ -81,6 +81,17 @@ class TestVectorIndexQuery(unittest.TestCase):
         # Verify vector search was called correctly
         self.mock_vector_index.search.assert_called_once_with([1.0, 0.0, 0.0, 0.0], 2, dis_threshold=2)
 
+    @patch("hugegraph_llm.operators.index_op.vector_index_query.huge_settings")
+    def test_run_reuses_query_embedding(self, mock_settings):
+        """Test run method reuses the query embedding of an upstream node"""
+        mock_settings.graph_name = "test_graph"
+        query = VectorIndexQuery(vector_index=self.mock_vector_store_class, embedding=self.mock_embedding, topk=2)
+
+        query.run({"query": "test query", "query_embedding": [0.0, 1.0, 0.0, 0.0]})
+
+        self.mock_embedding.get_texts_embeddings.assert_not_called()
+        self.mock_vector_index.search.assert_called_once_with([0.0, 1.0, 0.0, 0.0], 2, dis_threshold=2)
+
     @patch("hugegraph_llm.operators.index_op.vector_index_query.huge_settings")
     def test_run_with_none_query(self, mock_settings):
         """Test run method when query is None"""
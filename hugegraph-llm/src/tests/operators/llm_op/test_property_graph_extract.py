@@ -17,6 +17,7 @@
 
 # pylint: disable=protected-access
 
+import asyncio
 import json
 import unittest
 from unittest.mock import MagicMock, patch
@@ -1122,6 +1123,31 @@ Hope this helps."""
         self.assertEqual(result["vertices"][0]["properties"]["name"], "Leonardo DiCaprio")
         self.assertEqual(result["edges"][0]["properties"]["role"], "Jack Dawson")
 
+    def test_run_extracts_chunks_concurrently_in_order(self):
+        """Concurrent extraction merges the chunks in their original order."""
+        responses = dict(zip(self.chunks, self.llm_responses))
+        in_flight = []
+
+        async def agenerate(prompt=None, messages=None):
+            chunk = next(chunk for chunk in self.chunks if chunk in prompt)
+            in_flight.append(chunk)
+            # the first chunk answers last
+            await asyncio.sleep(0.05 if chunk == self.chunks[0] else 0)
+            return responses[chunk]
+
+        self.mock_llm.agenerate.side_effect = agenerate
+        extractor = PropertyGraphExtract(llm=self.mock_llm, max_concurrency=4)
+        result = extractor.run({"schema": self.schema, "chunks": self.chunks})
+
+        sequential = PropertyGraphExtract(llm=FakeLLM(self.llm_responses), max_concurrency=1)
+        expected = sequential.run({"schema": self.schema, "chunks": self.chunks})
+
+        self.mock_llm.generate.assert_not_called()
+        self.assertEqual(in_flight, self.chunks)
+        self.assertEqual(result["call_count"], 2)
+        self.assertEqual(result["vertices"], expected["vertices"])
+        self.assertEqual(result["edges"], expected["edges"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,97 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import unittest
+from unittest.mock import MagicMock
+
+import pytest
+
+from hugegraph_llm.utils.answer_cache import AnswerCache
+
+pytestmark = [pytest.mark.unit]
+
+VECTORS = {
+    "who is Al Pacino?": [1.0, 0.0, 0.0],
+    "who is al pacino": [0.99, 0.1, 0.0],
+    "what is The Godfather?": [0.0, 1.0, 0.0],
+}
+
+
+def _embedding():
+    embedding = MagicMock()
+    embedding.get_text_embedding.side_effect = lambda text: VECTORS[text]
+    return embedding
+
+
+class TestAnswerCache(unittest.TestCase):
+    def setUp(self):
+        self.embedding = _embedding()
+        self.cache = AnswerCache(ttl=60, threshold=0.95, max_entries=10, embedding=self.embedding)
+        self.compute = MagicMock(side_effect=lambda: {"graph_vector_answer": f"answer {self.compute.call_count}"})
+
+    def _ask(self, query, flow="rag_graph_vector", **kwargs):
+        return self.cache.get_or_compute(flow, (), {"query": query, **kwargs}, self.compute)
+
+    def test_similar_query_reuses_answer(self):
+        self.assertEqual(self._ask("who is Al Pacino?"), {"graph_vector_answer": "answer 1"})
+        self.assertEqual(self._ask("who is al pacino"), {"graph_vector_answer": "answer 1"})
+        self.assertEqual(self._ask("what is The Godfather?"), {"graph_vector_answer": "answer 2"})
+        self.assertEqual(self.compute.call_count, 2)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_exact_query_skips_embedding(self):
+        self._ask("who is Al Pacino?")
+        self._ask("who is Al Pacino?")
+        self.assertEqual(self.embedding.get_text_embedding.call_count, 1)
+        self.assertEqual(self.compute.call_count, 1)
+
+    def test_different_parameters_or_flow_do_not_share_answers(self):
+        self._ask("who is Al Pacino?", graph_ratio=0.5)
+        self._ask("who is Al Pacino?", graph_ratio=0.8)
+        self._ask("who is Al Pacino?", flow="rag_vector_only", graph_ratio=0.5)
+        self.assertEqual(self.compute.call_count, 3)
+
+    def test_invalidate_drops_answers(self):
+        self._ask("who is Al Pacino?")
+        self.cache.invalidate()
+        self._ask("who is Al Pacino?")
+        self.assertEqual(self.compute.call_count, 2)
+
+    def test_errors_and_empty_answers_are_not_cached(self):
+        self.compute.side_effect = lambda: {"graph_vector_answer": ""}
+        self._ask("who is Al Pacino?")
+        self._ask("who is Al Pacino?")
+        self.assertEqual(self.compute.call_count, 2)
+        self.assertEqual(self.cache.stats()["answers"], 0)
+
+    def test_zero_ttl_disables_cache(self):
+        cache = AnswerCache(ttl=0, embedding=self.embedding)
+        cache.get_or_compute("rag_raw", (), {"query": "who is Al Pacino?"}, self.compute)
+        cache.get_or_compute("rag_raw", (), {"query": "who is Al Pacino?"}, self.compute)
+        self.assertEqual(self.compute.call_count, 2)
+        self.embedding.get_text_embedding.assert_not_called()
+
+    def test_partial_answer_is_not_cached(self):
+        self.compute.side_effect = lambda: {"graph_vector_answer": "vector only", "partial": True}
+        self._ask("who is Al Pacino?")
+        self._ask("who is Al Pacino?")
+        self.assertEqual(self.compute.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
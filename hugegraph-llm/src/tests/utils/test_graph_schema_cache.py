@@ -0,0 +1,95 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import pytest
+
+from hugegraph_llm.utils.graph_schema_cache import GraphSchemaCache
+
+pytestmark = [pytest.mark.unit]
+
+
+def _client(url="http://127.0.0.1:8080", graphspace="DEFAULT", graph="hugegraph"):
+    client = MagicMock()
+    client.cfg.url = url
+    client.cfg.graphspace = graphspace
+    client.cfg.graph_name = graph
+    client.schema.return_value.getVertexLabels.return_value = ["person", "movie"]
+    client.schema.return_value.getSchema.return_value = {"vertexlabels": [{"name": "person"}], "edgelabels": []}
+    return client
+
+
+class TestGraphSchemaCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = GraphSchemaCache(ttl=60)
+
+    def test_hit_after_first_load(self):
+        client = _client()
+        self.assertEqual(self.cache.get_vertex_labels(client), ["person", "movie"])
+        self.assertEqual(self.cache.get_vertex_labels(client), ["person", "movie"])
+
+        client.schema.return_value.getVertexLabels.assert_called_once()
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_clients_of_same_graph_share_entries(self):
+        self.cache.get_vertex_labels(_client())
+        other = _client()
+        self.cache.get_vertex_labels(other)
+        other.schema.return_value.getVertexLabels.assert_not_called()
+
+        another_graph = _client(graph="other")
+        self.cache.get_vertex_labels(another_graph)
+        another_graph.schema.return_value.getVertexLabels.assert_called_once()
+
+    def test_invalidate_forces_reload(self):
+        client = _client()
+        self.cache.get_vertex_labels(client)
+        self.cache.invalidate(client)
+        self.cache.get_vertex_labels(client)
+        self.assertEqual(client.schema.return_value.getVertexLabels.call_count, 2)
+
+    def test_expired_entry_is_reloaded(self):
+        cache = GraphSchemaCache(ttl=0.01)
+        client = _client()
+        cache.get_vertex_labels(client)
+        time.sleep(0.02)
+        cache.get_vertex_labels(client)
+        self.assertEqual(client.schema.return_value.getVertexLabels.call_count, 2)
+
+    def test_zero_ttl_disables_cache(self):
+        cache = GraphSchemaCache(ttl=0)
+        client = _client()
+        cache.get_vertex_labels(client)
+        cache.get_vertex_labels(client)
+        self.assertEqual(client.schema.return_value.getVertexLabels.call_count, 2)
+
+    def test_none_response_is_not_cached(self):
+        client = _client()
+        client.schema.return_value.getVertexLabels.return_value = None
+        self.assertIsNone(self.cache.get_vertex_labels(client))
+        self.cache.get_vertex_labels(client)
+        self.assertEqual(client.schema.return_value.getVertexLabels.call_count, 2)
+
+    def test_get_schema_returns_copy(self):
+        client = _client()
+        schema = self.cache.get_schema(client)
+        schema["vertexlabels"].clear()
+        self.assertEqual(self.cache.get_schema(client)["vertexlabels"], [{"name": "person"}])
@@ -0,0 +1,81 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import unittest
+from unittest.mock import patch
+
+from hugegraph_llm.flows.rag_flow_graph_only import RAGGraphOnlyFlow
+from hugegraph_llm.state.ai_state import WkFlowInput
+from hugegraph_llm.utils.hugegraph_utils import get_hg_client, graph_connection
+
+CONNECTION = {
+    "url": "http://tenant:8080",
+    "graph": "tenant_graph",
+    "user": "tenant",
+    "pwd": "secret",
+    "graphspace": None,
+}
+
+
+class TestGraphConnection(unittest.TestCase):
+    @patch("hugegraph_llm.utils.hugegraph_utils.huge_settings")
+    def test_defaults_to_configured_graph(self, mock_settings):
+        mock_settings.graph_url = "http://configured:8080"
+        mock_settings.graph_name = "configured"
+        mock_settings.graph_user = "admin"
+        mock_settings.graph_pwd = "admin"
+        mock_settings.graph_space = "space"
+
+        self.assertEqual(
+            graph_connection(),
+            {
+                "url": "http://configured:8080",
+                "graph": "configured",
+                "user": "admin",
+                "pwd": "admin",
+                "graphspace": "space",
+            },
+        )
+
+    @patch("hugegraph_llm.utils.hugegraph_utils.huge_settings")
+    def test_request_connection_is_used_as_a_unit(self, mock_settings):
+        mock_settings.graph_space = "space"
+
+        # an omitted graphspace must not fall back to the configured one
+        self.assertEqual(graph_connection(CONNECTION), CONNECTION)
+
+    @patch("hugegraph_llm.utils.hugegraph_utils.PyHugeClient")
+    def test_get_hg_client_connects_to_request_graph(self, mock_client):
+        get_hg_client(CONNECTION)
+
+        mock_client.assert_called_once_with(
+            url="http://tenant:8080", graph="tenant_graph", user="tenant", pwd="secret", graphspace=None
+        )
+
+    def test_rag_flow_prepare_does_not_keep_previous_graph(self):
+        flow = RAGGraphOnlyFlow()
+        prepared_input = WkFlowInput()
+
+        flow.prepare(prepared_input, query="q", graph_client_config=CONNECTION)
+        self.assertEqual(prepared_input.schema, "tenant_graph")
+        self.assertEqual(prepared_input.graph_client_config, CONNECTION)
+
+        # a pooled pipeline is reused by the next request, which targets the configured graph
+        flow.prepare(prepared_input, query="q")
+        self.assertIsNone(prepared_input.graph_client_config)
+        self.assertEqual(prepared_input.schema, graph_connection()["graph"])
@@ -0,0 +1,242 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from hugegraph_llm.utils import rate_limiter
+from hugegraph_llm.utils.rate_limiter import (
+    AdaptiveConcurrency,
+    ConcurrencyTimeoutError,
+    ProviderLimiter,
+    RateLimiter,
+    get_provider_limiter,
+    rate_limited,
+)
+
+pytestmark = [pytest.mark.unit]
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_disabled_limiter_never_waits(self):
+        limiter = RateLimiter()
+        start = time.monotonic()
+        for _ in range(100):
+            limiter.wait(10_000)
+        self.assertFalse(limiter.enabled)
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_requests_beyond_the_rpm_budget_wait(self):
+        # 600 rpm = one request every 0.1s once the initial budget is spent
+        limiter = RateLimiter(rpm=600)
+        limiter._requests.level = 1
+        start = time.monotonic()
+        limiter.wait()
+        limiter.wait()
+        limiter.wait()
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+
+    def test_async_token_budget_is_shared(self):
+        limiter = RateLimiter(tpm=6000)
+        limiter._tokens.level = 100
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(limiter.acquire(100), limiter.acquire(10))
+            return time.monotonic() - start
+
+        # 10 tokens over the budget at 100 tokens/s
+        self.assertGreaterEqual(asyncio.run(run()), 0.09)
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    def test_limit_is_halved_when_rate_limited_and_ramps_up(self):
+        concurrency = AdaptiveConcurrency(max_limit=8)
+        concurrency.on_rate_limited()
+        self.assertEqual(concurrency.limit, 4)
+        # a burst of errors from calls already in flight only cuts the limit once
+        concurrency.on_rate_limited()
+        self.assertEqual(concurrency.limit, 4)
+
+        # about one more slot per `limit` successful calls
+        for _ in range(6):
+            concurrency.on_success()
+        self.assertEqual(int(concurrency.limit), 5)
+        for _ in range(100):
+            concurrency.on_success()
+        self.assertEqual(concurrency.limit, 8)
+
+    def test_calls_in_flight_stay_under_the_limit(self):
+        concurrency = AdaptiveConcurrency(max_limit=2)
+        peak = []
+
+        async def call():
+            await concurrency.acquire_async()
+            try:
+                peak.append(concurrency.in_flight)
+                await asyncio.sleep(0.01)
+            finally:
+                concurrency.release()
+
+        async def run():
+            await asyncio.gather(*(call() for _ in range(6)))
+
+        asyncio.run(run())
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(concurrency.in_flight, 0)
+
+    def test_sync_and_async_callers_share_the_limit(self):
+        concurrency = AdaptiveConcurrency(max_limit=1)
+        concurrency.acquire()
+        acquired = threading.Event()
+
+        async def wait_for_slot():
+            await concurrency.acquire_async()
+            acquired.set()
+            concurrency.release()
+
+        thread = threading.Thread(target=lambda: asyncio.run(wait_for_slot()))
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        concurrency.release()
+        thread.join(1)
+        self.assertTrue(acquired.is_set())
+
+    def test_timed_out_async_waiter_does_not_break_release(self):
+        concurrency = AdaptiveConcurrency(max_limit=1)
+        concurrency.acquire()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(concurrency.acquire_async(), 0.1))
+
+        self.assertEqual(concurrency._async_waiters, [])
+        concurrency.release()
+        self.assertEqual(concurrency.in_flight, 0)
+
+    def test_waiters_on_closed_loops_are_skipped(self):
+        concurrency = AdaptiveConcurrency(max_limit=1)
+        concurrency.acquire()
+        closed_loop = asyncio.new_event_loop()
+        closed_loop.close()
+        concurrency._async_waiters.append((closed_loop, asyncio.Event()))
+        acquired = threading.Event()
+
+        async def wait_for_slot():
+            await concurrency.acquire_async()
+            acquired.set()
+            concurrency.release()
+
+        thread = threading.Thread(target=lambda: asyncio.run(wait_for_slot()))
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        concurrency.release()
+        thread.join(1)
+        self.assertTrue(acquired.is_set())
+
+    def test_acquire_gives_up_after_the_timeout(self):
+        concurrency = AdaptiveConcurrency(max_limit=1, timeout=0.05, name="llm Mock/mock-model")
+        concurrency.acquire()
+
+        with self.assertRaisesRegex(ConcurrencyTimeoutError, "llm Mock/mock-model"):
+            concurrency.acquire()
+        with self.assertRaises(ConcurrencyTimeoutError):
+            asyncio.run(concurrency.acquire_async())
+
+        self.assertEqual(concurrency._async_waiters, [])
+        concurrency.release()
+        self.assertEqual(concurrency.in_flight, 0)
+
+
+class TestRateLimitedClient(unittest.TestCase):
+    def test_rate_limit_errors_lower_the_provider_concurrency(self):
+        limiter = ProviderLimiter(max_concurrency=8)
+
+        class Client:
+            model = "mock-model"
+
+            def __init__(self):
+                self.fail = True
+
+            @rate_limited("llm")
+            def generate(self, messages=None, prompt=None):
+                if self.fail:
+                    raise RateLimitError("429")
+                return "ok"
+
+            @rate_limited("llm")
+            async def agenerate(self, messages=None, prompt=None):
+                return "ok"
+
+        with patch("hugegraph_llm.utils.rate_limiter.get_provider_limiter", return_value=limiter):
+            client = Client()
+            with self.assertRaises(RateLimitError):
+                client.generate(prompt="hello")
+            self.assertEqual(limiter.concurrency.limit, 4)
+
+            client.fail = False
+            self.assertEqual(client.generate(prompt="hello"), "ok")
+            self.assertEqual(asyncio.run(client.agenerate(prompt="hello")), "ok")
+            self.assertGreater(limiter.concurrency.limit, 4)
+            self.assertEqual(limiter.concurrency.in_flight, 0)
+
+    def test_streams_only_hold_the_slot_until_the_first_chunk(self):
+        limiter = ProviderLimiter(max_concurrency=1, acquire_timeout=0.05)
+
+        class Client:
+            model = "mock-model"
+
+            @rate_limited("llm")
+            def generate_streaming(self, messages=None, prompt=None):
+                yield from ("a", "b")
+
+            @rate_limited("llm")
+            async def agenerate_streaming(self, messages=None, prompt=None):
+                for chunk in ("a", "b"):
+                    yield chunk
+
+        async def first_chunk(stream):
+            return await anext(stream)
+
+        with patch("hugegraph_llm.utils.rate_limiter.get_provider_limiter", return_value=limiter):
+            client = Client()
+            # abandoned after their first chunk
+            streams = [client.generate_streaming(prompt="hello") for _ in range(3)]
+            self.assertEqual([next(stream) for stream in streams], ["a", "a", "a"])
+            self.assertEqual(asyncio.run(first_chunk(client.agenerate_streaming(prompt="hello"))), "a")
+            self.assertEqual(limiter.concurrency.in_flight, 0)
+            self.assertEqual(list(streams[0]), ["b"])
+
+    def test_limiters_are_keyed_by_endpoint(self):
+        with patch.dict(rate_limiter._limiters, clear=True):
+            first = get_provider_limiter("llm", "OpenAIClient", "gpt-4.1-mini", "http://10.0.0.1/v1")
+            second = get_provider_limiter("llm", "OpenAIClient", "gpt-4.1-mini", "http://10.0.0.2/v1")
+            self.assertIsNot(first, second)
+            self.assertIs(first, get_provider_limiter("llm", "OpenAIClient", "gpt-4.1-mini", "http://10.0.0.1/v1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
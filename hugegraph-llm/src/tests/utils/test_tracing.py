@@ -0,0 +1,112 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import json
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from hugegraph_llm.utils import tracing
+from hugegraph_llm.utils.tracing import (
+    FileTraceExporter,
+    InMemoryTraceExporter,
+    TraceExporter,
+    record,
+    record_embedding_batch,
+    record_token_usage,
+    request_trace,
+    span,
+    timed,
+)
+
+pytestmark = [pytest.mark.unit]
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.exporter = InMemoryTraceExporter()
+        tracing.set_trace_exporter(self.exporter)
+
+    def tearDown(self):
+        tracing.set_trace_exporter(None)
+
+    def test_nested_spans_and_counters_are_exported(self):
+        with request_trace("rag", "req-1") as trace:
+            with request_trace("rag_graph_vector"):
+                with span(trace, "KeywordExtractNode"):
+                    record_token_usage({"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15})
+                    record_embedding_batch(4)
+                    with timed("gremlin"):
+                        pass
+                    record("custom")
+
+        exported = self.exporter.traces[0]
+        self.assertEqual(exported["request_id"], "req-1")
+        root, flow, node = exported["spans"]
+        self.assertEqual([root["name"], flow["name"], node["name"]], ["rag", "rag_graph_vector", "KeywordExtractNode"])
+        self.assertEqual(flow["parent_id"], root["span_id"])
+        self.assertEqual(node["parent_id"], flow["span_id"])
+        self.assertTrue(all(s["duration"] is not None for s in exported["spans"]))
+        attributes = node["attributes"]
+        self.assertEqual(attributes["llm_calls"], 1)
+        self.assertEqual(attributes["total_tokens"], 15)
+        self.assertEqual(attributes["embedding_batch_sizes"], [4])
+        self.assertEqual(attributes["gremlin_count"], 1)
+        self.assertEqual(attributes["custom"], 1)
+
+    def test_failed_span_keeps_the_error(self):
+        with self.assertRaises(ValueError):
+            with request_trace("rag") as trace:
+                with span(trace, "GraphQueryNode"):
+                    raise ValueError("bad gremlin")
+        node = self.exporter.traces[0]["spans"][1]
+        self.assertEqual(node["status"], "ValueError: bad gremlin")
+
+    def test_noop_exporter_skips_tracing_unless_forced(self):
+        tracing.set_trace_exporter(TraceExporter())
+        with request_trace("rag") as trace:
+            record("llm_calls")
+            self.assertIsNone(trace)
+        with request_trace("rag", force=True) as trace:
+            self.assertIsNotNone(trace)
+        self.assertEqual(trace.root.name, "rag")
+
+    def test_file_exporter_writes_otlp_json_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "traces.jsonl")
+            tracing.set_trace_exporter(FileTraceExporter(path))
+            with request_trace("rag") as trace:
+                with span(trace, "VectorQueryNode"):
+                    record_embedding_batch(1)
+            with open(path, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+
+        spans = lines[0]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        self.assertEqual(len(lines), 1)
+        self.assertEqual([s["name"] for s in spans], ["rag", "VectorQueryNode"])
+        self.assertEqual(spans[1]["parentSpanId"], spans[0]["spanId"])
+        self.assertEqual(spans[1]["traceId"], trace.trace_id)
+        self.assertIn(
+            {"key": "embedding_texts", "value": {"intValue": "1"}},
+            spans[1]["attributes"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -26,37 +26,143 @@ from pyhugegraph.utils.exceptions import NotFoundError
 from pyhugegraph.utils.id_format import format_vertex_id, format_vertex_id_path
 
 
+def _vertex_payload(label, properties, id=None) -> str:  # pylint: disable=redefined-builtin
+    data = {}
+    if id is not None:
+        data["id"] = id
+    data["label"] = label
+    data["properties"] = properties
+    return json.dumps(data)
+
+
+def _vertices_payload(input_data) -> str:
+    data = []
+    for item in input_data:
+        vertex = {"label": item[0], "properties": item[1]}
+        # optional 3rd element: the vertex id (for customize-id vertex labels)
+        if len(item) > 2 and item[2] is not None:
+            vertex["id"] = item[2]
+        data.append(vertex)
+    return json.dumps(data)
+
+
+def _edge_payload(edge_label, out_id, in_id, properties) -> str:
+    return json.dumps(
+        {
+            "label": edge_label,
+            "outV": out_id,
+            "inV": in_id,
+            "properties": properties,
+        }
+    )
+
+
+def _edges_payload(input_data) -> str:
+    data = []
+    for item in input_data:
+        data.append(
+            {
+                "label": item[0],
+                "outV": item[1],
+                "inV": item[2],
+                "outVLabel": item[3],
+                "inVLabel": item[4],
+                "properties": item[5],
+            }
+        )
+    return json.dumps(data)
+
+
+def _vertex_action_path(vertex_id, action) -> str:
+    return f"graph/vertices/{format_vertex_id_path(vertex_id)}?action={action}"
+
+
+def _vertex_page_path(label, limit, page=None, properties=None) -> str:
+    path = "graph/vertices?"
+    para = ""
+    para = para + "&label=" + label
+    if properties:
+        para = para + "&properties=" + json.dumps(properties)
+    if page:
+        para += f"&page={page}"
+    else:
+        para += "&page"
+    para = para + "&limit=" + str(limit)
+    return path + para[1:]
+
+
+def _vertex_condition_path(label="", limit=0, page=None, properties=None) -> str:
+    path = "graph/vertices?"
+    para = ""
+    if label:
+        para = para + "&label=" + label
+    if properties:
+        para = para + "&properties=" + json.dumps(properties)
+    if limit > 0:
+        para = para + "&limit=" + str(limit)
+    if page:
+        para += f"&page={page}"
+    else:
+        para += "&page"
+    return path + para[1:]
+
+
+def _edge_page_path(label=None, vertex_id=None, direction=None, limit=0, page=None, properties=None) -> str:
+    path = "graph/edges?"
+    para = ""
+    if vertex_id is not None:
+        if direction:
+            vertex_query = urlencode({"vertex_id": format_vertex_id(vertex_id)})
+            para = para + "&" + vertex_query + "&direction=" + direction
+        else:
+            raise NotFoundError("Direction can not be empty.")
+    if label:
+        para = para + "&label=" + label
+    if properties:
+        para = para + "&properties=" + json.dumps(properties)
+    if page:
+        para += f"&page={page}"
+    else:
+        para += "&page"
+    if limit > 0:
+        para = para + "&limit=" + str(limit)
+    return path + para[1:]
+
+
+def _vertices_by_id_path(vertex_ids) -> str:
+    return "traversers/vertices?" + urlencode([("ids", format_vertex_id(vertex_id)) for vertex_id in vertex_ids])
+
+
+def _edges_by_id_path(edge_ids) -> str:
+    path = "traversers/edges?"
+    for edge_id in edge_ids:
+        path += f"ids={edge_id}&"  # pylint: disable=consider-using-join
+    return path.rstrip("&")
+
+
 class GraphManager(HugeParamsBase):
     @router.http("POST", "graph/vertices")
     def addVertex(self, label, properties, id=None):
-        data = {}
-        if id is not None:
-            data["id"] = id
-        data["label"] = label
-        data["properties"] = properties
-        if response := self._invoke_request(data=json.dumps(data)):
+        if response := self._invoke_request(data=_vertex_payload(label, properties, id)):
             return VertexData(response)
         return None
 
     @router.http("POST", "graph/vertices/batch")
     def addVertices(self, input_data):
-        data = []
-        for item in input_data:
-            data.append({"label": item[0], "properties": item[1]})
-        if response := self._invoke_request(data=json.dumps(data)):
+        if response := self._invoke_request(data=_vertices_payload(input_data)):
             return [VertexData({"id": item}) for item in response]
         return None
 
     def appendVertex(self, vertex_id, properties):
         data = {"properties": properties}
-        path = f"graph/vertices/{format_vertex_id_path(vertex_id)}?action=append"
+        path = _vertex_action_path(vertex_id, "append")
         if response := self._sess.request(path, "PUT", data=json.dumps(data)):
             return VertexData(response)
         return None
 
     def eliminateVertex(self, vertex_id, properties):
         data = {"properties": properties}
-        path = f"graph/vertices/{format_vertex_id_path(vertex_id)}?action=eliminate"
+        path = _vertex_action_path(vertex_id, "eliminate")
         if response := self._sess.request(path, "PUT", data=json.dumps(data)):
             return VertexData(response)
         return None
@@ -68,17 +174,7 @@ class GraphManager(HugeParamsBase):
         return None
 
     def getVertexByPage(self, label, limit, page=None, properties=None):
-        path = "graph/vertices?"
-        para = ""
-        para = para + "&label=" + label
-        if properties:
-            para = para + "&properties=" + json.dumps(properties)
-        if page:
-            para += f"&page={page}"
-        else:
-            para += "&page"
-        para = para + "&limit=" + str(limit)
-        path = path + para[1:]
+        path = _vertex_page_path(label, limit, page, properties)
         if response := self._sess.request(path):
             res = [VertexData(item) for item in response["vertices"]]
             next_page = response["page"]
@@ -86,19 +182,7 @@ class GraphManager(HugeParamsBase):
         return None, None
 
     def getVertexByCondition(self, label="", limit=0, page=None, properties=None):
-        path = "graph/vertices?"
-        para = ""
-        if label:
-            para = para + "&label=" + label
-        if properties:
-            para = para + "&properties=" + json.dumps(properties)
-        if limit > 0:
-            para = para + "&limit=" + str(limit)
-        if page:
-            para += f"&page={page}"
-        else:
-            para += "&page"
-        path = path + para[1:]
+        path = _vertex_condition_path(label, limit, page, properties)
         if response := self._sess.request(path):
             return [VertexData(item) for item in response["vertices"]]
         return None
@@ -109,31 +193,13 @@ class GraphManager(HugeParamsBase):
 
     @router.http("POST", "graph/edges")
     def addEdge(self, edge_label, out_id, in_id, properties) -> EdgeData | None:
-        data = {
-            "label": edge_label,
-            "outV": out_id,
-            "inV": in_id,
-            "properties": properties,
-        }
-        if response := self._invoke_request(data=json.dumps(data)):
+        if response := self._invoke_request(data=_edge_payload(edge_label, out_id, in_id, properties)):
             return EdgeData(response)
         return None
 
     @router.http("POST", "graph/edges/batch")
     def addEdges(self, input_data) -> list[EdgeData] | None:
-        data = []
-        for item in input_data:
-            data.append(
-                {
-                    "label": item[0],
-                    "outV": item[1],
-                    "inV": item[2],
-                    "outVLabel": item[3],
-                    "inVLabel": item[4],
-                    "properties": item[5],
-                }
-            )
-        if response := self._invoke_request(data=json.dumps(data)):
+        if response := self._invoke_request(data=_edges_payload(input_data)):
             return [EdgeData({"id": item}) for item in response]
         return None
 
@@ -172,25 +238,7 @@ class GraphManager(HugeParamsBase):
         page=None,
         properties=None,
     ):
-        path = "graph/edges?"
-        para = ""
-        if vertex_id is not None:
-            if direction:
-                vertex_query = urlencode({"vertex_id": format_vertex_id(vertex_id)})
-                para = para + "&" + vertex_query + "&direction=" + direction
-            else:
-                raise NotFoundError("Direction can not be empty.")
-        if label:
-            para = para + "&label=" + label
-        if properties:
-            para = para + "&properties=" + json.dumps(properties)
-        if page:
-            para += f"&page={page}"
-        else:
-            para += "&page"
-        if limit > 0:
-            para = para + "&limit=" + str(limit)
-        path = path + para[1:]
+        path = _edge_page_path(label, vertex_id, direction, limit, page, properties)
         if response := self._sess.request(path):
             return [EdgeData(item) for item in response["edges"]], response["page"]
         return None, None
@@ -202,20 +250,122 @@ class GraphManager(HugeParamsBase):
     def getVerticesById(self, vertex_ids) -> list[VertexData] | None:
         if not vertex_ids:
             return []
-        path = "traversers/vertices?"
-        query = urlencode([("ids", format_vertex_id(vertex_id)) for vertex_id in vertex_ids])
-        path += query
-        if response := self._sess.request(path):
+        if response := self._sess.request(_vertices_by_id_path(vertex_ids)):
             return [VertexData(item) for item in response["vertices"]]
         return None
 
     def getEdgesById(self, edge_ids) -> list[EdgeData] | None:
         if not edge_ids:
             return []
-        path = "traversers/edges?"
-        for vertex_id in edge_ids:
-            path += f"ids={vertex_id}&"  # pylint: disable=consider-using-join
-        path = path.rstrip("&")
-        if response := self._sess.request(path):
+        if response := self._sess.request(_edges_by_id_path(edge_ids)):
+            return [EdgeData(item) for item in response["edges"]]
+        return None
+
+
+class AsyncGraphManager(GraphManager):
+    @router.http("POST", "graph/vertices")
+    async def addVertex(self, label, properties, id=None):
+        if response := await self._invoke_request(data=_vertex_payload(label, properties, id)):
+            return VertexData(response)
+        return None
+
+    @router.http("POST", "graph/vertices/batch")
+    async def addVertices(self, input_data):
+        if response := await self._invoke_request(data=_vertices_payload(input_data)):
+            return [VertexData({"id": item}) for item in response]
+        return None
+
+    async def appendVertex(self, vertex_id, properties):
+        data = {"properties": properties}
+        path = _vertex_action_path(vertex_id, "append")
+        if response := await self._sess.request(path, "PUT", data=json.dumps(data)):
+            return VertexData(response)
+        return None
+
+    async def eliminateVertex(self, vertex_id, properties):
+        data = {"properties": properties}
+        path = _vertex_action_path(vertex_id, "eliminate")
+        if response := await self._sess.request(path, "PUT", data=json.dumps(data)):
+            return VertexData(response)
+        return None
+
+    async def getVertexById(self, vertex_id):
+        if response := await self._sess.request(f"graph/vertices/{format_vertex_id_path(vertex_id)}"):
+            return VertexData(response)
+        return None
+
+    async def getVertexByPage(self, label, limit, page=None, properties=None):
+        if response := await self._sess.request(_vertex_page_path(label, limit, page, properties)):
+            return [VertexData(item) for item in response["vertices"]], response["page"]
+        return None, None
+
+    async def getVertexByCondition(self, label="", limit=0, page=None, properties=None):
+        if response := await self._sess.request(_vertex_condition_path(label, limit, page, properties)):
+            return [VertexData(item) for item in response["vertices"]]
+        return None
+
+    @router.http("POST", "graph/edges")
+    async def addEdge(self, edge_label, out_id, in_id, properties) -> EdgeData | None:
+        if response := await self._invoke_request(data=_edge_payload(edge_label, out_id, in_id, properties)):
+            return EdgeData(response)
+        return None
+
+    @router.http("POST", "graph/edges/batch")
+    async def addEdges(self, input_data) -> list[EdgeData] | None:
+        if response := await self._invoke_request(data=_edges_payload(input_data)):
+            return [EdgeData({"id": item}) for item in response]
+        return None
+
+    @router.http("PUT", "graph/edges/{edge_id}?action=append")
+    async def appendEdge(
+        self,
+        edge_id,
+        properties,  # pylint: disable=unused-argument
+    ) -> EdgeData | None:
+        if response := await self._invoke_request(data=json.dumps({"properties": properties})):
+            return EdgeData(response)
+        return None
+
+    @router.http("PUT", "graph/edges/{edge_id}?action=eliminate")
+    async def eliminateEdge(
+        self,
+        edge_id,
+        properties,  # pylint: disable=unused-argument
+    ) -> EdgeData | None:
+        if response := await self._invoke_request(data=json.dumps({"properties": properties})):
+            return EdgeData(response)
+        return None
+
+    @router.http("GET", "graph/edges/{edge_id}")
+    async def getEdgeById(self, edge_id) -> EdgeData | None:  # pylint: disable=unused-argument
+        if response := await self._invoke_request():
+            return EdgeData(response)
+        return None
+
+    async def getEdgeByPage(
+        self,
+        label=None,
+        vertex_id=None,
+        direction=None,
+        limit=0,
+        page=None,
+        properties=None,
+    ):
+        path = _edge_page_path(label, vertex_id, direction, limit, page, properties)
+        if response := await self._sess.request(path):
+            return [EdgeData(item) for item in response["edges"]], response["page"]
+        return None, None
+
+    async def getVerticesById(self, vertex_ids) -> list[VertexData] | None:
+        if not vertex_ids:
+            return []
+        if response := await self._sess.request(_vertices_by_id_path(vertex_ids)):
+            return [VertexData(item) for item in response["vertices"]]
+        return None
+
+    async def getEdgesById(self, edge_ids) -> list[EdgeData] | None:
+        if not edge_ids:
+            return []
+        if response := await self._sess.request(_edges_by_id_path(edge_ids)):
             return [EdgeData(item) for item in response["edges"]]
         return None
@@ -27,8 +27,7 @@ _REQUIRED_RESPONSE_FIELDS = {"requestId", "status", "result"}
 
 
 class GremlinManager(HugeParamsBase):
-    @router.http("POST", "/gremlin")
-    def exec(self, gremlin):
+    def _gremlin_data(self, gremlin) -> GremlinData:
         gremlin_data = GremlinData(gremlin)
 
         # Version-specific gremlin request handling
@@ -46,11 +45,23 @@ class GremlinManager(HugeParamsBase):
                 "graph": f"{self._sess.cfg.graph_name}",
                 "g": f"__g_{self._sess.cfg.graph_name}",
             }
+        return gremlin_data
 
-        response = self._invoke_request(data=gremlin_data.to_json())
+    @staticmethod
+    def _gremlin_result(response):
         if response is not None:
             if not isinstance(response, dict) or not _REQUIRED_RESPONSE_FIELDS.issubset(response):
                 raise ResponseParseError(f"Invalid Gremlin response payload: {response}")
             return ResponseData(response).result
         log.error("Gremlin can't get results: %s", str(response))
         return None
+
+    @router.http("POST", "/gremlin")
+    def exec(self, gremlin):
+        return self._gremlin_result(self._invoke_request(data=self._gremlin_data(gremlin).to_json()))
+
+
+class AsyncGremlinManager(GremlinManager):
+    @router.http("POST", "/gremlin")
+    async def exec(self, gremlin):
+        return self._gremlin_result(await self._invoke_request(data=self._gremlin_data(gremlin).to_json()))
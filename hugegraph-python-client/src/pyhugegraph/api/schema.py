@@ -130,3 +130,71 @@ class SchemaManager(HugeParamsBase):
         if response := self._invoke_request():
             return [IndexLabelData(item) for item in response["indexlabels"]]
         return None
+
+
+class AsyncSchemaManager(HugeParamsBase):
+    """
+    Async schema reads only: schema definition (propertyKey/vertexLabel/edgeLabel/indexLabel) is sync-only,
+    use the SchemaManager of PyHugeClient for it.
+    """
+
+    @router.http("GET", "schema?format={_format}")
+    async def getSchema(self, _format: str = "json") -> dict | None:  # pylint: disable=unused-argument
+        return await self._invoke_request()
+
+    @router.http("GET", "schema/propertykeys/{property_name}")
+    async def getPropertyKey(self, property_name) -> PropertyKeyData | None:  # pylint: disable=unused-argument
+        if response := await self._invoke_request():
+            return PropertyKeyData(response)
+        return None
+
+    @router.http("GET", "schema/propertykeys")
+    async def getPropertyKeys(self) -> list[PropertyKeyData] | None:
+        if response := await self._invoke_request():
+            return [PropertyKeyData(item) for item in response["propertykeys"]]
+        return None
+
+    @router.http("GET", "schema/vertexlabels/{name}")
+    async def getVertexLabel(self, name) -> VertexLabelData | None:  # pylint: disable=unused-argument
+        if response := await self._invoke_request():
+            return VertexLabelData(response)
+        log.error("VertexLabel not found: %s", str(response))
+        return None
+
+    @router.http("GET", "schema/vertexlabels")
+    async def getVertexLabels(self) -> list[VertexLabelData] | None:
+        if response := await self._invoke_request():
+            return [VertexLabelData(item) for item in response["vertexlabels"]]
+        return None
+
+    @router.http("GET", "schema/edgelabels/{label_name}")
+    async def getEdgeLabel(self, label_name: str) -> EdgeLabelData | None:  # pylint: disable=unused-argument
+        if response := await self._invoke_request():
+            return EdgeLabelData(response)
+        log.error("EdgeLabel not found: %s", str(response))
+        return None
+
+    @router.http("GET", "schema/edgelabels")
+    async def getEdgeLabels(self) -> list[EdgeLabelData] | None:
+        if response := await self._invoke_request():
+            return [EdgeLabelData(item) for item in response["edgelabels"]]
+        return None
+
+    @router.http("GET", "schema/edgelabels")
+    async def getRelations(self) -> list[str] | None:
+        if response := await self._invoke_request():
+            return [EdgeLabelData(item).relations() for item in response["edgelabels"]]
+        return None
+
+    @router.http("GET", "schema/indexlabels/{name}")
+    async def getIndexLabel(self, name) -> IndexLabelData | None:  # pylint: disable=unused-argument
+        if response := await self._invoke_request():
+            return IndexLabelData(response)
+        log.error("IndexLabel not found: %s", str(response))
+        return None
+
+    @router.http("GET", "schema/indexlabels")
+    async def getIndexLabels(self) -> list[IndexLabelData] | None:
+        if response := await self._invoke_request():
+            return [IndexLabelData(item) for item in response["indexlabels"]]
+        return None
@@ -248,3 +248,10 @@ class TraverserManager(HugeParamsBase):
     def edges(self, ids):
         params = {"ids": ids}
         return self._invoke_request(params=params)
+
+
+class AsyncTraverserManager(TraverserManager):
+    """
+    The traverser endpoints return the validated response unchanged, so the inherited methods already
+    return awaitables once the manager is bound to an AsyncHGraphSession.
+    """
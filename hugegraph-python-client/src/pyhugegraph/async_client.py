@@ -0,0 +1,92 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from pyhugegraph.api.graph import AsyncGraphManager
+from pyhugegraph.api.gremlin import AsyncGremlinManager
+from pyhugegraph.api.schema import AsyncSchemaManager
+from pyhugegraph.api.traverser import AsyncTraverserManager
+from pyhugegraph.client import manager_builder
+from pyhugegraph.utils.huge_async_requests import AsyncHGraphSession
+from pyhugegraph.utils.huge_config import HGraphConfig, parse_version
+
+
+class AsyncPyHugeClient:
+    """
+    Asyncio counterpart of PyHugeClient covering gremlin, schema reads, graph CRUD/batch and traversers.
+
+    Every request method is a coroutine sharing the routes and response validation of the sync managers.
+    The client owns an httpx connection pool bound to the running event loop, close it with
+    ``await client.close()`` or use the client as an async context manager.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        graph: str,
+        user: str,
+        pwd: str,
+        graphspace: str | None = None,
+        timeout: tuple[float, float] | None = None,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keep_alive: bool = True,
+        server_version: str | None = None,
+    ):
+        # without graphspace or server_version the version probe is a blocking request (once per url)
+        self.cfg = HGraphConfig(
+            url,
+            user,
+            pwd,
+            graph,
+            graphspace,
+            timeout or (0.5, 15.0),
+            version=parse_version(server_version) if server_version else [],
+        )
+        self.session = AsyncHGraphSession(
+            self.cfg,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keep_alive=keep_alive,
+        )
+
+    @manager_builder
+    def schema(self) -> "AsyncSchemaManager":
+        return AsyncSchemaManager
+
+    @manager_builder
+    def gremlin(self) -> "AsyncGremlinManager":
+        return AsyncGremlinManager
+
+    @manager_builder
+    def graph(self) -> "AsyncGraphManager":
+        return AsyncGraphManager
+
+    @manager_builder
+    def traverser(self) -> "AsyncTraverserManager":
+        return AsyncTraverserManager
+
+    async def close(self):
+        await self.session.close()
+
+    async def __aenter__(self) -> "AsyncPyHugeClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def __repr__(self) -> str:
+        return str(self.cfg)
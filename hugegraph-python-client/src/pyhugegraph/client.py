@@ -28,7 +28,7 @@ from pyhugegraph.api.task import TaskManager
 from pyhugegraph.api.traverser import TraverserManager
 from pyhugegraph.api.variable import VariableManager
 from pyhugegraph.api.version import VersionManager
-from pyhugegraph.utils.huge_config import HGraphConfig
+from pyhugegraph.utils.huge_config import HGraphConfig, parse_version
 from pyhugegraph.utils.huge_requests import HGraphSession
 
 T = TypeVar("T")
@@ -39,8 +39,7 @@ def manager_builder(fn: Callable[[Any, "HGraphSession"], T]) -> Callable[[Any],
 
     def wrapper(self: "PyHugeClient") -> T:
         if not hasattr(self, attr_name):
-            session = HGraphSession(self.cfg)
-            setattr(self, attr_name, fn(self)(session))
+            setattr(self, attr_name, fn(self)(self.session))
         return getattr(self, attr_name)
 
     return wrapper
@@ -55,8 +54,28 @@ class PyHugeClient:
         pwd: str,
         graphspace: str | None = None,
         timeout: tuple[float, float] | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        server_version: str | None = None,
     ):
-        self.cfg = HGraphConfig(url, user, pwd, graph, graphspace, timeout or (0.5, 15.0))
+        # server_version (e.g. "1.7.0") skips the /versions probe, otherwise it runs once per url and process
+        self.cfg = HGraphConfig(
+            url,
+            user,
+            pwd,
+            graph,
+            graphspace,
+            timeout or (0.5, 15.0),
+            version=parse_version(server_version) if server_version else [],
+        )
+        # one pooled session shared by all the managers of this client (and by other clients of the same server)
+        self.session = HGraphSession(
+            self.cfg,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+        )
 
     @manager_builder
     def schema(self) -> "SchemaManager":
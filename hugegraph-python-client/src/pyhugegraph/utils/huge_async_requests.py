@@ -0,0 +1,134 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import logging
+from typing import Any
+
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from pyhugegraph.utils.huge_config import HGraphConfig
+from pyhugegraph.utils.huge_requests import BaseHGraphSession
+from pyhugegraph.utils.log import log
+from pyhugegraph.utils.util import ResponseValidation, redact_sensitive_data
+
+
+def to_requests_response(response: httpx.Response) -> requests.Response:
+    """
+    Convert a httpx response into a requests.Response, so the async client shares ResponseValidation
+    (and the "raw" responses it returns) with the sync one.
+    """
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.reason = response.reason_phrase
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.url = str(response.url)
+    converted.encoding = response.encoding
+    converted._content = response.content  # pylint: disable=protected-access
+
+    request = requests.PreparedRequest()
+    request.method = response.request.method
+    request.url = str(response.request.url)
+    request.headers = CaseInsensitiveDict(response.request.headers)
+    request.body = response.request.content or None
+    converted.request = request
+    return converted
+
+
+class AsyncHGraphSession(BaseHGraphSession):
+    def __init__(
+        self,
+        cfg: HGraphConfig,
+        retries: int = 3,
+        backoff_factor: float = 0.1,
+        status_forcelist=(500, 502, 504),
+        client: httpx.AsyncClient | None = None,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keep_alive: bool = True,
+    ):
+        """
+        Initialize the AsyncHGraphSession object.
+        :param retries: The maximum number of retries.
+        :param backoff_factor: The backoff factor, used to calculate the interval between retries.
+        :param status_forcelist: A list of status codes that trigger a retry.
+        :param client: An optional httpx.AsyncClient instance, for testing or advanced use cases.
+        :param max_connections: The maximum number of concurrent connections.
+        :param max_keepalive_connections: The maximum number of idle connections to keep.
+        :param keep_alive: Whether to reuse connections, send "Connection: close" otherwise.
+        """
+        super().__init__(cfg, keep_alive)
+        self._retries = retries
+        self._backoff_factor = backoff_factor
+        self._status_forcelist = status_forcelist
+        if client is None:
+            connect_timeout, read_timeout = cfg.timeout
+            client = httpx.AsyncClient(
+                # connection errors are retried by the transport, error statuses in request()
+                transport=httpx.AsyncHTTPTransport(
+                    retries=retries,
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_keepalive_connections if keep_alive else 0,
+                    ),
+                ),
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            )
+        self._client = client
+
+    async def close(self):
+        """
+        closes the underlying httpx client and its connection pool.
+        """
+        await self._client.aclose()
+
+    async def request(
+        self,
+        path: str,
+        method: str = "GET",
+        validator=None,
+        **kwargs: Any,
+    ) -> dict:
+        if validator is None:
+            validator = ResponseValidation()
+        url = self.resolve(path)
+        # the managers pass pre-serialized bodies as requests-style `data`, httpx expects them as `content`
+        if isinstance(kwargs.get("data"), (str, bytes)):
+            kwargs["content"] = kwargs.pop("data")
+        for attempt in range(self._retries + 1):
+            response = await self._client.request(
+                method.upper(),
+                url,
+                auth=self._auth,
+                headers=self._headers,
+                **kwargs,
+            )
+            if response.status_code not in self._status_forcelist or attempt == self._retries:
+                break
+            await asyncio.sleep(self._backoff_factor * (2**attempt))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Request: %s %s validator=%s kwargs=%s %s",
+                method,
+                url,
+                validator,
+                redact_sensitive_data(kwargs),
+                response,
+            )
+        return validator(to_requests_response(response), method=method, path=path)
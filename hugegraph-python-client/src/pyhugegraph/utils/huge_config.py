@@ -17,14 +17,56 @@
 
 import re
 import sys
+import threading
 import traceback
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 import requests
 
 from pyhugegraph.utils.log import log
 
 
+def parse_version(core: str) -> list[int]:
+    """Parse a HugeGraph version string like "1.7.0.0" into [major, minor, patch]."""
+    match = re.search(r"(\d+)\.(\d+)(?:\.(\d+))?(?:\.\d+)?", core)
+    if match is None:
+        raise RuntimeError(
+            f"Unable to parse HugeGraph server version from response: {core!r}. "
+            "Please verify the server is compatible with this client."
+        )
+    return [int(match.group(1)), int(match.group(2)), int(match.group(3)) if match.group(3) else 0]
+
+
+class ServerVersionRegistry:
+    """
+    Process-wide record of the server version detected for each url, so only the first client
+    of a server pays for the /versions probe.
+    """
+
+    _versions: ClassVar[dict[str, list[int]]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def get(cls, url: str) -> list[int] | None:
+        with cls._lock:
+            version = cls._versions.get(url)
+        return list(version) if version else None
+
+    @classmethod
+    def set(cls, url: str, version: list[int] | str) -> None:
+        """Record (or override) the version of the server at ``url``, e.g. "1.7.0" or [1, 7, 0]."""
+        if isinstance(version, str):
+            version = parse_version(version)
+        with cls._lock:
+            cls._versions[url] = list(version[:3])
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._versions.clear()
+
+
 @dataclass
 class HGraphConfig:
     url: str
@@ -43,50 +85,52 @@ class HGraphConfig:
 
         if self.graphspace and self.graphspace.strip():
             self.gs_supported = True
+            return
+
+        # An explicit version (or one probed earlier in this process) spares the blocking /versions request,
+        # it is kept on this config only so other clients of the same url still detect the real version
+        if not self.version:
+            self.version.extend(ServerVersionRegistry.get(self.url) or [])
+        if self.version:
+            self._apply_version()
+            return
+
+        try:
+            response = requests.get(f"{self.url}/versions", timeout=0.5)
+            core = response.json()["versions"]["core"]
+            log.info(  # pylint: disable=logging-fstring-interpolation
+                f"Retrieved API version information from the server: {core}."
+            )
+            self.version.extend(parse_version(core))
+            ServerVersionRegistry.set(self.url, self.version)
+            self._apply_version()
+
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Version mismatch errors must not be silently swallowed
+            if isinstance(e, RuntimeError):
+                raise
 
-        else:
+            # Handle network/parsing failures gracefully, they are not cached so the next client probes again
             try:
-                response = requests.get(f"{self.url}/versions", timeout=0.5)
-                core = response.json()["versions"]["core"]
-                log.info(  # pylint: disable=logging-fstring-interpolation
-                    f"Retrieved API version information from the server: {core}."
-                )
-
-                match = re.search(r"(\d+)\.(\d+)(?:\.(\d+))?(?:\.\d+)?", core)
-                if match is None:
-                    raise RuntimeError(
-                        f"Unable to parse HugeGraph server version from response: {core!r}. "
-                        "Please verify the server is compatible with this client."
-                    )
-                major = int(match.group(1))
-                minor = int(match.group(2))
-                patch = int(match.group(3)) if match.group(3) else 0
-                self.version.extend([major, minor, patch])
-
-                # Version guard: Reject servers older than 1.5.0
-                if (major, minor, patch) < (1, 5, 0):
-                    raise RuntimeError(
-                        f"HugeGraph server version {major}.{minor}.{patch} is not supported. "
-                        "Please upgrade to HugeGraph >= 1.5.0 or use an older version of this client (v1.3.x)."
-                    )
-
-                # Enable graphspace support for versions > 1.5.0
-                # HugeGraph 1.7.0+ moved auth APIs to graphspaces/{graphspace}/auth/...
-                if (major, minor, patch) > (1, 5, 0):
-                    self.graphspace = "DEFAULT"
-                    self.gs_supported = True
-                    log.warning("graph space is not set, default value 'DEFAULT' will be used.")
-
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                # Version mismatch errors must not be silently swallowed
-                if isinstance(e, RuntimeError):
-                    raise
-
-                # Handle network/parsing failures gracefully
-                try:
-                    traceback.print_exception(e)
-                    self.gs_supported = False
-                except Exception:  # pylint: disable=broad-exception-caught
-                    exc_type, exc_value, tb = sys.exc_info()
-                    traceback.print_exception(exc_type, exc_value, tb)
-                    log.warning("Failed to retrieve API version information from the server, reverting to default v1.")
+                traceback.print_exception(e)
+                self.gs_supported = False
+            except Exception:  # pylint: disable=broad-exception-caught
+                exc_type, exc_value, tb = sys.exc_info()
+                traceback.print_exception(exc_type, exc_value, tb)
+                log.warning("Failed to retrieve API version information from the server, reverting to default v1.")
+
+    def _apply_version(self):
+        major, minor, patch = self.version[:3]
+        # Version guard: Reject servers older than 1.5.0
+        if (major, minor, patch) < (1, 5, 0):
+            raise RuntimeError(
+                f"HugeGraph server version {major}.{minor}.{patch} is not supported. "
+                "Please upgrade to HugeGraph >= 1.5.0 or use an older version of this client (v1.3.x)."
+            )
+
+        # Enable graphspace support for versions > 1.5.0
+        # HugeGraph 1.7.0+ moved auth APIs to graphspaces/{graphspace}/auth/...
+        if (major, minor, patch) > (1, 5, 0):
+            self.graphspace = "DEFAULT"
+            self.gs_supported = True
+            log.warning("graph space is not set, default value 'DEFAULT' will be used.")
@@ -17,7 +17,8 @@
 
 
 import logging
-from typing import Any
+import threading
+from typing import Any, ClassVar
 from urllib.parse import urljoin
 
 import requests
@@ -30,52 +31,47 @@ from pyhugegraph.utils.log import log
 from pyhugegraph.utils.util import ResponseValidation, redact_sensitive_data
 
 
-class HGraphSession:
-    def __init__(
-        self,
-        cfg: HGraphConfig,
-        retries: int = 3,
-        backoff_factor: int = 0.1,
-        status_forcelist=(500, 502, 504),
-        session: requests.Session | None = None,
-    ):
+class SessionRegistry:
+    """
+    Process-level registry of pooled requests.Session objects.
+
+    Sessions are shared by every HGraphSession that targets the same server with the same user and
+    connection settings, so newly built clients reuse the already opened keep-alive connections.
+    """
+
+    _sessions: ClassVar[dict[tuple, requests.Session]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, key: tuple, factory) -> requests.Session:
+        with cls._lock:
+            if key not in cls._sessions:
+                cls._sessions[key] = factory()
+            return cls._sessions[key]
+
+    @classmethod
+    def close_all(cls):
         """
-        Initialize the HGraphSession object.
-        :param retries: The maximum number of retries.
-        :param backoff_factor: The backoff factor, used to calculate the interval between retries.
-        :param status_forcelist: A list of status codes that trigger a retry.
-        :param session: An optional requests.Session instance, for testing or advanced use cases.
+        Close and forget all shared sessions (e.g. before forking worker processes).
         """
+        with cls._lock:
+            for session in cls._sessions.values():
+                session.close()
+            cls._sessions.clear()
+
+
+class BaseHGraphSession:
+    """
+    Connection settings and url resolution shared by the sync and async sessions.
+    """
+
+    def __init__(self, cfg: HGraphConfig, keep_alive: bool = True):
         self._cfg = cfg
-        self._retries = retries
-        self._backoff_factor = backoff_factor
-        self._status_forcelist = status_forcelist
         self._auth = (cfg.username, cfg.password)
         self._headers = {"Content-Type": Constants.HEADER_CONTENT_TYPE}
+        if not keep_alive:
+            self._headers["Connection"] = "close"
         self._timeout = cfg.timeout
-        self._session = session if session else requests.Session()
-        self.__configure_session()
-
-    def __configure_session(self):
-        """
-        Configure the retry strategy and connection adapter for the session.
-        """
-        retry_strategy = Retry(
-            total=self._retries,
-            read=self._retries,
-            connect=self._retries,
-            backoff_factor=self._backoff_factor,
-            status_forcelist=self._status_forcelist,
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self._session.mount("http://", adapter)
-        self._session.mount("https://", adapter)
-        self._session.keep_alive = False
-        log.debug(
-            "Session configured with retries=%s and backoff_factor=%s",
-            self._retries,
-            self._backoff_factor,
-        )
 
     @property
     def cfg(self):
@@ -120,9 +116,85 @@ class HGraphSession:
             url = urljoin(url, f"graphs/{self._cfg.graph_name}/")
         return urljoin(url, path).strip("/")
 
+
+class HGraphSession(BaseHGraphSession):
+    def __init__(
+        self,
+        cfg: HGraphConfig,
+        retries: int = 3,
+        backoff_factor: int = 0.1,
+        status_forcelist=(500, 502, 504),
+        session: requests.Session | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+    ):
+        """
+        Initialize the HGraphSession object.
+        :param retries: The maximum number of retries.
+        :param backoff_factor: The backoff factor, used to calculate the interval between retries.
+        :param status_forcelist: A list of status codes that trigger a retry.
+        :param session: An optional requests.Session instance, for testing or advanced use cases.
+            When omitted, a pooled session shared process-wide (see SessionRegistry) is used.
+        :param pool_connections: The number of connection pools (one per host) to cache.
+        :param pool_maxsize: The maximum number of connections to keep in each pool.
+        :param keep_alive: Whether to reuse connections, send "Connection: close" otherwise.
+        """
+        super().__init__(cfg, keep_alive)
+        self._retries = retries
+        self._backoff_factor = backoff_factor
+        self._status_forcelist = status_forcelist
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        if session:
+            self._session = session
+            self.__configure_session(self._session)
+        else:
+            key = (
+                cfg.url,
+                cfg.username,
+                retries,
+                backoff_factor,
+                tuple(status_forcelist),
+                pool_connections,
+                pool_maxsize,
+            )
+            self._session = SessionRegistry.get(key, self.__new_session)
+
+    def __new_session(self) -> requests.Session:
+        session = requests.Session()
+        self.__configure_session(session)
+        return session
+
+    def __configure_session(self, session: requests.Session):
+        """
+        Configure the retry strategy and the pooled connection adapter for the session.
+        """
+        retry_strategy = Retry(
+            total=self._retries,
+            read=self._retries,
+            connect=self._retries,
+            backoff_factor=self._backoff_factor,
+            status_forcelist=self._status_forcelist,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            max_retries=retry_strategy,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        log.debug(
+            "Session configured with retries=%s, backoff_factor=%s, pool_maxsize=%s",
+            self._retries,
+            self._backoff_factor,
+            self._pool_maxsize,
+        )
+
     def close(self):
         """
-        closes the session.
+        closes the session. A shared pooled session only drops its idle connections and stays usable
+        by other clients, use SessionRegistry.close_all() to release every pool.
 
         Args:
             None
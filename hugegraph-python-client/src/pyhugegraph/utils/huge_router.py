@@ -105,18 +105,14 @@ def http(method: str, path: str) -> Callable:
         """Decorator function that modifies the original function."""
         RouterRegistry().register(func.__qualname__, Route(method, path))
 
-        @functools.wraps(func)
-        def wrapper(self: "HGraphContext", *args: Any, **kwargs: Any) -> Any:
+        def bind_request(self: "HGraphContext", *args: Any, **kwargs: Any) -> None:
             """
-            Wrapper function to format the pathinfo and create a partial request function.
+            Format the pathinfo and store a partial request function on the instance.
 
             Args:
                 self (HGraphContext): The instance of the class.
                 *args (Any): Positional arguments to the decorated function.
                 **kwargs (Any): Keyword arguments to the decorated function.
-
-            Returns:
-                Any: The result of the decorated function.
             """
             # If the pathinfo contains placeholders, format it with the actual arguments
             if re.search(r"{\w+}", path):
@@ -158,6 +154,19 @@ def http(method: str, path: str) -> Callable:
             # Store the partial function on the instance
             setattr(self, f"_{func.__name__}_request", make_request)
 
+        if inspect.iscoroutinefunction(func):
+            # The request function is bound right before the coroutine body runs, which reads it
+            # before its first await, so concurrent calls of one manager never see each other's path.
+            @functools.wraps(func)
+            async def async_wrapper(self: "HGraphContext", *args: Any, **kwargs: Any) -> Any:
+                bind_request(self, *args, **kwargs)
+                return await func(self, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self: "HGraphContext", *args: Any, **kwargs: Any) -> Any:
+            bind_request(self, *args, **kwargs)
             return func(self, *args, **kwargs)
 
         return wrapper
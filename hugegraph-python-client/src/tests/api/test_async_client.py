@@ -0,0 +1,152 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from pyhugegraph.async_client import AsyncPyHugeClient
+from pyhugegraph.structure.vertex_label_data import VertexLabelData
+from pyhugegraph.utils.exceptions import NotFoundError
+from pyhugegraph.utils.huge_async_requests import AsyncHGraphSession
+from pyhugegraph.utils.util import ResponseValidation
+
+pytestmark = pytest.mark.unit
+
+BASE = "http://127.0.0.1:8080/graphspaces/DEFAULT/graphs/hugegraph"
+
+
+def _client(handler) -> AsyncPyHugeClient:
+    client = AsyncPyHugeClient("127.0.0.1:8080", "hugegraph", "admin", "admin", graphspace="DEFAULT")
+    client.session = AsyncHGraphSession(
+        client.cfg,
+        backoff_factor=0,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return client
+
+
+def test_gremlin_exec_uses_graphspace_aliases():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"requestId": "1", "status": {"code": 200}, "result": {"data": [1, 2]}})
+
+    async def run():
+        async with _client(handler) as client:
+            return await client.gremlin().exec("g.V().limit(2)")
+
+    assert asyncio.run(run()) == {"data": [1, 2]}
+    assert str(requests[0].url) == "http://127.0.0.1:8080/gremlin"
+    assert json.loads(requests[0].content)["aliases"]["g"] == "__g_DEFAULT-hugegraph"
+
+
+def test_concurrent_calls_keep_their_own_path():
+    def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(
+            200,
+            json={
+                "id": 1,
+                "name": name,
+                "id_strategy": "PRIMARY_KEY",
+                "primary_keys": ["name"],
+                "nullable_keys": [],
+                "index_labels": [],
+                "properties": ["name"],
+                "enable_label_index": True,
+                "user_data": {},
+            },
+        )
+
+    async def run():
+        async with _client(handler) as client:
+            schema = client.schema()
+            return await asyncio.gather(*(schema.getVertexLabel(name) for name in ("person", "movie", "book")))
+
+    labels = asyncio.run(run())
+    assert all(isinstance(label, VertexLabelData) for label in labels)
+    assert [label.name for label in labels] == ["person", "movie", "book"]
+
+
+def test_schema_manager_is_read_only():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"propertykeys": []})
+
+    async def run():
+        async with _client(handler) as client:
+            schema = client.schema()
+            for builder in ("propertyKey", "vertexLabel", "edgeLabel", "indexLabel"):
+                assert not hasattr(schema, builder)
+            return await schema.getSchema()
+
+    assert asyncio.run(run()) == {"propertykeys": []}
+
+
+def test_graph_batch_and_traverser():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, str(request.url)))
+        if request.url.path.endswith("graph/vertices/batch"):
+            return httpx.Response(201, json=["1:a", "1:b"])
+        return httpx.Response(200, json={"vertices": ["1:a"]})
+
+    async def run():
+        async with _client(handler) as client:
+            added = await client.graph().addVertices([("person", {"name": "a"}), ("person", {"name": "b"})])
+            kout = await client.traverser().k_out("1:a", 2)
+            return added, kout
+
+    added, kout = asyncio.run(run())
+    assert [vertex.id for vertex in added] == ["1:a", "1:b"]
+    assert kout == {"vertices": ["1:a"]}
+    assert seen[0] == ("POST", f"{BASE}/graph/vertices/batch")
+    assert seen[1][1].startswith(f"{BASE}/traversers/kout?")
+
+
+def test_error_status_is_retried_then_validated():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(502)
+        return httpx.Response(404, json={"message": "missing"})
+
+    async def run():
+        async with _client(handler) as client:
+            await client.graph().getVertexById("1:missing")
+
+    with pytest.raises(NotFoundError):
+        asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_raw_responses_match_the_sync_client():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text="ok")
+
+    async def run():
+        async with _client(handler) as client:
+            return await client.session.request("versions", validator=ResponseValidation("raw"))
+
+    response = asyncio.run(run())
+    assert response.status_code == 200
+    assert response.text == "ok"
@@ -0,0 +1,90 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from unittest import mock
+
+import pytest
+from pyhugegraph.client import PyHugeClient
+from pyhugegraph.utils.huge_config import HGraphConfig, ServerVersionRegistry
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    ServerVersionRegistry.clear()
+    yield
+    ServerVersionRegistry.clear()
+
+
+def _versions_response(core: str):
+    response = mock.Mock()
+    response.json.return_value = {"versions": {"core": core}}
+    return response
+
+
+def _config(url: str = "127.0.0.1:8080", **kwargs) -> HGraphConfig:
+    return HGraphConfig(url, "admin", "admin", "hugegraph", **kwargs)
+
+
+def test_version_is_probed_once_per_url():
+    with mock.patch("pyhugegraph.utils.huge_config.requests.get", return_value=_versions_response("1.7.0.0")) as get:
+        first = _config()
+        second = _config()
+        _config("127.0.0.1:8081")
+
+    assert get.call_count == 2
+    assert first.version == second.version == [1, 7, 0]
+    assert second.gs_supported is True
+    assert second.graphspace == "DEFAULT"
+
+
+def test_failed_probe_is_not_cached():
+    with mock.patch("pyhugegraph.utils.huge_config.requests.get", side_effect=ConnectionError("down")) as get:
+        cfg = _config()
+        _config()
+
+    assert get.call_count == 2
+    assert cfg.gs_supported is False
+    assert ServerVersionRegistry.get("http://127.0.0.1:8080") is None
+
+
+def test_unsupported_cached_version_still_raises():
+    ServerVersionRegistry.set("http://127.0.0.1:8080", "1.3.0")
+
+    with mock.patch("pyhugegraph.utils.huge_config.requests.get") as get, pytest.raises(RuntimeError):
+        _config()
+    get.assert_not_called()
+
+
+def test_explicit_server_version_skips_the_probe():
+    with mock.patch("pyhugegraph.utils.huge_config.requests.get") as get:
+        client = PyHugeClient("127.0.0.1:8080", "hugegraph", "admin", "admin", server_version="1.5.0")
+
+    get.assert_not_called()
+    assert client.cfg.version == [1, 5, 0]
+    assert client.cfg.gs_supported is False
+
+
+def test_explicit_server_version_is_not_shared():
+    with mock.patch("pyhugegraph.utils.huge_config.requests.get", return_value=_versions_response("1.7.0.0")) as get:
+        _config(version=[1, 5, 0])
+        detected = _config()
+
+    get.assert_called_once()
+    assert detected.version == [1, 7, 0]
+    assert ServerVersionRegistry.get("http://127.0.0.1:8080") == [1, 7, 0]
@@ -0,0 +1,76 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import pytest
+import requests
+from pyhugegraph.client import PyHugeClient
+from pyhugegraph.utils.huge_requests import HGraphSession, SessionRegistry
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    SessionRegistry.close_all()
+    yield
+    SessionRegistry.close_all()
+
+
+def _client(**kwargs):
+    # an explicit graphspace skips the server version probe
+    return PyHugeClient("127.0.0.1:8080", "hugegraph", "admin", "admin", graphspace="DEFAULT", **kwargs)
+
+
+def test_managers_of_one_client_share_a_session():
+    client = _client()
+
+    assert client.schema().session is client.session
+    assert client.gremlin().session is client.session
+    assert client.graph().session is client.session
+    assert client.traverser().session is client.session
+
+
+def test_clients_of_the_same_server_share_the_connection_pool():
+    first = _client()
+    second = _client()
+    other_user = PyHugeClient("127.0.0.1:8080", "hugegraph", "other", "pwd", graphspace="DEFAULT")
+
+    assert first.session._session is second.session._session
+    assert first.session._session is not other_user.session._session
+
+
+def test_pool_settings_are_applied_to_the_adapter():
+    client = _client(pool_connections=2, pool_maxsize=32)
+
+    adapter = client.session._session.get_adapter("http://127.0.0.1:8080")
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 32
+    assert "Connection" not in client.session._headers
+
+
+def test_keep_alive_can_be_disabled():
+    client = _client(keep_alive=False)
+
+    assert client.session._headers["Connection"] == "close"
+
+
+def test_explicit_session_is_not_shared():
+    raw_session = requests.Session()
+    session = HGraphSession(_client().cfg, session=raw_session)
+
+    assert session._session is raw_session
+    assert raw_session not in SessionRegistry._sessions.values()
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import json
 from decimal import Decimal
 from fractions import Fraction
 from types import SimpleNamespace
@@ -154,3 +155,18 @@ def test_traverser_formats_vertex_id_query_params():
     assert session.calls[0][0] == "traversers/sameneighbors?vertex=%22person%3Amarko%22&other=456"
     assert session.calls[1][0] == "traversers/shortestpath?source=123&target=%22person%3Ajosh%22&max_depth=3"
     assert session.calls[2][0] == "traversers/kout?source=123&max_depth=2"
+
+
+def test_graph_add_vertices_passes_optional_custom_ids():
+    session = FakeSession(responses=[["marko", "2:lop"]])
+    graph = GraphManager(session)
+
+    vertices = graph.addVertices([("person", {"name": "marko"}, "marko"), ("software", {"name": "lop"})])
+
+    assert [vertex.id for vertex in vertices] == ["marko", "2:lop"]
+    path, method, kwargs = session.calls[0]
+    assert (path, method) == ("graph/vertices/batch", "POST")
+    assert json.loads(kwargs["data"]) == [
+        {"label": "person", "properties": {"name": "marko"}, "id": "marko"},
+        {"label": "software", "properties": {"name": "lop"}},
+    ]